@@ -159,7 +159,12 @@ MESSAGE_TAGS = {
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-    }
+    },
+    # Shared by the web and the worker processes, e.g. to debounce the tag suggestion refresh
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': 'redis://localhost:6379/1',
+    },
 }
 
 # Celery Configuration
@@ -171,6 +176,28 @@ CELERY_RESULT_SERIALIZER = 'pickle'
 CELERY_TIMEZONE = 'UTC'
 CELERY_BROKER_TRANSPORT_OPTIONS = {'visibility_timeout': 3600}
 
+# Task log: verbosity 0 (summaries), 1 (progress, default) or 2 (a line for every item),
+# and the seconds and number of lines after which the buffered lines are saved
+TWF_TASK_LOG_VERBOSITY = 1
+TWF_TASK_LOG_FLUSH_INTERVAL = 5
+TWF_TASK_LOG_FLUSH_LINES = 500
+
+# Task progress: milliseconds and percentage points after which an update is written
+TWF_TASK_PROGRESS_INTERVAL_MS = 1000
+TWF_TASK_PROGRESS_STEP = 5
+
+# Run all tasks under cProfile and attach the statistics to the task (single tasks can
+# be profiled with the profile keyword argument)
+TWF_TASK_PROFILE = False
+
+# Query inspection (development and staging): log requests with more queries than the
+# budget, or with a query shape repeated at least the threshold times (N+1 queries)
+TWF_QUERY_INSPECTION = DEBUG
+TWF_QUERY_BUDGET = 100
+TWF_QUERY_REPEAT_THRESHOLD = 10
+if TWF_QUERY_INSPECTION:
+    MIDDLEWARE.append("twf.middleware.QueryInspectionMiddleware")
+
 # Read version from the VERSION file
 VERSION_FILE = Path(BASE_DIR) / 'twf' / 'VERSION'
 if VERSION_FILE.exists():
@@ -77,7 +77,7 @@ class TagFilter(django_filters.FilterSet):
 
         # Dynamically populate the choices for variation_type
         distinct_variation_types = (
-            PageTag.objects.filter(page__document__project=project)
+            PageTag.objects.filter(project=project)
             .exclude(variation_type__in=excluded)
             .distinct()
             .values("variation_type")
@@ -175,7 +175,7 @@ class IgnoredTagFilter(django_filters.FilterSet):
         # Dynamically populate the choices for variation_type (only ignored types)
         if excluded:
             distinct_variation_types = (
-                PageTag.objects.filter(page__document__project=project)
+                PageTag.objects.filter(project=project)
                 .filter(variation_type__in=excluded)
                 .distinct()
                 .values("variation_type")
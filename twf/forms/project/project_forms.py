@@ -638,7 +638,8 @@ class TaskSettingsForm(forms.ModelForm):
 
     This form manages how dates are detected, parsed, and normalized throughout
     the project. It controls the input date format detection and the precision
-    to which dates should be resolved.
+    to which dates should be resolved. It also holds the performance settings of the
+    Transkribus synchronization (stored under the "sync" key of conf_tasks).
     """
 
     active_tab = forms.CharField(widget=forms.HiddenInput(), required=False)
@@ -666,6 +667,52 @@ class TaskSettingsForm(forms.ModelForm):
         widget=Select2Widget(attrs={"style": "width: 100%;"}),
     )
 
+    # Transkribus synchronization settings
+    parse_workers = forms.IntegerField(
+        required=False,
+        min_value=1,
+        max_value=64,
+        initial=1,
+        label="Parse Workers",
+        help_text="Number of worker processes used to parse PAGE XML files during a sync, "
+                  "started by the Celery worker running the sync. "
+                  "1 parses the pages one by one (default: 1)",
+    )
+    parse_batch_size = forms.IntegerField(
+        required=False,
+        min_value=10,
+        max_value=5000,
+        initial=200,
+        label="Parse Batch Size",
+        help_text="Number of parsed pages written to the database at once "
+                  "when parsing with more than one worker (default: 200)",
+    )
+    stream_from_zip = forms.BooleanField(
+        required=False,
+        initial=False,
+        label="Stream From Export Archive",
+        help_text="Read the PAGE XML files directly from the downloaded export instead of "
+                  "extracting them first. Each page file is only written once.",
+    )
+    sync_batch_size = forms.IntegerField(
+        required=False,
+        min_value=10,
+        max_value=5000,
+        initial=500,
+        label="Sync Batch Size",
+        help_text="Number of page files whose documents and pages are written "
+                  "to the database at once during a sync (default: 500)",
+    )
+    shard_size = forms.IntegerField(
+        required=False,
+        min_value=0,
+        max_value=10000,
+        initial=0,
+        label="Documents per Shard",
+        help_text="Split a sync into sub-tasks of this many documents, which run in parallel "
+                  "on all Celery workers. 0 runs the whole sync in one task (default: 0)",
+    )
+
     class Meta:
         model = Project
         fields = ["conf_tasks"]
@@ -684,6 +731,12 @@ class TaskSettingsForm(forms.ModelForm):
         self.fields["resolve_to_date"].initial = conf_tasks.get(
             "date_normalization", {}
         ).get("resolve_to_date", "")
+        sync_config = self.instance.get_sync_configuration()
+        self.fields["parse_workers"].initial = sync_config["parse_workers"]
+        self.fields["parse_batch_size"].initial = sync_config["parse_batch_size"]
+        self.fields["stream_from_zip"].initial = sync_config["stream_from_zip"]
+        self.fields["sync_batch_size"].initial = sync_config["sync_batch_size"]
+        self.fields["shard_size"].initial = sync_config["shard_size"]
 
         self.helper.layout = Layout(
             TabHolder(
@@ -695,6 +748,21 @@ class TaskSettingsForm(forms.ModelForm):
                     ),
                     css_id="date_normalization",
                 ),
+                Tab(
+                    "Synchronization Settings",
+                    Row(
+                        Column("parse_workers", css_class="col-6"),
+                        Column("parse_batch_size", css_class="col-6"),
+                    ),
+                    Row(
+                        Column("sync_batch_size", css_class="col-6"),
+                        Column("shard_size", css_class="col-6"),
+                    ),
+                    Row(
+                        Column("stream_from_zip", css_class="col-12"),
+                    ),
+                    css_id="sync",
+                ),
             ),
             Div(
                 Submit("submit", "Save Settings", css_class="btn btn-dark"),
@@ -722,6 +790,11 @@ class TaskSettingsForm(forms.ModelForm):
             if self.instance.conf_tasks
             else {}
         )
+        existing_sync = (
+            self.instance.conf_tasks.get("sync", {})
+            if self.instance.conf_tasks
+            else {}
+        )
 
         self.instance.conf_tasks = {
             "google_sheet": existing_google_sheet,  # Preserve existing google_sheet config
@@ -731,6 +804,14 @@ class TaskSettingsForm(forms.ModelForm):
                 "resolve_to_date": cleaned_data.get("resolve_to_date"),
             },
             "tag_types": existing_tag_types,  # Preserve existing tag_types config
+            "sync": {
+                **existing_sync,
+                "parse_workers": cleaned_data.get("parse_workers") or 1,
+                "parse_batch_size": cleaned_data.get("parse_batch_size") or 200,
+                "stream_from_zip": bool(cleaned_data.get("stream_from_zip")),
+                "sync_batch_size": cleaned_data.get("sync_batch_size") or 500,
+                "shard_size": cleaned_data.get("shard_size") or 0,
+            },
         }
 
         return cleaned_data
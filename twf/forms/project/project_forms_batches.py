@@ -152,6 +152,14 @@ class DocumentExtractionBatchForm(BaseBatchForm):
         "in the Transkribus export will be deleted. Uncheck to keep all existing documents.",
     )
 
+    dry_run = forms.BooleanField(
+        label="Dry Run (Only Show Plan)",
+        required=False,
+        initial=False,
+        help_text="If checked, nothing is changed. The task log lists the documents, pages "
+        "and tags the sync would add, update and delete with the options above.",
+    )
+
     def __init__(self, *args, **kwargs):
         """
         Initialize the document extraction form.
@@ -202,6 +210,10 @@ class DocumentExtractionBatchForm(BaseBatchForm):
                 Column("delete_removed_documents", css_class="form-group col-12 mb-3"),
                 css_class="row form-row",
             ),
+            Row(
+                Column("dry_run", css_class="form-group col-12 mb-3"),
+                css_class="row form-row",
+            ),
         ]
 
     def save_credentials(self):
@@ -40,7 +40,7 @@ class ManageTagsForm(forms.Form):
         # Populate tag types from the project
         if project:
             tag_types = (
-                PageTag.objects.filter(page__document__project=project)
+                PageTag.objects.filter(project=project)
                 .values_list("variation_type", flat=True)
                 .distinct()
                 .order_by("variation_type")
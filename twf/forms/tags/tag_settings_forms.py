@@ -114,7 +114,7 @@ class TagSettingsForm(forms.Form):
 
         # Get all distinct tag types from the project
         tag_types_qs = (
-            PageTag.objects.filter(page__document__project=project)
+            PageTag.objects.filter(project=project)
             .values("variation_type")
             .distinct()
             .order_by("variation_type")
@@ -126,7 +126,7 @@ class TagSettingsForm(forms.Form):
         tag_counts = {}
         for tag_type in tag_types:
             count = PageTag.objects.filter(
-                page__document__project=project, variation_type=tag_type
+                project=project, variation_type=tag_type
             ).count()
             tag_counts[tag_type] = count
 
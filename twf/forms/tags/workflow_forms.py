@@ -158,7 +158,7 @@ class StartEnrichmentWorkflowForm(forms.Form):
         for tag_type, config in enrichment_types.items():
             from django.db.models import Q
             count = PageTag.objects.filter(
-                page__document__project=project,
+                project=project,
                 page__is_ignored=False,
                 variation_type=tag_type,
                 tag_enrichment_entry__isnull=True,
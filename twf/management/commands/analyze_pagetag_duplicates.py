@@ -31,7 +31,7 @@ class Command(BaseCommand):
         queryset = PageTag.objects.all()
 
         if project_id:
-            queryset = queryset.filter(page__document__project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
             self.stdout.write(f"Analyzing PageTags for project ID {project_id}...\n")
         else:
             self.stdout.write("Analyzing all PageTags...\n")
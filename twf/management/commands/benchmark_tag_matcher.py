@@ -0,0 +1,82 @@
+"""Management command to benchmark the SmartTagMatcher on a synthetic tag-dense page."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from twf.utils.tag_matcher_benchmark import build_synthetic_page, summarize_result
+from twf.utils.tags_utils import SmartTagMatcher
+
+
+class Command(BaseCommand):
+    """Compare the indexed SmartTagMatcher with scoring all pairs of tags."""
+
+    help = (
+        "Benchmark the bucketed SmartTagMatcher against scoring all tag pairs on a "
+        "synthetic tag-dense page"
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--lines",
+            type=int,
+            default=60,
+            help="Number of lines of the synthetic page (default: 60)",
+        )
+        parser.add_argument(
+            "--tags-per-line",
+            type=int,
+            default=8,
+            help="Number of tags per line (default: 8)",
+        )
+        parser.add_argument(
+            "--legacy-share",
+            type=float,
+            default=0.02,
+            help="Share of old tags without line ID, which are candidates on every "
+                 "line (default: 0.02)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Number of runs per matcher, the fastest counts (default: 3)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        page, old_tags, new_tags_data = build_synthetic_page(
+            options["lines"], options["tags_per_line"], options["legacy_share"]
+        )
+        self.stdout.write(
+            f"Synthetic page: {len(old_tags)} old tags, {len(new_tags_data)} new tags"
+        )
+
+        self.stdout.write("\n=== BENCHMARK ===")
+        timings = {}
+        summaries = {}
+        for label, indexed in (("all pairs", False), ("indexed", True)):
+            best = None
+            for _ in range(max(1, options["repeat"])):
+                matcher = SmartTagMatcher(indexed=indexed)
+                start = time.perf_counter()
+                result = matcher.match_tags(old_tags, new_tags_data, page)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[label] = best
+            summaries[label] = summarize_result(result, matcher)
+            self.stdout.write(
+                f"  {label:<10} {best * 1000:9.1f} ms  "
+                f"({len(result[0])} matches, {len(result[1])} deleted, "
+                f"{len(result[2])} created)"
+            )
+
+        if summaries["indexed"] != summaries["all pairs"]:
+            self.stdout.write(self.style.ERROR("✗ The results differ"))
+            return
+
+        speedup = timings["all pairs"] / timings["indexed"] if timings["indexed"] else 0
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Identical results, {speedup:.1f}x faster")
+        )
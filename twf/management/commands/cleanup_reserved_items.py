@@ -38,7 +38,7 @@ class Command(BaseCommand):
         reserved_tags = PageTag.objects.filter(is_reserved=True)
 
         if project_id:
-            reserved_tags = reserved_tags.filter(page__document__project_id=project_id)
+            reserved_tags = reserved_tags.filter(project_id=project_id)
 
         orphaned_tags = []
         for tag in reserved_tags:
@@ -17,13 +17,20 @@ class Command(BaseCommand):
         parser.add_argument(
             "user_id", type=int, help="The user id to create the collection for"
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report what the sync would change",
+        )
 
     def handle(self, *args, **options):
         """Handle the command"""
         print("Start structuring...")
         project_id = options["project_id"]
         user_id = options["user_id"]
-        task_result = extract_zip_export_task.delay(project_id, user_id)
+        task_result = extract_zip_export_task.delay(
+            project_id, user_id, dry_run=options["dry_run"]
+        )
 
         self.stdout.write(
             self.style.SUCCESS(f"Task triggered with ID: {task_result.id}")
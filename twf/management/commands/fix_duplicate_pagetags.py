@@ -41,7 +41,7 @@ class Command(BaseCommand):
         queryset = PageTag.objects.all()
 
         if project_id:
-            queryset = queryset.filter(page__document__project_id=project_id)
+            queryset = queryset.filter(project_id=project_id)
             self.stdout.write(f"Checking PageTags for project ID {project_id}...\n")
         else:
             self.stdout.write("Checking all PageTags across all projects...\n")
@@ -0,0 +1,96 @@
+"""Management command to garbage-collect the content-addressed page XML store."""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from twf.models import Page, PageXmlBlob
+from twf.utils.page_xml_store import (
+    STORE_ROOT,
+    get_digest_from_path,
+    get_store_path,
+)
+
+
+class Command(BaseCommand):
+    """Recount the references of the page XML store and delete unreferenced files."""
+
+    help = (
+        "Recount the page references of the page XML store and delete the files "
+        "no page references anymore"
+    )
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would be deleted without actually doing it",
+        )
+        parser.add_argument(
+            "--grace-hours",
+            type=int,
+            default=24,
+            help="Keep unreferenced files stored within this many hours, "
+                 "a running sync may be about to reference them (default: 24)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        dry_run = options["dry_run"]
+        cutoff = timezone.now() - timedelta(hours=options["grace_hours"])
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING("DRY RUN MODE - No changes will be made")
+            )
+
+        # Recount the references: pages deleted by a cascade do not release their file
+        self.stdout.write("\n=== RECOUNTING REFERENCES ===")
+        ref_counts = Counter(
+            get_digest_from_path(name)
+            for name in Page.objects.filter(
+                xml_file__startswith=f"{STORE_ROOT}/"
+            ).values_list("xml_file", flat=True)
+        )
+        corrected = 0
+        for blob in PageXmlBlob.objects.all().iterator():
+            ref_count = ref_counts.get(blob.digest, 0)
+            if blob.ref_count != ref_count:
+                corrected += 1
+                if not dry_run:
+                    PageXmlBlob.objects.filter(pk=blob.pk).update(ref_count=ref_count)
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Corrected the reference count of {corrected} files")
+        )
+
+        # Delete unreferenced files
+        self.stdout.write("\n=== DELETING UNREFERENCED FILES ===")
+        unreferenced = [
+            blob
+            for blob in PageXmlBlob.objects.filter(last_stored_at__lt=cutoff)
+            if ref_counts.get(blob.digest, 0) == 0
+        ]
+        freed = sum(blob.size for blob in unreferenced)
+        for blob in unreferenced[:10]:  # Show first 10
+            self.stdout.write(f"  - {get_store_path(blob.digest)} ({blob.size} bytes)")
+        if len(unreferenced) > 10:
+            self.stdout.write(f"  ... and {len(unreferenced) - 10} more")
+
+        if not dry_run:
+            for blob in unreferenced:
+                # Only delete the file if no sync referenced or stored it in the meantime
+                deleted, _ = PageXmlBlob.objects.filter(
+                    pk=blob.pk, ref_count__lte=0, last_stored_at__lt=cutoff
+                ).delete()
+                if deleted:
+                    default_storage.delete(get_store_path(blob.digest))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ {'Would delete' if dry_run else 'Deleted'} {len(unreferenced)} "
+                f"unreferenced files ({freed} bytes)"
+            )
+        )
@@ -60,7 +60,7 @@ class Command(BaseCommand):
         if project_id:
             try:
                 project = Project.objects.get(id=project_id)
-                tags_query = tags_query.filter(page__document__project=project)
+                tags_query = tags_query.filter(project=project)
                 self.stdout.write(f"Processing project: {project.title}")
             except Project.DoesNotExist:
                 self.stdout.write(
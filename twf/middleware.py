@@ -0,0 +1,46 @@
+"""Middleware for the twf app."""
+
+import logging
+
+from django.conf import settings
+from django.db import connection
+
+from twf.utils.query_inspection import QueryRecorder
+
+logger = logging.getLogger(__name__)
+
+# Queries per request, and executions of the same query shape, above which a request is logged
+DEFAULT_QUERY_BUDGET = 100
+DEFAULT_QUERY_REPEAT_THRESHOLD = 10
+
+
+class QueryInspectionMiddleware:
+    """
+    Logs requests with too many queries or with repeated queries (likely N+1 queries).
+
+    Meant for development and staging: it is added to the middleware when the
+    TWF_QUERY_INSPECTION setting is set. The thresholds are the TWF_QUERY_BUDGET and
+    TWF_QUERY_REPEAT_THRESHOLD settings. The warning lists the repeated queries with the
+    stack of the code running them. The number of queries is also sent in the
+    X-Query-Count response header.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.budget = getattr(settings, "TWF_QUERY_BUDGET", DEFAULT_QUERY_BUDGET)
+        self.repeat_threshold = getattr(
+            settings, "TWF_QUERY_REPEAT_THRESHOLD", DEFAULT_QUERY_REPEAT_THRESHOLD
+        )
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+
+        response["X-Query-Count"] = str(recorder.count)
+        if recorder.count > self.budget or recorder.get_repeated(self.repeat_threshold):
+            logger.warning(
+                f"{request.method} {request.path}: "
+                f"{recorder.format_report(self.repeat_threshold)}"
+            )
+        return response
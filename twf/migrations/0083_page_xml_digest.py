@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-03-02 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0082_add_review_status_to_dictionary_entry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="xml_digest",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-03-02 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0083_page_xml_digest"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="page",
+            name="last_parsed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
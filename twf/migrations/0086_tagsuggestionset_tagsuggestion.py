@@ -0,0 +1,95 @@
+# Generated by Django 6.0.1 on 2026-03-09 10:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0085_pagexmlblob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagSuggestionSet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("variation", models.CharField(max_length=255)),
+                ("variation_type", models.CharField(max_length=100)),
+                (
+                    "computed_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_suggestion_sets",
+                        to="twf.project",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("project", "variation", "variation_type"),
+                        name="unique_tag_suggestion_set",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TagSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.IntegerField(default=0)),
+                ("strong_match_count", models.IntegerField(default=0)),
+                ("rank", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "entry",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_suggestions",
+                        to="twf.dictionaryentry",
+                    ),
+                ),
+                (
+                    "suggestion_set",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suggestions",
+                        to="twf.tagsuggestionset",
+                    ),
+                ),
+                (
+                    "variation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tag_suggestions",
+                        to="twf.variation",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["rank"],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.1 on 2026-03-12 09:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_pagetag_project(apps, schema_editor):
+    """
+    Copy the project of each tag's document to the new PageTag.project field.
+    """
+    Page = apps.get_model("twf", "Page")
+    PageTag = apps.get_model("twf", "PageTag")
+
+    PageTag.objects.filter(project__isnull=True).update(
+        project_id=Subquery(
+            Page.objects.filter(id=OuterRef("page_id")).values("document__project_id")[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0086_tagsuggestionset_tagsuggestion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="pagetag",
+            name="project",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="page_tags",
+                to="twf.project",
+            ),
+        ),
+        migrations.RunPython(set_pagetag_project, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="pagetag",
+            index=models.Index(
+                fields=["project", "variation_type", "dictionary_entry"],
+                name="twf_pagetag_project_56b924_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetag",
+            index=models.Index(
+                fields=["project", "variation"], name="twf_pagetag_project_cc644c_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pagetag",
+            index=models.Index(
+                fields=["project", "is_reserved", "is_parked"],
+                name="twf_pagetag_project_ca33e3_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.1 on 2026-03-16 14:27
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0087_pagetag_project"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskLogLine",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("seq", models.PositiveIntegerField()),
+                ("text", models.TextField()),
+                (
+                    "created_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="log_lines",
+                        to="twf.task",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["seq"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("task", "seq"), name="unique_task_log_line"
+                    )
+                ],
+            },
+        ),
+    ]
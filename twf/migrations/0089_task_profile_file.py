@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-03-17 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("twf", "0088_tasklogline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="profile_file",
+            field=models.FileField(blank=True, null=True, upload_to="task_profiles/"),
+        ),
+    ]
@@ -19,6 +19,7 @@ from django.db.models import Q
 from django.utils import timezone
 from django.utils.timezone import now
 from twf.permissions import get_role_permissions
+from twf.utils.tag_type_config import get_tag_type_config, invalidate_tag_type_config
 
 from twf.templatetags.tk_tags import tk_iiif_url, tk_bounding_box
 
@@ -673,6 +674,22 @@ class Project(TimeStampedModel):
         help_text="The DOI of the project.",
     )
 
+    def save(self, *args, **kwargs):
+        """Save the project and drop its cached tag type configuration.
+
+        The cached configuration is keyed by modified_at, which is therefore also
+        written when only conf_tasks is saved.
+        """
+        update_fields = kwargs.get("update_fields")
+        if (
+            update_fields is not None
+            and "conf_tasks" in update_fields
+            and "modified_at" not in update_fields
+        ):
+            kwargs["update_fields"] = [*update_fields, "modified_at"]
+        super().save(*args, **kwargs)
+        invalidate_tag_type_config(self)
+
     def get_project_members(self):
         """Return the project members plus the project's owner."""
         return UserProfile.objects.filter(
@@ -700,6 +717,7 @@ class Project(TimeStampedModel):
         - metadata_review: The metadata review configuration.
         - date_normalization: The date normalization configuration.
         - tag_types: The tag types configuration.
+        - sync: The Transkribus synchronization configuration.
         """
         if return_json:
             value = self.conf_tasks.get(service, None)
@@ -726,17 +744,9 @@ class Project(TimeStampedModel):
         dict
             Enrichment configuration with workflow_title, form_type, wikidata_entity_type
         """
-        conf_tasks = self.conf_tasks or {}
-        tag_types_config = conf_tasks.get("tag_types", {})
-        enrichment_types = {}
-
-        if "enrichment_types_config" in tag_types_config:
-            try:
-                enrichment_types = json.loads(tag_types_config["enrichment_types_config"])
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-        return enrichment_types.get(tag_type, {})
+        return dict(
+            get_tag_type_config(self).configured_enrichment_types.get(tag_type, {})
+        )
 
     def get_dictionary_enrichment_config(self, dictionary_type):
         """Get enrichment configuration for a dictionary type.
@@ -820,6 +830,25 @@ class Project(TimeStampedModel):
             result["fields"] = {**default["fields"], **configured.get("fields", {})}
         return result
 
+    def get_sync_configuration(self):
+        """Return the Transkribus synchronization settings with defaults applied.
+
+        Returns
+        -------
+        dict
+            Sync settings with fields: parse_workers, parse_batch_size, stream_from_zip,
+            sync_batch_size, shard_size
+        """
+        defaults = {
+            "parse_workers": 1,
+            "parse_batch_size": 200,
+            "stream_from_zip": False,
+            "sync_batch_size": 500,
+            "shard_size": 0,
+        }
+        configured = self.get_task_configuration("sync")
+        return {**defaults, **configured}
+
     def get_transkribus_url(self):
         """Return the URL to the Transkribus collection."""
         return f"https://app.transkribus.org/collection/{self.collection_id}"
@@ -864,7 +893,8 @@ class Task(models.Model):
     description : TextField
         The description of the task.
     text : TextField
-        Detailed log text for the task.
+        Detailed log text for the task. The lines logged by Celery tasks are stored
+        as TaskLogLine objects, see get_log_text.
     meta : JSONField
         Additional metadata for the task.
     task_type : CharField
@@ -881,6 +911,8 @@ class Task(models.Model):
         Number of items that failed to process.
     workflow_steps : JSONField
         For workflow tasks, tracks the progression through workflow steps.
+    profile_file : FileField
+        The cProfile statistics of a task run with profiling enabled.
     """
 
     TASK_STATUS_CHOICES = [
@@ -971,10 +1003,70 @@ class Task(models.Model):
     workflow_steps = models.JSONField(default=dict, blank=True)
     """For workflow tasks, tracks the progression through workflow steps."""
 
+    profile_file = models.FileField(upload_to="task_profiles/", blank=True, null=True)
+    """The cProfile statistics of a task run with profiling enabled."""
+
+    def get_log_lines(self, after_seq=0):
+        """Return the (seq, text) tuples of the log lines after a sequence number."""
+        return list(
+            self.log_lines.filter(seq__gt=after_seq)
+            .order_by("seq")
+            .values_list("seq", "text")
+        )
+
+    def get_log_text(self):
+        """Return the full log: the text of the task followed by its log lines."""
+        return self.text + "".join(text for _, text in self.get_log_lines())
+
     def __str__(self):
         return f"Task - {self.celery_task_id} ({self.status})"
 
 
+class TaskLogLine(models.Model):
+    """
+    TaskLogLine Model
+    -----------------
+
+    A line of the log of a task. Lines are only ever appended, numbered per task, so
+    that a client polling a running task only fetches the lines it has not seen yet.
+
+    Attributes
+    ~~~~~~~~~~
+    task : ForeignKey
+        The task the line belongs to.
+    seq : PositiveIntegerField
+        The number of the line in the task's log, starting at 1.
+    text : TextField
+        The logged text, including its line breaks.
+    created_at : DateTimeField
+        The time the line was written.
+    """
+
+    task = models.ForeignKey(Task, related_name="log_lines", on_delete=models.CASCADE)
+    """The task the line belongs to."""
+
+    seq = models.PositiveIntegerField()
+    """The number of the line in the task's log."""
+
+    text = models.TextField()
+    """The logged text."""
+
+    created_at = models.DateTimeField(default=timezone.now)
+    """The time the line was written."""
+
+    class Meta:
+        """Meta options for the TaskLogLine model."""
+
+        ordering = ["seq"]
+        constraints = [
+            models.UniqueConstraint(fields=["task", "seq"], name="unique_task_log_line"),
+        ]
+
+    def __str__(self):
+        """Return the string representation of the TaskLogLine."""
+        return f"{self.task_id}:{self.seq}"
+
+
 class Document(TimeStampedModel):
     """
     Document Model
@@ -1136,6 +1228,7 @@ class DocumentSyncHistory(TimeStampedModel):
             "pages": {
                 "added": [page_ids],
                 "updated": [page_ids],
+                "unchanged": [page_ids],
                 "deleted": [page_ids]
             },
             "tags": {
@@ -1215,6 +1308,9 @@ class DocumentSyncHistory(TimeStampedModel):
             str: Summary like "+5 tags, -2 tags, ~3 tags" or "No changes"
         """
         if self.sync_type == "unchanged":
+            unchanged_pages = self.changes.get("pages", {}).get("unchanged", [])
+            if unchanged_pages:
+                return f"No changes ({len(unchanged_pages)} pages unchanged)"
             return "No changes"
 
         if self.sync_type == "created":
@@ -1280,10 +1376,14 @@ class Page(TimeStampedModel):
         The page number in the Transkribus document.
     parsed_data : JSONField
         The parsed data of the page.
+    last_parsed_at : DateTimeField
+        The time the page was last parsed.
     num_tags : IntegerField
         The number of tags on the page.
     is_ignored : BooleanField
         Whether the page is ignored.
+    xml_digest : CharField
+        The SHA-256 digest of the PAGE XML content of the last sync.
     """
 
     document = models.ForeignKey(
@@ -1308,12 +1408,18 @@ class Page(TimeStampedModel):
     parsed_data = models.JSONField(default=dict, blank=True)
     """The parsed data of the page."""
 
+    last_parsed_at = models.DateTimeField(null=True, blank=True)
+    """The time the page was last parsed."""
+
     num_tags = models.IntegerField(default=0)
     """The number of tags on the page."""
 
     is_ignored = models.BooleanField(default=False)
     """Whether the page is ignored."""
 
+    xml_digest = models.CharField(max_length=64, blank=True, default="")
+    """The SHA-256 digest of the PAGE XML content. Used to skip unchanged pages during sync."""
+
     class Meta:
         ordering = ["tk_page_number"]
 
@@ -1435,6 +1541,49 @@ class Page(TimeStampedModel):
         return f"Page {self.tk_page_number} of {self.document.document_id}"
 
 
+class PageXmlBlob(models.Model):
+    """
+    PageXmlBlob Model
+    -----------------
+
+    A PAGE XML file in the content-addressed store (see twf.utils.page_xml_store). Each
+    distinct content is stored once, under a path derived from its SHA-256 digest, and
+    shared by all pages with this content. The reference count is maintained by the sync;
+    the gc_page_xml management command recounts it and deletes unreferenced files.
+
+    Attributes
+    ~~~~~~~~~~
+    digest : CharField
+        The SHA-256 hex digest of the content.
+    size : PositiveIntegerField
+        The size of the content in bytes.
+    ref_count : IntegerField
+        The number of pages referencing the file.
+    created_at : DateTimeField
+        The time the file was first stored.
+    last_stored_at : DateTimeField
+        The last time the content was stored (or reused) by a sync.
+    """
+
+    digest = models.CharField(max_length=64, unique=True)
+    """The SHA-256 hex digest of the content."""
+
+    size = models.PositiveIntegerField(default=0)
+    """The size of the content in bytes."""
+
+    ref_count = models.IntegerField(default=0)
+    """The number of pages referencing the file."""
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    """The time the file was first stored."""
+
+    last_stored_at = models.DateTimeField(default=timezone.now)
+    """The last time the content was stored (or reused) by a sync."""
+
+    def __str__(self):
+        return f"PageXmlBlob {self.digest} ({self.ref_count} references)"
+
+
 class Dictionary(TimeStampedModel):
     """
     Dictionary Model
@@ -1606,6 +1755,8 @@ class PageTag(TimeStampedModel):
     ~~~~~~~~~~
     page : ForeignKey
         The page this tag belongs to.
+    project : ForeignKey
+        The project of the tag's document, denormalized from the page.
     variation : CharField
         The text of the tag.
     variation_type : CharField
@@ -1635,6 +1786,15 @@ class PageTag(TimeStampedModel):
     page = models.ForeignKey(Page, related_name="tags", on_delete=models.CASCADE)
     """The page this tag belongs to."""
 
+    project = models.ForeignKey(
+        Project,
+        related_name="page_tags",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    """The project of the tag's document (denormalized, to filter tags without joins)."""
+
     variation = models.CharField(max_length=255)
     """The text of the tag."""
 
@@ -1700,6 +1860,21 @@ class PageTag(TimeStampedModel):
         """Meta options for the PageTag model."""
 
         ordering = ["variation"]
+        indexes = [
+            models.Index(fields=["project", "variation_type", "dictionary_entry"]),
+            models.Index(fields=["project", "variation"]),
+            models.Index(fields=["project", "is_reserved", "is_parked"]),
+        ]
+
+    def save(self, *args, **kwargs):
+        """Save the tag, setting the project from its page if missing."""
+        if self.project_id is None and self.page_id is not None:
+            self.project_id = (
+                Page.objects.filter(pk=self.page_id)
+                .values_list("document__project_id", flat=True)
+                .first()
+            )
+        super().save(*args, **kwargs)
 
     def is_resolved(self):
         """
@@ -1871,6 +2046,114 @@ class Variation(TimeStampedModel):
         return self.variation
 
 
+class TagSuggestionSet(models.Model):
+    """
+    TagSuggestionSet Model
+    ----------------------
+
+    The precomputed dictionary entry suggestions for the unassigned tags of a project with
+    the same variation and type (see twf.utils.tag_suggestions). The suggestions are
+    computed in the background, the grouping views only read them.
+
+    Attributes
+    ~~~~~~~~~~
+    project : ForeignKey
+        The project of the tags.
+    variation : CharField
+        The text of the tags.
+    variation_type : CharField
+        The type of the tags.
+    computed_at : DateTimeField
+        The time the suggestions were computed. Suggestions computed before the last
+        change of the dictionaries are recomputed.
+    """
+
+    project = models.ForeignKey(
+        Project, related_name="tag_suggestion_sets", on_delete=models.CASCADE
+    )
+    """The project of the tags."""
+
+    variation = models.CharField(max_length=255)
+    """The text of the tags."""
+
+    variation_type = models.CharField(max_length=100)
+    """The type of the tags."""
+
+    computed_at = models.DateTimeField(default=timezone.now)
+    """The time the suggestions were computed."""
+
+    class Meta:
+        """Meta options for the TagSuggestionSet model."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "variation", "variation_type"],
+                name="unique_tag_suggestion_set",
+            ),
+        ]
+
+    def __str__(self):
+        """Return the string representation of the TagSuggestionSet."""
+        return f"Suggestions for {self.variation} ({self.variation_type})"
+
+
+class TagSuggestion(models.Model):
+    """
+    TagSuggestion Model
+    -------------------
+
+    A dictionary entry suggested for the tags of a TagSuggestionSet.
+
+    Attributes
+    ~~~~~~~~~~
+    suggestion_set : ForeignKey
+        The suggestion set this suggestion belongs to.
+    entry : ForeignKey
+        The suggested dictionary entry.
+    variation : ForeignKey
+        The variation of the entry which matches the tags best.
+    score : IntegerField
+        The similarity score of the best matching variation (0-100).
+    strong_match_count : IntegerField
+        The number of variations of the entry with a score of at least 80.
+    rank : PositiveSmallIntegerField
+        The position of the suggestion, 0 is the best.
+    """
+
+    suggestion_set = models.ForeignKey(
+        TagSuggestionSet, related_name="suggestions", on_delete=models.CASCADE
+    )
+    """The suggestion set this suggestion belongs to."""
+
+    entry = models.ForeignKey(
+        DictionaryEntry, related_name="tag_suggestions", on_delete=models.CASCADE
+    )
+    """The suggested dictionary entry."""
+
+    variation = models.ForeignKey(
+        Variation, related_name="tag_suggestions", on_delete=models.CASCADE
+    )
+    """The variation of the entry which matches the tags best."""
+
+    score = models.IntegerField(default=0)
+    """The similarity score of the best matching variation (0-100)."""
+
+    strong_match_count = models.IntegerField(default=0)
+    """The number of variations of the entry with a score of at least 80."""
+
+    rank = models.PositiveSmallIntegerField(default=0)
+    """The position of the suggestion, 0 is the best."""
+
+    class Meta:
+        """Meta options for the TagSuggestion model."""
+
+        ordering = ["rank"]
+
+    def __str__(self):
+        """Return the string representation of the TagSuggestion."""
+        return f"{self.entry} ({self.score})"
+
+
 class DateVariation(TimeStampedModel):
     """
     DateVariation Model
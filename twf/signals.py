@@ -1,9 +1,16 @@
 """Signals for the twf app."""
 
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from twf.models import UserProfile
+from twf.models import DictionaryEntry, UserProfile, Variation
+from twf.utils.tag_suggestions import (
+    drop_tag_suggestions,
+    schedule_entry_tag_suggestions_refresh,
+    schedule_tag_suggestions_refresh,
+)
+from twf.utils.variation_index import mark_variation_indexes_stale
 
 User = get_user_model()
 
@@ -19,3 +26,35 @@ def create_user_profile(sender, instance, created, **kwargs):
 def save_user_profile(sender, instance, **kwargs):
     """Save the user profile when the user is saved."""
     instance.profile.save()
+
+
+@receiver(post_save, sender=Variation)
+@receiver(post_delete, sender=Variation)
+def refresh_variation_indexes(sender, instance, **kwargs):
+    """Make the fuzzy search indexes and the tag suggestions pick up a saved or deleted
+    variation."""
+    mark_variation_indexes_stale()
+    entry_id = instance.entry_id
+    user_id = instance.modified_by_id
+    transaction.on_commit(lambda: schedule_entry_tag_suggestions_refresh(entry_id, user_id))
+
+
+@receiver(post_delete, sender=DictionaryEntry)
+def refresh_entry_indexes(sender, instance, **kwargs):
+    """Make the fuzzy search indexes and the tag suggestions drop a deleted entry."""
+    mark_variation_indexes_stale()
+    dictionary_id = instance.dictionary_id
+    user_id = instance.modified_by_id
+    transaction.on_commit(lambda: schedule_tag_suggestions_refresh(dictionary_id, user_id))
+
+
+@receiver(pre_delete, sender=Variation)
+def drop_variation_suggestions(sender, instance, **kwargs):
+    """Drop the tag suggestions which would lose a deleted variation."""
+    drop_tag_suggestions(variation_id=instance.pk)
+
+
+@receiver(pre_delete, sender=DictionaryEntry)
+def drop_entry_suggestions(sender, instance, **kwargs):
+    """Drop the tag suggestions which would lose a deleted entry."""
+    drop_tag_suggestions(entry_id=instance.pk)
@@ -1,5 +1,6 @@
 (function() {
     let lastMessage = "";
+    let lastSeq = 0;
     const startButtonId = "#button-id-startbatch";
     const cancelButtonId = "#button-id-cancelbatch";
 
@@ -16,6 +17,7 @@
     function startTask(startUrl, progressUrlBase, progressBarId, logTextareaId, data) {
         const queryString = new URLSearchParams(data).toString();
         lastMessage = "";
+        lastSeq = 0;
 
         // Clear the log before starting
         $(logTextareaId).text('');
@@ -62,13 +64,14 @@
      * @param {string} logTextareaId - The ID of the textarea to display logs.
      */
     function pollTaskProgress(taskId, progressUrlBase, progressBarId, logTextareaId) {
-        let url = progressUrlBase + taskId + '/';
+        let url = progressUrlBase + taskId + '/?after_seq=' + lastSeq;
 
         fetch(url)
             .then(response => response.json())
             .then(data => {
                 const progressBar = $(progressBarId);
                 const status = data.status.toUpperCase();
+                appendLogLines(data, logTextareaId);
 
                 if (status === 'PENDING' || status === 'STARTED') {
                     progressBar.css('width', '100%');
@@ -87,12 +90,8 @@
                     progressBar.removeClass('progress-bar-striped progress-bar-animated');
                     progressBar.text(progress.toFixed(2) + '%');
 
-                    // If we have full text available, use it (complete log)
-                    if (data.full_text) {
-                        console.log("Full text available:", data.full_text.length, "chars");
-                        const logTextarea = $(logTextareaId);
-                        logTextarea.val(data.full_text);
-                        
+                    // The log lines of the database task were appended above
+                    if (data.last_seq !== undefined) {
                         // If we have a database task ID, add/update the task link button
                         if (data.db_task_id) {
                             console.log("Found DB task ID:", data.db_task_id);
@@ -110,10 +109,8 @@
                                 $(logTextareaId).after(detailsButton);
                             }
                         }
-                        
-                        scrollToBottom(logTextareaId);
-                    } 
-                    // Fallback to old behavior if full_text is not available
+                    }
+                    // Fallback to old behavior if the task has no log lines
                     else if (data.text) {
                         console.log("Only partial text available");
                         const logTextarea = $(logTextareaId);
@@ -217,6 +214,25 @@
             });
     }
 
+    /**
+     * Appends the new log lines of a status response to the log and remembers the
+     * sequence number of the last line, so the next poll only fetches newer lines.
+     *
+     * @param {object} data - The status response.
+     * @param {string} logTextareaId - The ID of the textarea to display logs.
+     */
+    function appendLogLines(data, logTextareaId) {
+        if (data.last_seq === undefined) {
+            return;
+        }
+        if (data.lines && data.lines.length) {
+            const logTextarea = $(logTextareaId);
+            logTextarea.val(logTextarea.val() + data.lines.join(''));
+            scrollToBottom(logTextareaId);
+        }
+        lastSeq = data.last_seq;
+    }
+
     function cancelTask(cancelUrlBase) {
         const cancelButton = $(cancelButtonId);
         const taskId = cancelButton.data("task-id");
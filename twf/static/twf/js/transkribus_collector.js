@@ -106,16 +106,20 @@ async function check_export_status(project_id) {
 
 /**
  * This function is called when the user clicks the "Start Download" button.
+ * The download runs in a background task, its progress is polled every second.
  */
 function updateProgress(downloadProgress, downloadProgressBar, startDownloadButton) {
-    const evtSource = new EventSource('/ajax/transkribus/export/monitor/download/');
-    evtSource.onmessage = function(event) {
-        //console.log('Current progress:', event.data);
-        let progress = parseInt(event.data); // Assuming progress data is a simple integer
-        if (progress >= 100) {
-            evtSource.close();  // Close the event source if the progress is 100
-            console.log('Extraction completed');
-        }
-        downloadProgressBar.css('width', progress + '%').attr('aria-valuenow', progress).text(progress + '%');
-    };
+    const interval = setInterval(function() {
+        $.getJSON('/ajax/transkribus/export/monitor/download/', function(data) {
+            let progress = parseInt(data.progress) || 0;
+            downloadProgressBar.css('width', progress + '%').attr('aria-valuenow', progress).text(progress + '%');
+            if (data.status === 'SUCCESS' || data.status === 'FAILURE') {
+                clearInterval(interval);  // Stop polling once the download task has finished
+                if (data.status === 'FAILURE') {
+                    downloadProgress.text(data.title);
+                }
+                console.log('Download finished: ' + data.status);
+            }
+        });
+    }, 1000);
 }
@@ -268,7 +268,7 @@ class DictionaryEntryVariationTable(tables.Table):
         from django.urls import reverse
 
         variation_usage_count = PageTag.objects.filter(
-            page__document__project=self.project, variation=record.variation
+            project=self.project, variation=record.variation
         ).count()
 
         documents = Document.objects.filter(
@@ -37,9 +37,8 @@ def test_ai_config_task(self, project_id, user_id, ai_config_id, test_context):
         logger.info(f"Provider: {ai_config.provider}, Model: {ai_config.model}")
 
         if self.twf_task:
-            self.twf_task.text += f"Testing AI Configuration: {ai_config.name}\n"
-            self.twf_task.text += f"Provider: {ai_config.provider}, Model: {ai_config.model}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"Testing AI Configuration: {ai_config.name}\n")
+            self.log(f"Provider: {ai_config.provider}, Model: {ai_config.model}\n")
 
         # Parse context if it's a string
         if isinstance(test_context, str):
@@ -47,8 +46,7 @@ def test_ai_config_task(self, project_id, user_id, ai_config_id, test_context):
 
         logger.info(f"Test context: {json.dumps(test_context, indent=2)}")
         if self.twf_task:
-            self.twf_task.text += f"Test context: {json.dumps(test_context, indent=2)}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"Test context: {json.dumps(test_context, indent=2)}\n")
 
         # Set progress
         self.set_total_items(1)
@@ -62,14 +60,13 @@ def test_ai_config_task(self, project_id, user_id, ai_config_id, test_context):
         logger.info(f"Response length: {len(response_text)} characters")
 
         if self.twf_task:
-            self.twf_task.text += f"\nResponse received in {duration:.2f} seconds\n"
-            self.twf_task.text += f"Response length: {len(response_text)} characters\n"
-            self.twf_task.text += f"\n{'='*60}\n"
-            self.twf_task.text += f"RESPONSE:\n"
-            self.twf_task.text += f"{'='*60}\n"
-            self.twf_task.text += f"{response_text}\n"
-            self.twf_task.text += f"{'='*60}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"\nResponse received in {duration:.2f} seconds\n")
+            self.log(f"Response length: {len(response_text)} characters\n")
+            self.log(f"\n{'='*60}\n")
+            self.log(f"RESPONSE:\n")
+            self.log(f"{'='*60}\n")
+            self.log(f"{response_text}\n")
+            self.log(f"{'='*60}\n")
 
         # Store result in task metadata
         result_data = {
@@ -92,8 +89,7 @@ def test_ai_config_task(self, project_id, user_id, ai_config_id, test_context):
         error_msg = f"Invalid JSON in test context: {str(e)}"
         logger.error(error_msg)
         if self.twf_task:
-            self.twf_task.text += f"\nERROR: {error_msg}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"\nERROR: {error_msg}\n")
         self.end_task(status="FAILURE", error_msg=error_msg)
         raise
 
@@ -101,7 +97,6 @@ def test_ai_config_task(self, project_id, user_id, ai_config_id, test_context):
         error_msg = f"Test failed: {str(e)}"
         logger.error(error_msg)
         if self.twf_task:
-            self.twf_task.text += f"\nERROR: {error_msg}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"\nERROR: {error_msg}\n")
         self.end_task(status="FAILURE", error_msg=error_msg)
         raise
@@ -95,8 +95,7 @@ def search_gnd_entries(self, project_id, user_id, **kwargs):
 
             # Add error to task text for user visibility
             if self.twf_task:
-                self.twf_task.text += f"  ✗ {error_message}\n"
-                self.twf_task.save(update_fields=["text"])
+                self.log(f"  ✗ {error_message}\n")
 
             # Continue processing other entries instead of ending task
             self.advance_task(status="failure")
@@ -169,18 +168,16 @@ def search_wikidata_entries(self, project_id, user_id, **kwargs):
 
             # Add error to task text for user visibility
             if self.twf_task:
-                self.twf_task.text += f"  ✗ {error_message}\n"
-                self.twf_task.save(update_fields=["text"])
+                self.log(f"  ✗ {error_message}\n")
 
             # Continue processing other entries
             self.advance_task(status="failure")
 
     # Add summary to task text
     if self.twf_task:
-        self.twf_task.text += f"\nWikidata Search Summary:\n"
-        self.twf_task.text += f"  • Entries enriched: {found_entries}\n"
-        self.twf_task.text += f"  • Entries failed: {failed_entries}\n"
-        self.twf_task.save(update_fields=["text"])
+        self.log(f"\nWikidata Search Summary:\n")
+        self.log(f"  • Entries enriched: {found_entries}\n")
+        self.log(f"  • Entries failed: {failed_entries}\n")
 
     self.end_task()
 
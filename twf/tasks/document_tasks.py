@@ -41,10 +41,9 @@ def search_ai_for_docs(self, project_id, user_id, **kwargs):
 
     # Update task with document count information
     if self.twf_task:
-        self.twf_task.text += (
+        self.log(
             f"Found {doc_count} documents to process with {ai_config.provider} ({ai_config.name}).\n"
         )
-        self.twf_task.save(update_fields=["text"])
 
     # Process all documents using the AI configuration settings
     self.process_ai_request(
@@ -167,7 +167,7 @@ def export_project_task(self, project_id, user_id, **kwargs):
     pages = Page.objects.filter(document__project=project).select_related("document")
     export_data["pages"] = serialize("json", pages)
 
-    tags = PageTag.objects.filter(page__document__project=project)
+    tags = PageTag.objects.filter(project=project)
     export_data["tags"] = serialize("json", tags)
 
     export_data["collections"] = serialize("json", project.collections.all())
@@ -159,8 +159,7 @@ def load_sheets_metadata(self, project_id, user_id, **kwargs):
         self.set_total_items(total_table_lines)
 
         if self.twf_task:
-            self.twf_task.text += f"Loading metadata from Google Sheets for {total_table_lines} rows.\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"Loading metadata from Google Sheets for {total_table_lines} rows.\n")
 
         doc_id_column_index = title_row.index(sheets_configuration["document_id_column"])
 
@@ -216,16 +215,15 @@ def load_sheets_metadata(self, project_id, user_id, **kwargs):
                 skipped_count += 1
                 logger.warning(f"Document with ID {doc_id} not found in project")
                 if self.twf_task:
-                    self.twf_task.text += f"  ⚠ Document {doc_id} not found in project, skipping.\n"
+                    self.log(f"  ⚠ Document {doc_id} not found in project, skipping.\n")
                 self.advance_task(status="skipped")
 
         # Add summary to task text
         if self.twf_task:
-            self.twf_task.text += f"\nGoogle Sheets Import Summary:\n"
-            self.twf_task.text += f"  • Documents updated: {processed_count}\n"
-            self.twf_task.text += f"  • Documents not found: {skipped_count}\n"
-            self.twf_task.text += f"  • Rows with errors: {error_count}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"\nGoogle Sheets Import Summary:\n")
+            self.log(f"  • Documents updated: {processed_count}\n")
+            self.log(f"  • Documents not found: {skipped_count}\n")
+            self.log(f"  • Rows with errors: {error_count}\n")
 
         self.end_task()
 
@@ -10,6 +10,7 @@ from django.contrib.auth import get_user_model
 
 from twf.models import Project, Note, Workflow, AIConfiguration
 from twf.tasks.task_base import BaseTWFTask
+from twf.utils.page_xml_store import share_page_xml_file
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
@@ -45,7 +46,7 @@ def copy_project(self, project_id, user_id, **kwargs):
             self.update_progress(5)
             # Generate a new title if not provided
             new_title = new_title or f"Copy of {self.project.title}"
-            self.twf_task.text += f"Creating new project: {new_title}\n"
+            self.log(f"Creating new project: {new_title}\n")
 
             # Create the new project with only essential attributes
             new_project = Project(
@@ -92,7 +93,7 @@ def copy_project(self, project_id, user_id, **kwargs):
                     modified_by=self.user,
                 )
                 ai_config_count += 1
-            self.twf_task.text += f"Copied {ai_config_count} AI configurations\n"
+            self.log(f"Copied {ai_config_count} AI configurations\n")
 
             # Copy existing Notes (excluding the copy-info note which is added at the end)
             note_count = 0
@@ -106,12 +107,12 @@ def copy_project(self, project_id, user_id, **kwargs):
                 )
                 note_count += 1
             if note_count:
-                self.twf_task.text += f"Copied {note_count} notes\n"
-            self.twf_task.text += f"Created new project with ID: {new_project.id}\n"
+                self.log(f"Copied {note_count} notes\n")
+            self.log(f"Created new project with ID: {new_project.id}\n")
 
             # Copy selected dictionaries (referencing the same ones)
             self.update_progress(10)
-            self.twf_task.text += "Copying dictionary references...\n"
+            self.log("Copying dictionary references...\n")
             if self.project.selected_dictionaries.exists():
                 new_project.selected_dictionaries.set(
                     self.project.selected_dictionaries.all()
@@ -119,13 +120,13 @@ def copy_project(self, project_id, user_id, **kwargs):
 
             # Copy members and their permissions
             self.update_progress(15)
-            self.twf_task.text += "Copying project members...\n"
+            self.log("Copying project members...\n")
             if self.project.members.exists():
                 new_project.members.set(self.project.members.all())
 
             # Copy user permissions
             self.update_progress(20)
-            self.twf_task.text += "Copying user permissions...\n"
+            self.log("Copying user permissions...\n")
             # Get a fresh queryset of users to ensure we have the latest data
             # Get all users who are members of the new project
             user_ids = new_project.members.values_list("user_id", flat=True)
@@ -148,7 +149,7 @@ def copy_project(self, project_id, user_id, **kwargs):
 
             # Copy collections and their items
             self.update_progress(30)
-            self.twf_task.text += "Copying collections...\n"
+            self.log("Copying collections...\n")
             collection_count = 0
             collection_item_count = 0
 
@@ -181,11 +182,11 @@ def copy_project(self, project_id, user_id, **kwargs):
                     collection_item_mapping[item.id] = new_item
                     collection_item_count += 1
 
-            self.twf_task.text += f"Copied {collection_count} collections with {collection_item_count} items\n"
+            self.log(f"Copied {collection_count} collections with {collection_item_count} items\n")
 
             # Copy documents and their pages/tags
             self.update_progress(50)
-            self.twf_task.text += "Copying documents and pages...\n"
+            self.log("Copying documents and pages...\n")
             document_count = 0
             page_count = 0
             tag_count = 0
@@ -209,13 +210,17 @@ def copy_project(self, project_id, user_id, **kwargs):
                 document_count += 1
 
                 for page in document.pages.all():
+                    # The copy references the same file in the page XML store
+                    xml_file, xml_digest = share_page_xml_file(page)
                     new_page = page.__class__(
                         document=new_document,
                         metadata=page.metadata,
-                        xml_file=page.xml_file,
+                        xml_file=xml_file,
+                        xml_digest=xml_digest,
                         tk_page_id=page.tk_page_id,
                         tk_page_number=page.tk_page_number,
                         parsed_data=page.parsed_data,
+                        last_parsed_at=page.last_parsed_at,
                         num_tags=page.num_tags,
                         is_ignored=page.is_ignored,
                         created_by=self.user,
@@ -228,6 +233,7 @@ def copy_project(self, project_id, user_id, **kwargs):
                     for page_tag in page.tags.all():
                         new_page_tag = page_tag.__class__(
                             page=new_page,
+                            project=new_project,
                             variation=page_tag.variation,
                             variation_type=page_tag.variation_type,
                             dictionary_entry=page_tag.dictionary_entry,
@@ -240,11 +246,13 @@ def copy_project(self, project_id, user_id, **kwargs):
                         new_page_tag.save()
                         tag_count += 1
 
-            self.twf_task.text += f"Copied {document_count} documents with {page_count} pages and {tag_count} tags\n"
+            self.log(
+                f"Copied {document_count} documents with {page_count} pages and {tag_count} tags\n"
+            )
 
             # Copy prompts
             self.update_progress(80)
-            self.twf_task.text += "Copying prompts...\n"
+            self.log("Copying prompts...\n")
             prompt_count = 0
 
             for prompt in self.project.prompts.all():
@@ -286,11 +294,11 @@ def copy_project(self, project_id, user_id, **kwargs):
                     if items_to_add:
                         new_prompt.collection_context.set(items_to_add)
 
-            self.twf_task.text += f"Copied {prompt_count} prompts\n"
+            self.log(f"Copied {prompt_count} prompts\n")
 
             # Copy workflows
             self.update_progress(90)
-            self.twf_task.text += "Copying workflows...\n"
+            self.log("Copying workflows...\n")
             workflow_count = 0
 
             # Use the Workflow class to properly access its fields
@@ -337,9 +345,7 @@ def copy_project(self, project_id, user_id, **kwargs):
                         if docs_to_assign:
                             new_workflow.assigned_document_items.set(docs_to_assign)
                     except Exception as e:
-                        self.twf_task.text += (
-                            f"Warning: Could not copy document items relation: {e}\n"
-                        )
+                        self.log(f"Warning: Could not copy document items relation: {e}\n")
 
                 # Dictionary entries
                 if (
@@ -352,7 +358,7 @@ def copy_project(self, project_id, user_id, **kwargs):
                             workflow.assigned_dictionary_entries.all()
                         )
                     except Exception as e:
-                        self.twf_task.text += f"Warning: Could not copy dictionary entries relation: {e}\n"
+                        self.log(f"Warning: Could not copy dictionary entries relation: {e}\n")
 
                 # Collection items
                 if (
@@ -367,11 +373,9 @@ def copy_project(self, project_id, user_id, **kwargs):
                         if items_to_assign:
                             new_workflow.assigned_collection_items.set(items_to_assign)
                     except Exception as e:
-                        self.twf_task.text += (
-                            f"Warning: Could not copy collection items relation: {e}\n"
-                        )
+                        self.log(f"Warning: Could not copy collection items relation: {e}\n")
 
-            self.twf_task.text += f"Copied {workflow_count} workflows\n"
+            self.log(f"Copied {workflow_count} workflows\n")
 
             # Create a note about the copy
             Note.objects.create(
@@ -394,7 +398,7 @@ def copy_project(self, project_id, user_id, **kwargs):
 
         # Record completion in the database task
         if self.twf_task:
-            self.twf_task.text += "Project copy completed successfully!\n"
+            self.log("Project copy completed successfully!\n")
             self.twf_task.status = "SUCCESS"
             self.twf_task.end_time = timezone.now()
             duration = (self.twf_task.end_time - self.start_datetime).total_seconds()
@@ -420,7 +424,7 @@ def copy_project(self, project_id, user_id, **kwargs):
             summary += f"Workflows: {workflow_count}\n"
             summary += "----------------------\n"
 
-            self.twf_task.text += summary
+            self.log(summary)
 
             # Set meta information in the database task
             self.twf_task.meta = {
@@ -462,8 +466,8 @@ def copy_project(self, project_id, user_id, **kwargs):
 
         # Record failure in the database task
         if self.twf_task:
-            self.twf_task.text += f"Error during project copy: {error_msg}\n"
-            self.twf_task.text += f"Stack trace:\n{stack_trace}\n"
+            self.log(f"Error during project copy: {error_msg}\n")
+            self.log(f"Stack trace:\n{stack_trace}\n")
             self.twf_task.status = "FAILURE"
             self.twf_task.end_time = timezone.now()
             self.twf_task.title = (
@@ -479,7 +483,7 @@ def copy_project(self, project_id, user_id, **kwargs):
             summary += f"Duration: {duration:.2f} seconds\n"
             summary += f"Error: {error_msg}\n"
             summary += "----------------------\n"
-            self.twf_task.text += summary
+            self.log(summary)
 
             self.twf_task.save()
 
@@ -521,7 +525,9 @@ def query_project_unified(self, project_id, user_id, **kwargs):
     # Note about image support for non-supporting providers
     if prompt_mode in ["images_only", "text_and_images"]:
         if ai_config.provider in ["mistral"]:  # Update as needed based on provider capabilities
-            self.twf_task.text += f"Note: {ai_config.provider} does not currently support image inputs. Using text-only mode.\n"
+            self.log(
+                f"Note: {ai_config.provider} does not currently support image inputs. Using text-only mode.\n"
+            )
             prompt_mode = "text_only"
 
     # Process query using the AI configuration settings
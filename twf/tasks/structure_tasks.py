@@ -1,27 +1,51 @@
 """Celery tasks for extracting Transkribus export files."""
 
 import copy
+import io
 import logging
 import os
+import time
 import uuid
 import zipfile
 import xml.etree.ElementTree as ET
+from itertools import batched
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-from celery import shared_task
+import billiard
+from celery import chord, shared_task
+from celery.exceptions import Ignore
 from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
-from simple_alto_parser import PageFileParser
-
-from twf.models import Document, Page, DocumentSyncHistory, PageTag
-from twf.utils.page_file_meta_data_reader import extract_transkribus_file_metadata
-from twf.tasks.task_base import BaseTWFTask
-from twf.utils.file_utils import delete_all_in_folder
+from django.utils.dateparse import parse_datetime
+
+from twf.models import Document, Page, DocumentSyncHistory, PageTag, Task
+from twf.utils.page_file_meta_data_reader import (
+    extract_transkribus_file_metadata,
+    extract_transkribus_header_metadata,
+)
+from twf.tasks.task_base import BaseTWFTask, ChordCallbackTWFTask
+from twf.tasks.task_log import LOG_PROGRESS, LOG_SUMMARY
+from twf.utils.file_utils import delete_all_in_folder, compute_content_digest
+from twf.utils.page_parsing_utils import parse_page_file, safe_parse_page_file
+from twf.utils.tags_utils import TagAssignmentResolver
+from twf.utils.page_xml_store import (
+    adjust_page_xml_references,
+    release_page_xml_files,
+    store_page_xml,
+)
 from twf.clients.transkribus_api_client import TranskribusAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Phases of the Transkribus sync, in order. A checkpoint records the last finished phase.
+SYNC_PHASES = ["extract", "documents", "parse", "tags"]
+
+# Upper limit of the parse_workers sync setting, as in the sync settings form
+MAX_PARSE_WORKERS = 64
+
 
 @shared_task(bind=True, base=BaseTWFTask)
 def extract_zip_export_task(
@@ -30,6 +54,7 @@ def extract_zip_export_task(
     user_id,
     force_recreate_tags=False,
     delete_removed_documents=True,
+    dry_run=False,
     **kwargs,
 ):
     """
@@ -39,11 +64,15 @@ def extract_zip_export_task(
     1. Documents and pages (add/update/delete)
     2. Tags while preserving user assignments and parked status
 
+    In dry-run mode nothing is extracted or written: the task only reports the plan of
+    what a sync with the same options would add, update and delete (see plan_sync).
+
     Args:
         project_id: Project ID
         user_id: User performing sync
         force_recreate_tags: If True, delete all tags and recreate (default: False)
         delete_removed_documents: If True, delete documents not in export (default: True)
+        dry_run: If True, only report what the sync would change (default: False)
         **kwargs: Additional options
 
     Returns:
@@ -52,39 +81,83 @@ def extract_zip_export_task(
     extracted_files = 0
     doc_changes = {}
     tag_changes = {}
+    zip_ref = None
 
     try:
+        if dry_run:
+            return run_sync_dry_run(self, force_recreate_tags, delete_removed_documents)
+
         # ========================================
         # PHASE 1: DOWNLOAD & EXTRACT (30%)
         # ========================================
-        self.twf_task.text += "=" * 60 + "\n"
-        self.twf_task.text += "PHASE 1: EXTRACT TRANSKRIBUS EXPORT\n"
-        self.twf_task.text += "=" * 60 + "\n\n"
-        self.twf_task.save(update_fields=["text"])
-
-        # Validate and prepare zip file
-        zip_file, extract_to_path = prepare_zip_file(self.project, self)
-        self.twf_task.text += f"✓ Prepared zip file: {zip_file.name}\n"
-        self.twf_task.text += f"✓ Extraction path: {extract_to_path}\n\n"
-        self.twf_task.save(update_fields=["text"])
-
-        # Extract files from zip
-        copied_files = extract_files_from_zip(
-            zip_file, extract_to_path, self.project, self
+        self.log("=" * 60 + "\n")
+        self.log("PHASE 1: EXTRACT TRANSKRIBUS EXPORT\n")
+        self.log("=" * 60 + "\n\n")
+
+        sync_config = self.project.get_sync_configuration()
+        stream_from_zip = sync_config["stream_from_zip"]
+        checkpoint = load_sync_checkpoint(
+            self,
+            get_export_fingerprint(
+                self.project,
+                stream_from_zip=stream_from_zip,
+                force_recreate_tags=force_recreate_tags,
+                delete_removed_documents=delete_removed_documents,
+            ),
         )
-        extracted_files = len(copied_files)
-        self.twf_task.text += (
-            f"✓ Extracted {extracted_files} files from the zip archive.\n\n"
+
+        # Validate and prepare zip file, keep the files extracted before an interruption
+        zip_file, extract_to_path = prepare_zip_file(
+            self.project, self, clean=not is_phase_done(checkpoint, "extract")
         )
-        self.twf_task.save(update_fields=["text"])
+        self.log(f"✓ Prepared zip file: {zip_file.name}\n")
+        self.log(f"✓ Extraction path: {extract_to_path}\n\n")
+
+        if sync_config["shard_size"] and not force_recreate_tags:
+            # Sharded mode: the documents are synced by sub-tasks, on any worker. The
+            # checkpoint records the completed shards instead of the sync phases.
+            return self.replace(
+                build_sharded_sync(
+                    self,
+                    zip_file,
+                    sync_config["shard_size"],
+                    delete_removed_documents,
+                    checkpoint,
+                )
+            )
+
+        with self.phase("extract"):
+            if stream_from_zip:
+                # Streaming mode: read the members straight from the archive, nothing is extracted
+                zip_ref = zipfile.ZipFile(zip_file.path, "r")
+                copied_files = get_valid_zip_members(zip_ref)
+                extracted_files = len(copied_files)
+                self.log(f"✓ Streaming {extracted_files} files directly from the zip archive.\n\n")
+            elif is_phase_done(checkpoint, "extract") and any(Path(extract_to_path).iterdir()):
+                copied_files = list(Path(extract_to_path).iterdir())
+                extracted_files = len(copied_files)
+                self.log(f"✓ Reusing {extracted_files} files extracted before the interruption.\n\n")
+            else:
+                if is_phase_done(checkpoint, "extract"):
+                    # The extracted files are gone, the page files must be synced from the start
+                    checkpoint.update(phase=None, processed_files=0)
+                    self.save_checkpoint(phase=None, processed_files=0)
+                # Extract files from zip
+                copied_files = extract_files_from_zip(
+                    zip_file, extract_to_path, self.project, self
+                )
+                extracted_files = len(copied_files)
+                self.log(f"✓ Extracted {extracted_files} files from the zip archive.\n\n")
+            if not is_phase_done(checkpoint, "extract"):
+                checkpoint["phase"] = "extract"
+                self.save_checkpoint(phase="extract")
 
         # ========================================
         # PHASE 2: SYNC DOCUMENTS & PAGES (40%)
         # ========================================
-        self.twf_task.text += "=" * 60 + "\n"
-        self.twf_task.text += "PHASE 2: SYNC DOCUMENTS & PAGES\n"
-        self.twf_task.text += "=" * 60 + "\n\n"
-        self.twf_task.save(update_fields=["text"])
+        self.log("=" * 60 + "\n")
+        self.log("PHASE 2: SYNC DOCUMENTS & PAGES\n")
+        self.log("=" * 60 + "\n\n")
 
         doc_changes = sync_documents_and_pages(
             copied_files,
@@ -92,145 +165,108 @@ def extract_zip_export_task(
             self.user,
             self,
             delete_removed=delete_removed_documents,
+            zip_ref=zip_ref,
+            checkpoint=checkpoint,
         )
+        changed_page_ids = doc_changes.pop("changed_page_ids")
 
-        self.twf_task.text += "\nDocument Sync Summary:\n"
-        self.twf_task.text += f"  • Documents added: {doc_changes['added']}\n"
-        self.twf_task.text += f"  • Documents updated: {doc_changes['updated']}\n"
-        self.twf_task.text += f"  • Documents deleted: {doc_changes['deleted']}\n"
-        self.twf_task.text += f"  • Pages added: {doc_changes['pages_added']}\n"
-        self.twf_task.text += f"  • Pages updated: {doc_changes['pages_updated']}\n"
-        self.twf_task.text += f"  • Pages deleted: {doc_changes['pages_deleted']}\n\n"
-        self.twf_task.save(update_fields=["text"])
+        log_document_sync_summary(self, doc_changes)
 
         # ========================================
         # PHASE 3: SMART TAG SYNC (30%)
         # ========================================
-        if force_recreate_tags:
-            self.twf_task.text += "=" * 60 + "\n"
-            self.twf_task.text += "PHASE 3: RECREATE ALL TAGS (FORCE MODE)\n"
-            self.twf_task.text += "=" * 60 + "\n\n"
-            self.twf_task.text += "⚠️  WARNING: Force recreate mode enabled.\n"
-            self.twf_task.text += (
-                "⚠️  All existing tags will be deleted and recreated.\n"
-            )
-            self.twf_task.text += (
-                "⚠️  Manual assignments and parked status will be lost.\n\n"
-            )
-            self.twf_task.save(update_fields=["text"])
-
-            # Use the old recreate approach
-            from twf.tasks.tags_tasks import create_page_tags
-
-            pages = Page.objects.filter(document__project=self.project)
-            self.set_total_items(pages.count())
-
-            assigned_tags = 0
-            total_tags = 0
-
-            for page in pages:
-                PageTag.objects.filter(page=page).delete()
-                parsed_data = page.parsed_data
-
-                for element in parsed_data.get("elements", []):
-                    for tag in element.get("element_data", {}).get(
-                        "custom_list_structure", []
-                    ):
-                        if "text" in tag:
-                            text = tag["text"].strip()
-                            copy_of_tag = copy.deepcopy(tag)
-                            copy_of_tag.pop("text")
-                            from twf.utils.tags_utils import assign_tag
-
-                            page_tag = PageTag(
-                                page=page,
-                                variation=text,
-                                variation_type=tag["type"],
-                                additional_information=copy_of_tag,
-                            )
-                            is_assigned = assign_tag(page_tag, self.user)
-                            if is_assigned:
-                                assigned_tags += 1
-                            total_tags += 1
-                            page_tag.save(current_user=self.user)
-
-                page.num_tags = len(
-                    element.get("element_data", {}).get("custom_list_structure", [])
-                )
-                page.save()
-                self.advance_task()
-
-            tag_changes = {
-                "added": total_tags,
-                "updated": 0,
-                "deleted": 0,
-                "preserved_assignments": 0,
-                "preserved_parked": 0,
-                "auto_assigned": assigned_tags,
-                "warnings": [],
-            }
+        if is_phase_done(checkpoint, "tags"):
+            tag_changes = checkpoint["tag_changes"]
+            self.log("Tags already synced before the interruption.\n")
+        elif force_recreate_tags:
+            self.log("=" * 60 + "\n")
+            self.log("PHASE 3: RECREATE ALL TAGS (FORCE MODE)\n")
+            self.log("=" * 60 + "\n\n")
+            self.log("⚠️  WARNING: Force recreate mode enabled.\n")
+            self.log("⚠️  All existing tags will be deleted and recreated.\n")
+            self.log("⚠️  Manual assignments and parked status will be lost.\n\n")
+
+            with self.phase("tag_sync"):
+                # Use the old recreate approach
+                from twf.tasks.tags_tasks import create_page_tags
+
+                pages = Page.objects.filter(document__project=self.project)
+                self.set_total_items(pages.count())
+
+                assigned_tags = 0
+                total_tags = 0
+                resolver = TagAssignmentResolver(self.project)
+
+                for page in pages:
+                    PageTag.objects.filter(page=page).delete()
+                    parsed_data = page.parsed_data
+
+                    for element in parsed_data.get("elements", []):
+                        for tag in element.get("element_data", {}).get(
+                            "custom_list_structure", []
+                        ):
+                            if "text" in tag:
+                                text = tag["text"].strip()
+                                copy_of_tag = copy.deepcopy(tag)
+                                copy_of_tag.pop("text")
+
+                                page_tag = PageTag(
+                                    page=page,
+                                    project=self.project,
+                                    variation=text,
+                                    variation_type=tag["type"],
+                                    additional_information=copy_of_tag,
+                                )
+                                is_assigned = resolver.assign(page_tag)
+                                if is_assigned:
+                                    assigned_tags += 1
+                                total_tags += 1
+                                page_tag.save(current_user=self.user)
+
+                    page.num_tags = len(
+                        element.get("element_data", {}).get("custom_list_structure", [])
+                    )
+                    page.save()
+                    self.advance_task()
+
+                tag_changes = {
+                    "added": total_tags,
+                    "updated": 0,
+                    "deleted": 0,
+                    "preserved_assignments": 0,
+                    "preserved_parked": 0,
+                    "auto_assigned": assigned_tags,
+                    "warnings": [],
+                }
         else:
-            self.twf_task.text += "=" * 60 + "\n"
-            self.twf_task.text += "PHASE 3: SMART TAG SYNC\n"
-            self.twf_task.text += "=" * 60 + "\n\n"
-            self.twf_task.text += (
-                "Smart sync mode: Preserving user assignments and parked status.\n\n"
-            )
-            self.twf_task.save(update_fields=["text"])
+            self.log("=" * 60 + "\n")
+            self.log("PHASE 3: SMART TAG SYNC\n")
+            self.log("=" * 60 + "\n\n")
+            self.log("Smart sync mode: Preserving user assignments and parked status.\n\n")
 
             # Import here to avoid circular import
             from twf.tasks.tags_tasks import smart_sync_tags
 
-            tag_changes = smart_sync_tags(self.project, self.user, self)
-
-        self.twf_task.text += "\nTag Sync Summary:\n"
-        self.twf_task.text += f"  • Tags added: {tag_changes['added']}\n"
-        self.twf_task.text += f"  • Tags updated: {tag_changes['updated']}\n"
-        self.twf_task.text += f"  • Tags deleted: {tag_changes['deleted']}\n"
-        self.twf_task.text += (
-            f"  • Assignments preserved: {tag_changes['preserved_assignments']}\n"
-        )
-        self.twf_task.text += (
-            f"  • Parked status preserved: {tag_changes['preserved_parked']}\n"
-        )
-        self.twf_task.text += f"  • Auto-assigned: {tag_changes['auto_assigned']}\n"
-
-        if tag_changes.get("warnings"):
-            self.twf_task.text += f"\n⚠️  Warnings: {len(tag_changes['warnings'])}\n"
-            for warning in tag_changes["warnings"][:5]:  # Show first 5 warnings
-                self.twf_task.text += f"  - {warning}\n"
-            if len(tag_changes["warnings"]) > 5:
-                self.twf_task.text += (
-                    f"  ... and {len(tag_changes['warnings']) - 5} more warnings\n"
+            # Unchanged pages keep their tags as they are
+            with self.phase("tag_sync"):
+                tag_changes = smart_sync_tags(
+                    self.project, self.user, self, page_ids=changed_page_ids
                 )
+        self.save_checkpoint(phase="tags", tag_changes=tag_changes)
 
-        self.twf_task.text += "\n"
-        self.twf_task.save(update_fields=["text"])
+        log_tag_sync_summary(self, tag_changes)
 
         # ========================================
         # FINALIZE
         # ========================================
-        self.twf_task.text += "=" * 60 + "\n"
-        self.twf_task.text += "SYNC COMPLETED SUCCESSFULLY\n"
-        self.twf_task.text += "=" * 60 + "\n"
-        self.twf_task.save(update_fields=["text"])
+        self.log("=" * 60 + "\n")
+        self.log("SYNC COMPLETED SUCCESSFULLY\n")
+        self.log("=" * 60 + "\n")
 
         self.end_task(
-            status="SUCCESS",
-            extracted_files=extracted_files,
-            documents_added=doc_changes.get("added", 0),
-            documents_updated=doc_changes.get("updated", 0),
-            documents_deleted=doc_changes.get("deleted", 0),
-            pages_added=doc_changes.get("pages_added", 0),
-            pages_updated=doc_changes.get("pages_updated", 0),
-            pages_deleted=doc_changes.get("pages_deleted", 0),
-            tags_added=tag_changes.get("added", 0),
-            tags_updated=tag_changes.get("updated", 0),
-            tags_deleted=tag_changes.get("deleted", 0),
-            tags_preserved=tag_changes.get("preserved_assignments", 0),
-            tags_auto_assigned=tag_changes.get("auto_assigned", 0),
-            warnings_count=len(tag_changes.get("warnings", [])),
+            status="SUCCESS", **get_sync_result_meta(extracted_files, doc_changes, tag_changes)
         )
+        schedule_tag_suggestions_after_sync(self)
 
         return {
             "status": "completed",
@@ -239,33 +275,106 @@ def extract_zip_export_task(
             "tag_changes": tag_changes,
         }
 
+    except Ignore:
+        # The task was replaced by a sharded sync
+        raise
+
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error in extract_zip_export_task: {error_msg}")
 
         if self.twf_task:
-            self.twf_task.text += "\n" + "=" * 60 + "\n"
-            self.twf_task.text += "❌ SYNC FAILED\n"
-            self.twf_task.text += "=" * 60 + "\n"
-            self.twf_task.text += f"Error: {error_msg}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log("\n" + "=" * 60 + "\n")
+            self.log("❌ SYNC FAILED\n")
+            self.log("=" * 60 + "\n")
+            self.log(f"Error: {error_msg}\n")
 
         self.end_task(status="FAILURE", error_msg=error_msg)
         raise
 
+    finally:
+        if zip_ref is not None:
+            zip_ref.close()
+
+
+def schedule_tag_suggestions_after_sync(celery_task):
+    """Start computing the suggestions for the tags the sync added or changed."""
+    # Import here to avoid circular import
+    from twf.tasks.tags_tasks import refresh_tag_suggestions_task
+
+    refresh_tag_suggestions_task.delay(celery_task.project.id, celery_task.user.id)
+
+
+def log_document_sync_summary(celery_task, doc_changes):
+    """Append the summary of the document and page sync to the task text."""
+    celery_task.log("\nDocument Sync Summary:\n")
+    celery_task.log(f"  • Documents added: {doc_changes['added']}\n")
+    celery_task.log(f"  • Documents updated: {doc_changes['updated']}\n")
+    celery_task.log(f"  • Documents deleted: {doc_changes['deleted']}\n")
+    celery_task.log(f"  • Pages added: {doc_changes['pages_added']}\n")
+    celery_task.log(f"  • Pages updated: {doc_changes['pages_updated']}\n")
+    celery_task.log(f"  • Pages unchanged (skipped): {doc_changes['pages_unchanged']}\n")
+    celery_task.log(f"  • Pages deleted: {doc_changes['pages_deleted']}\n\n")
+
+
+def log_tag_sync_summary(celery_task, tag_changes):
+    """Append the summary of the tag sync to the task text."""
+    celery_task.log("\nTag Sync Summary:\n")
+    celery_task.log(f"  • Tags added: {tag_changes['added']}\n")
+    celery_task.log(f"  • Tags updated: {tag_changes['updated']}\n")
+    celery_task.log(f"  • Tags deleted: {tag_changes['deleted']}\n")
+    celery_task.log(f"  • Assignments preserved: {tag_changes['preserved_assignments']}\n")
+    celery_task.log(f"  • Parked status preserved: {tag_changes['preserved_parked']}\n")
+    celery_task.log(f"  • Auto-assigned: {tag_changes['auto_assigned']}\n")
+
+    if tag_changes.get("warnings"):
+        celery_task.log(f"\n⚠️  Warnings: {len(tag_changes['warnings'])}\n")
+        for warning in tag_changes["warnings"][:5]:  # Show first 5 warnings
+            celery_task.log(f"  - {warning}\n")
+        if len(tag_changes["warnings"]) > 5:
+            celery_task.log(f"  ... and {len(tag_changes['warnings']) - 5} more warnings\n")
+
+    celery_task.log("\n")
+
+
+def get_sync_result_meta(extracted_files, doc_changes, tag_changes):
+    """Return the statistics of a sync, as stored in the task meta."""
+    return {
+        "extracted_files": extracted_files,
+        "documents_added": doc_changes.get("added", 0),
+        "documents_updated": doc_changes.get("updated", 0),
+        "documents_deleted": doc_changes.get("deleted", 0),
+        "pages_added": doc_changes.get("pages_added", 0),
+        "pages_updated": doc_changes.get("pages_updated", 0),
+        "pages_unchanged": doc_changes.get("pages_unchanged", 0),
+        "pages_deleted": doc_changes.get("pages_deleted", 0),
+        "tags_added": tag_changes.get("added", 0),
+        "tags_updated": tag_changes.get("updated", 0),
+        "tags_deleted": tag_changes.get("deleted", 0),
+        "tags_preserved": tag_changes.get("preserved_assignments", 0),
+        "tags_auto_assigned": tag_changes.get("auto_assigned", 0),
+        "warnings_count": len(tag_changes.get("warnings", [])),
+    }
+
 
-def prepare_zip_file(project, celery_task):
-    """Check the zip file and prepare the extraction path."""
+def prepare_zip_file(project, celery_task, clean=True):
+    """Check the zip file and prepare the extraction path.
+
+    The extraction path is emptied unless clean is False (resuming an interrupted sync).
+    """
     zip_file = project.downloaded_zip_file
     if not zip_file or not os.path.exists(zip_file.path):
         error_message = "The zip file does not exist in the file system."
         raise ValueError(error_message)
 
     fs = FileSystemStorage()
-    extract_to_path = fs.path(f"transkribus_exports/{project.collection_id}/")
+    # Extract into a subfolder: the collection folder itself holds the Page.xml_file copies
+    # from before the content-addressed store, which must survive the cleanup.
+    extract_to_path = fs.path(f"transkribus_exports/{project.collection_id}/extracted/")
     if not fs.exists(extract_to_path):
         os.makedirs(extract_to_path)
-    delete_all_in_folder(extract_to_path)
+    if clean:
+        delete_all_in_folder(extract_to_path)
 
     celery_task.update_progress(2)
     return zip_file, extract_to_path
@@ -275,13 +384,7 @@ def extract_files_from_zip(zip_file, extract_to_path, project, celery_task):
     """Extract valid files from the zip archive."""
     copied_files = []
     with zipfile.ZipFile(zip_file.path, "r") as zip_ref:
-        valid_files = [
-            x
-            for x in zip_ref.infolist()
-            if ("/page/" in x.filename and x.filename.endswith(".xml"))
-            or x.filename.endswith("metadata.xml")
-            or x.filename.endswith("mets.xml")
-        ]
+        valid_files = get_valid_zip_members(zip_ref)
         total_files = len(valid_files)
 
         for i, file_info in enumerate(valid_files, start=1):
@@ -301,6 +404,32 @@ def extract_files_from_zip(zip_file, extract_to_path, project, celery_task):
     return copied_files
 
 
+def get_valid_zip_members(zip_ref):
+    """Return the page XML, metadata.xml and mets.xml members of the export archive."""
+    return [
+        x
+        for x in zip_ref.infolist()
+        if ("/page/" in x.filename and x.filename.endswith(".xml"))
+        or x.filename.endswith("metadata.xml")
+        or x.filename.endswith("mets.xml")
+    ]
+
+
+def get_export_file_path(file):
+    """Return the path of an export file, which is either an extracted file or a zip member."""
+    if isinstance(file, zipfile.ZipInfo):
+        return file.filename
+    return str(file)
+
+
+def read_export_file(file, zip_ref=None):
+    """Read the content of an export file, either from disk or directly from the archive."""
+    if isinstance(file, zipfile.ZipInfo):
+        return zip_ref.read(file)
+    with open(file, "rb") as f:
+        return f.read()
+
+
 def generate_new_filename(file_info, project):
     """Generate a new filename for extracted files."""
     if file_info.filename.endswith(("metadata.xml", "mets.xml")):
@@ -338,9 +467,10 @@ def process_extracted_files(copied_files, project, extracting_user, celery_task)
 
     # Log metadata files found
     if celery_task.twf_task:
-        celery_task.twf_task.text += (f"Found {len(metadata_files)} metadata files "
-                                      f"and {len(page_xml_files)} page files.\n")
-        celery_task.twf_task.save(update_fields=["text"])
+        celery_task.log(
+            f"Found {len(metadata_files)} metadata files "
+            f"and {len(page_xml_files)} page files.\n"
+        )
 
     # Process page XML files
     for i, file in enumerate(page_xml_files, start=1):
@@ -387,36 +517,34 @@ def process_extracted_files(copied_files, project, extracting_user, celery_task)
 
     # Add summary to task text
     if celery_task.twf_task:
-        celery_task.twf_task.text += "\nSummary of document processing:\n"
-        celery_task.twf_task.text += (
-            f"- Documents processed: {len(processed_documents)}\n"
-        )
-        celery_task.twf_task.text += f"- Pages created: {processed_pages}\n"
-        celery_task.twf_task.text += f"- Failed files: {failed_files}\n"
-        celery_task.twf_task.save(update_fields=["text"])
+        celery_task.log("\nSummary of document processing:\n")
+        celery_task.log(f"- Documents processed: {len(processed_documents)}\n")
+        celery_task.log(f"- Pages created: {processed_pages}\n")
+        celery_task.log(f"- Failed files: {failed_files}\n")
 
     return len(processed_documents), processed_pages
 
 
-def parse_metadata_files(files, doc_id):
+def parse_metadata_files(files, doc_id, zip_ref=None):
     """Extract metadata from metadata.xml and mets.xml files for a document.
 
+    This scans all files for the document. For a whole export, use
+    build_metadata_index instead, which parses every metadata file only once.
+
     Args:
-        files: List of file paths
+        files: List of file paths or zip members
         doc_id: Document ID to find matching metadata files
+        zip_ref: Open ZipFile, required if files are zip members
 
     Returns:
         dict: Metadata extracted from the files
     """
-    metadata = {}
-
     # Look for matching metadata files
     metadata_file = None
     mets_file = None
 
     for file in files:
-        file_str = str(file)
-        file_basename = os.path.basename(file_str)
+        file_str = get_export_file_path(file)
 
         # Check if the filename contains the document ID
         if doc_id in file_str:
@@ -425,10 +553,73 @@ def parse_metadata_files(files, doc_id):
             elif file_str.endswith("mets.xml"):
                 mets_file = file
 
+    return read_document_metadata(metadata_file, mets_file, doc_id, zip_ref)
+
+
+def build_metadata_index(files, zip_ref=None):
+    """Parse all metadata.xml and mets.xml files of an export in one pass.
+
+    The files are grouped by the document folder they belong to (the first component of
+    their path in the export archive), and each pair is parsed once.
+
+    Args:
+        files: List of metadata file paths or zip members
+        zip_ref: Open ZipFile, required if files are zip members
+
+    Returns:
+        dict: Document folder name (the docId) -> metadata dict
+    """
+    files_by_document = defaultdict(dict)
+    for file in files:
+        file_str = get_export_file_path(file)
+        if isinstance(file, zipfile.ZipInfo):
+            document_key = file_str.split("/")[0]
+        else:
+            # Extracted files are named <document folder>_metadata.xml (see generate_new_filename)
+            document_key = os.path.basename(file_str).rsplit("_", 1)[0]
+
+        if file_str.endswith("metadata.xml"):
+            files_by_document[document_key]["metadata"] = file
+        elif file_str.endswith("mets.xml"):
+            files_by_document[document_key]["mets"] = file
+
+    return {
+        document_key: read_document_metadata(
+            document_files.get("metadata"), document_files.get("mets"), document_key, zip_ref
+        )
+        for document_key, document_files in files_by_document.items()
+    }
+
+
+def get_indexed_metadata(metadata_index, metadata_files, doc_id, zip_ref=None):
+    """Return the metadata of a document from the index.
+
+    Documents which are not found under their own ID fall back to a scan of all metadata files.
+    The result is stored in the index, so the scan runs at most once per document.
+    """
+    if doc_id not in metadata_index:
+        metadata_index[doc_id] = parse_metadata_files(metadata_files, doc_id, zip_ref)
+    return metadata_index[doc_id]
+
+
+def read_document_metadata(metadata_file, mets_file, doc_id, zip_ref=None):
+    """Extract metadata from the metadata.xml and mets.xml file of a document.
+
+    Args:
+        metadata_file: The metadata.xml file path or zip member, or None
+        mets_file: The mets.xml file path or zip member, or None
+        doc_id: Document ID (for logging)
+        zip_ref: Open ZipFile, required if the files are zip members
+
+    Returns:
+        dict: Metadata extracted from the files
+    """
+    metadata = {}
+
     # Extract metadata from metadata.xml
     if metadata_file:
         try:
-            tree = ET.parse(metadata_file)
+            tree = ET.parse(io.BytesIO(read_export_file(metadata_file, zip_ref)))
             root = tree.getroot()
 
             # Extract basic metadata
@@ -462,7 +653,7 @@ def parse_metadata_files(files, doc_id):
     # Extract additional metadata from mets.xml
     if mets_file:
         try:
-            tree = ET.parse(mets_file)
+            tree = ET.parse(io.BytesIO(read_export_file(mets_file, zip_ref)))
             root = tree.getroot()
 
             # Extract metadata from mets file (often has more detailed info)
@@ -554,68 +745,173 @@ def handle_document_and_page(
     return doc_instance.document_id, page_created
 
 
-def parse_pages(project, extracting_user, celery_task):
-    """Parse pages and extract data."""
-    all_pages = Page.objects.filter(document__project=project).order_by(
-        "document__document_id", "tk_page_number"
+def parse_pages(project, extracting_user, celery_task, page_ids=None):
+    """Parse pages and extract data.
+
+    Pages are parsed one by one unless the project's sync settings configure more than one
+    parse worker. In that case the pages are parsed in a process pool and the results are
+    written back in batches (see parse_pages_in_pool). The pool works in the prefork worker
+    pool of Celery; with more than one parse worker, each worker process running a sync
+    starts parse_workers more processes.
+
+    Args:
+        project: Project object
+        extracting_user: User performing the extraction
+        celery_task: BaseTWFTask instance for progress tracking
+        page_ids: Optional collection of Page IDs to parse. If None, all pages are parsed.
+    """
+    all_pages = (
+        Page.objects.filter(document__project=project)
+        .select_related("document")
+        .order_by("document__document_id", "tk_page_number")
     )
+    if page_ids is not None:
+        all_pages = all_pages.filter(id__in=page_ids)
     total_pages = all_pages.count()
 
     # Set total items for progress tracking
     celery_task.set_total_items(total_pages)
 
-    successfully_parsed = 0
-    failed_parsing = 0
+    parse_workers, batch_size = get_parse_pool_settings(
+        project.get_sync_configuration(), celery_task
+    )
 
-    for i, page in enumerate(all_pages, start=1):
-        try:
-            page_parser = PageFileParser(
-                parser_config={
-                    "line_type": "TextRegion",
-                    "logging": {"level": logging.WARN},
-                    "export": {
-                        "json": {
-                            "print_files": True,
-                            "print_filename": True,
-                            "print_file_meta_data": True,
-                        }
-                    },
-                }
-            )
-            page_parser.add_file(page.xml_file.path)
-            page_parser.parse()
-            page.parsed_data = page_parser.get_alto_files()[
-                0
-            ].get_standalone_json_object()
-            page.last_parsed_at = timezone.now()
-            page.save(current_user=extracting_user)
-
-            successfully_parsed += 1
-            celery_task.advance_task(
-                text=f"Parsed page {i}/{total_pages}: Page {page.tk_page_id} "
-                     f"(#{page.tk_page_number}) from document {page.document.document_id}",
-                status="success",
-            )
-        except Exception as e:
-            failed_parsing += 1
-            error_msg = (f"Failed to parse page {page.tk_page_id} from "
-                         f"document {page.document.document_id}: {str(e)}")
-            logger.error(error_msg)
-            celery_task.advance_task(
-                text=f"Error parsing page {i}/{total_pages}: Page {page.tk_page_id} "
-                     f"(#{page.tk_page_number}) from document {page.document.document_id} - {str(e)[:100]}",
-                status="failure",
+    if parse_workers > 1:
+        if celery_task.twf_task:
+            celery_task.log(
+                f"Parsing {total_pages} pages with {parse_workers} "
+                f"workers (batch size {batch_size}).\n"
             )
+        successfully_parsed, failed_parsing = parse_pages_in_pool(
+            all_pages, total_pages, extracting_user, celery_task, parse_workers, batch_size
+        )
+    else:
+        successfully_parsed = 0
+        failed_parsing = 0
+
+        for i, page in enumerate(all_pages, start=1):
+            try:
+                page.parsed_data = parse_page_file(page.xml_file.path)
+                page.last_parsed_at = timezone.now()
+                page.save(current_user=extracting_user)
+
+                successfully_parsed += 1
+                celery_task.advance_task(
+                    text=f"Parsed page {i}/{total_pages}: Page {page.tk_page_id} "
+                         f"(#{page.tk_page_number}) from document {page.document.document_id}",
+                    status="success",
+                )
+            except Exception as e:
+                failed_parsing += 1
+                log_page_parse_error(page, i, total_pages, str(e), celery_task)
 
     # Add summary to task text
     if celery_task.twf_task:
-        celery_task.twf_task.text += "\nParsing summary:\n"
-        celery_task.twf_task.text += (
-            f"- Successfully parsed: {successfully_parsed} pages\n"
-        )
+        celery_task.log("\nParsing summary:\n")
+        celery_task.log(f"- Successfully parsed: {successfully_parsed} pages\n")
         if failed_parsing > 0:
-            celery_task.twf_task.text += f"- Failed to parse: {failed_parsing} pages\n"
-        celery_task.twf_task.save(update_fields=["text"])
+            celery_task.log(f"- Failed to parse: {failed_parsing} pages\n")
+
+
+def get_parse_pool_settings(sync_config, celery_task):
+    """Return the validated number of parse workers and the parse batch size.
+
+    Values outside the limits of the sync settings form are clamped, values which are
+    not numbers replaced by the defaults. Both are reported in the task log.
+
+    Returns:
+        tuple: (parse_workers, batch_size)
+    """
+    settings = []
+    for key, default, minimum, maximum in (
+        ("parse_workers", 1, 1, MAX_PARSE_WORKERS),
+        ("parse_batch_size", 200, 10, 5000),
+    ):
+        value = sync_config.get(key) or default
+        try:
+            valid_value = min(max(int(value), minimum), maximum)
+        except (TypeError, ValueError):
+            valid_value = default
+        if valid_value != value:
+            logger.warning(f"Invalid sync setting {key}={value!r}, using {valid_value}")
+            if celery_task.twf_task:
+                celery_task.log(f"⚠️  Invalid sync setting {key}={value!r}, using {valid_value}.\n")
+        settings.append(valid_value)
+    return tuple(settings)
+
+
+def parse_pages_in_pool(pages, total_pages, extracting_user, celery_task, workers, batch_size):
+    """Parse pages in a process pool and write the results back in batches.
+
+    The worker processes only parse the XML files; all database writes happen in the
+    calling process with one bulk_update per batch. The pool is a billiard pool, Celery's
+    fork of multiprocessing, as a multiprocessing pool cannot be started from the daemonic
+    processes of Celery's prefork worker pool.
+
+    Args:
+        pages: QuerySet of Page objects to parse
+        total_pages: Number of pages in the queryset
+        extracting_user: User performing the extraction
+        celery_task: BaseTWFTask instance for progress tracking
+        workers: Number of worker processes
+        batch_size: Number of pages to parse and write per batch
+
+    Returns:
+        tuple: (successfully_parsed, failed_parsing)
+    """
+    successfully_parsed = 0
+    failed_parsing = 0
+    i = 0
+    chunksize = max(1, batch_size // (workers * 4))
+
+    pool = billiard.Pool(processes=workers)
+    try:
+        for batch in batched(pages.iterator(chunk_size=batch_size), batch_size):
+            paths = [page.xml_file.path for page in batch]
+            results = pool.imap(safe_parse_page_file, paths, chunksize=chunksize)
+
+            parsed_batch = []
+            for page, (parsed_data, error) in zip(batch, results):
+                i += 1
+                if error is not None:
+                    failed_parsing += 1
+                    log_page_parse_error(page, i, total_pages, error, celery_task)
+                    continue
+
+                now = timezone.now()
+                page.parsed_data = parsed_data
+                page.last_parsed_at = now
+                page.modified_at = now
+                page.modified_by = extracting_user
+                parsed_batch.append(page)
+
+                successfully_parsed += 1
+                celery_task.advance_task(
+                    text=f"Parsed page {i}/{total_pages}: Page {page.tk_page_id} "
+                         f"(#{page.tk_page_number}) from document {page.document.document_id}",
+                    status="success",
+                )
+
+            Page.objects.bulk_update(
+                parsed_batch, ["parsed_data", "last_parsed_at", "modified_at", "modified_by"]
+            )
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return successfully_parsed, failed_parsing
+
+
+def log_page_parse_error(page, index, total_pages, error, celery_task):
+    """Log a page that failed to parse and advance the task as failed."""
+    error_msg = (f"Failed to parse page {page.tk_page_id} from "
+                 f"document {page.document.document_id}: {error}")
+    logger.error(error_msg)
+    celery_task.advance_task(
+        text=f"Error parsing page {index}/{total_pages}: Page {page.tk_page_id} "
+             f"(#{page.tk_page_number}) from document {page.document.document_id} - {error[:100]}",
+        status="failure",
+    )
 
 
 def enrich_documents_with_api_metadata(project, documents_to_enrich, user, celery_task):
@@ -660,14 +956,17 @@ def enrich_documents_with_api_metadata(project, documents_to_enrich, user, celer
     if not api_client.authenticate():
         logger.error("Failed to authenticate with Transkribus API, skipping enrichment")
         if celery_task.twf_task:
-            celery_task.twf_task.text += ("  ⚠ Failed to authenticate with Transkribus API, "
-                                          "skipping metadata enrichment\n")
+            celery_task.log(
+                "  ⚠ Failed to authenticate with Transkribus API, "
+                "skipping metadata enrichment\n"
+            )
         return 0
 
     if celery_task.twf_task:
-        celery_task.twf_task.text += (f"\n📡 Enriching {len(documents_to_enrich)} documents "
-                                      f"with Transkribus API metadata...\n")
-        celery_task.twf_task.save(update_fields=["text"])
+        celery_task.log(
+            f"\n📡 Enriching {len(documents_to_enrich)} documents "
+            f"with Transkribus API metadata...\n"
+        )
 
     enriched_count = 0
     total_docs = len(documents_to_enrich)
@@ -706,8 +1005,9 @@ def enrich_documents_with_api_metadata(project, documents_to_enrich, user, celer
                 if is_excluded:
                     doc_instance.is_ignored = True
                     if celery_task.twf_task:
-                        celery_task.twf_task.text += f"  ⊘ Document {doc_id} marked as excluded (has 'Exclude' label)\n"
-                        celery_task.twf_task.save(update_fields=["text"])
+                        celery_task.log_item(
+                            f"  ⊘ Document {doc_id} marked as excluded (has 'Exclude' label)\n"
+                        )
 
                 doc_instance.save(current_user=user)
 
@@ -748,30 +1048,32 @@ def enrich_documents_with_api_metadata(project, documents_to_enrich, user, celer
                 enriched_count += 1
 
                 if celery_task.twf_task and idx % 10 == 0:
-                    celery_task.twf_task.text += (
-                        f"  ✓ Enriched {idx}/{total_docs} documents\n"
-                    )
-                    celery_task.twf_task.save(update_fields=["text"])
+                    celery_task.log(f"  ✓ Enriched {idx}/{total_docs} documents\n", LOG_PROGRESS)
 
         except Document.DoesNotExist:
             logger.warning(f"Document {doc_id} not found during enrichment")
         except Exception as e:
             logger.error(f"Failed to enrich document {doc_id}: {e}")
             if celery_task.twf_task:
-                celery_task.twf_task.text += (
-                    f"  ✗ Failed to enrich document {doc_id}: {e}\n"
-                )
+                celery_task.log(f"  ✗ Failed to enrich document {doc_id}: {e}\n")
 
     if celery_task.twf_task:
-        celery_task.twf_task.text += (f"✓ Successfully enriched {enriched_count}/{total_docs} "
-                                      f"documents with API metadata\n\n")
-        celery_task.twf_task.save(update_fields=["text"])
+        celery_task.log(
+            f"✓ Successfully enriched {enriched_count}/{total_docs} "
+            f"documents with API metadata\n\n"
+        )
 
     return enriched_count
 
 
 def sync_documents_and_pages(
-    copied_files, project, user, celery_task, delete_removed=True
+    copied_files,
+    project,
+    user,
+    celery_task,
+    delete_removed=True,
+    zip_ref=None,
+    checkpoint=None,
 ):
     """
     Synchronize documents and pages with Transkribus export.
@@ -779,15 +1081,30 @@ def sync_documents_and_pages(
     This function handles the smart synchronization of documents and pages:
     - Adds new documents and pages
     - Updates existing documents and pages
+    - Skips pages whose PAGE XML is byte-identical to the last sync (same SHA-256 digest)
     - Optionally deletes documents removed from Transkribus
     - Enriches documents with metadata from Transkribus API
 
+    Only new and changed pages are parsed. Their IDs are returned in 'changed_page_ids' so
+    that the tag sync can skip unchanged pages as well.
+
+    Each page file is read once. In streaming mode (zip_ref given) the files are zip members
+    which are read directly from the archive, so the page XML is only written to disk once,
+    as the Page.xml_file.
+
+    The database writes are done in bulk by DocumentPageSyncEngine, in batches of the
+    project's 'sync_batch_size' setting. After each batch the number of synced page files
+    is saved to the task's checkpoint; a resumed sync continues after the last finished
+    batch and skips the phases which are already done.
+
     Args:
-        copied_files: List of extracted file paths
+        copied_files: List of extracted file paths, or zip members in streaming mode
         project: Project object
         user: User performing the sync
         celery_task: BaseTWFTask instance for progress tracking
         delete_removed: If True, delete documents not in the export
+        zip_ref: Open ZipFile of the export (streaming mode only)
+        checkpoint: Checkpoint of an interrupted sync to resume from
 
     Returns:
         dict: Statistics about the sync operation:
@@ -797,227 +1114,1257 @@ def sync_documents_and_pages(
             'deleted': int,         # Documents removed
             'pages_added': int,     # New pages created
             'pages_updated': int,   # Existing pages updated
-            'pages_deleted': int    # Pages removed
+            'pages_unchanged': int, # Existing pages skipped (identical digest)
+            'pages_deleted': int,   # Pages removed
+            'changed_page_ids': set # IDs of added and updated pages
         }
     """
-    # Track all documents and pages in the export
+    page_xml_files, metadata_files = split_export_files(copied_files, celery_task)
+
+    checkpoint = checkpoint or {}
+    started_at = get_checkpoint_start(checkpoint)
+
+    if is_phase_done(checkpoint, "documents"):
+        # The documents and pages were synced before the interruption
+        stats = {**checkpoint["stats"], "changed_page_ids": set(checkpoint["changed_page_ids"])}
+        documents_in_export = set(checkpoint["documents_in_export"])
+        if celery_task.twf_task:
+            celery_task.log("Documents and pages already synced, resuming.\n")
+    else:
+        with celery_task.phase("sync_documents"):
+            engine = DocumentPageSyncEngine(
+                project,
+                user,
+                celery_task,
+                metadata_files,
+                zip_ref=zip_ref,
+                batch_size=project.get_sync_configuration()["sync_batch_size"],
+                started_at=started_at,
+            )
+            engine.sync_page_files(page_xml_files, resume_from=checkpoint.get("processed_files", 0))
+
+            # Handle deleted pages and documents (if enabled)
+            if delete_removed:
+                engine.delete_removed_pages()
+                engine.delete_removed_documents()
+
+            # Create sync history for processed documents
+            engine.write_sync_history()
+
+        stats = engine.stats
+        documents_in_export = engine.documents_in_export
+        celery_task.save_checkpoint(
+            phase="documents",
+            stats={key: value for key, value in stats.items() if key != "changed_page_ids"},
+            changed_page_ids=sorted(stats["changed_page_ids"]),
+            documents_in_export=sorted(documents_in_export),
+        )
+
+    if not is_phase_done(checkpoint, "parse"):
+        # Enrich documents with API metadata (labels, tags, excluded status)
+        with celery_task.phase("enrich_metadata"):
+            enrich_documents_with_api_metadata(project, documents_in_export, user, celery_task)
+
+        # Parse new and changed pages, except those parsed before an interruption
+        already_parsed = set(
+            Page.objects.filter(
+                document__project=project, last_parsed_at__gte=started_at
+            ).values_list("id", flat=True)
+        )
+        page_ids = stats["changed_page_ids"] - already_parsed
+        if celery_task.twf_task:
+            celery_task.log(
+                f"Skipping {stats['pages_unchanged']} unchanged page(s), "
+                f"parsing {len(page_ids)} page(s).\n"
+            )
+        with celery_task.phase("parse"):
+            parse_pages(project, user, celery_task, page_ids=page_ids)
+        celery_task.save_checkpoint(phase="parse")
+
+    return stats
+
+
+def run_sync_dry_run(celery_task, force_recreate_tags, delete_removed_documents):
+    """Compute and report the plan of a sync, without changing anything.
+
+    Returns:
+        dict: The task result with the plan
+    """
+    celery_task.log("=" * 60 + "\n")
+    celery_task.log("DRY RUN: SYNC PLAN\n")
+    celery_task.log("=" * 60 + "\n\n")
+
+    zip_file = celery_task.project.downloaded_zip_file
+    if not zip_file or not os.path.exists(zip_file.path):
+        raise ValueError("The zip file does not exist in the file system.")
+
+    start = time.monotonic()
+    plan = plan_sync(
+        celery_task.project,
+        zip_file.path,
+        delete_removed=delete_removed_documents,
+        force_recreate_tags=force_recreate_tags,
+    )
+    log_sync_plan(celery_task, plan, time.monotonic() - start)
+
+    celery_task.end_task(
+        status="SUCCESS",
+        dry_run=True,
+        documents_added=len(plan["documents"]["add"]),
+        documents_updated=plan["documents"]["update"],
+        documents_deleted=len(plan["documents"]["delete"]),
+        pages_added=plan["pages"]["add"],
+        pages_updated=plan["pages"]["update"],
+        pages_unchanged=plan["pages"]["unchanged"],
+        pages_deleted=plan["pages"]["delete"],
+        tags_resynced=plan["tags"]["resync"],
+        tags_deleted=plan["tags"]["delete"],
+        assignments_lost=plan["tags"]["assignments_lost"],
+    )
+    return {"status": "dry_run", "plan": plan}
+
+
+def plan_sync(project, zip_path, delete_removed=True, force_recreate_tags=False):
+    """Compute what a sync of the export would add, update and delete, without writing.
+
+    Only the archive's central directory, the TranskribusMetadata block and the digest of
+    each page file are read; nothing is extracted or parsed. Pages are compared with the
+    database the same way the sync does it (see DocumentPageSyncEngine.upsert_pages).
+
+    Tags are not extracted from the page files. The plan reports the existing tags the
+    sync would touch: the tags of changed pages are re-synced, the tags of removed pages
+    deleted. In force mode all tags are deleted and recreated.
+
+    Args:
+        project: Project object
+        zip_path: Path of the downloaded export
+        delete_removed: If True, documents not in the export are planned for deletion
+        force_recreate_tags: If True, all tags are planned for recreation
+
+    Returns:
+        dict: The plan:
+        {
+            'documents': {'add': [document_id], 'update': int, 'delete': [document_id]},
+            'pages': {'add': int, 'update': int, 'unchanged': int, 'delete': int},
+            'tags': {'resync': int, 'delete': int, 'assignments_lost': int,
+                     'parked_lost': int},
+            'errors': [str]
+        }
+    """
+    existing_documents = set(
+        Document.objects.filter(project=project).values_list("document_id", flat=True)
+    )
+    existing_pages = {
+        (doc_id, tk_page_id): (page_id, tk_page_number, xml_digest, last_parsed_at)
+        for page_id, doc_id, tk_page_id, tk_page_number, xml_digest, last_parsed_at in (
+            Page.objects.filter(document__project=project).values_list(
+                "id",
+                "document__document_id",
+                "tk_page_id",
+                "tk_page_number",
+                "xml_digest",
+                "last_parsed_at",
+            )
+        )
+    }
+
     documents_in_export = set()
-    pages_in_export = defaultdict(set)  # doc_instance.id -> set of tk_page_id
+    pages_in_export = set()
+    changed_page_ids = []
+    pages = {"add": 0, "update": 0, "unchanged": 0, "delete": 0}
+    errors = []
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        page_members, _ = split_export_files(get_valid_zip_members(zip_ref), celery_task=None)
+        for member in page_members:
+            try:
+                content = zip_ref.read(member)
+                data = extract_transkribus_header_metadata(io.BytesIO(content))
+                key = (data["docId"], data["pageId"])
+                page_nr = int(data["pageNr"])
+            except Exception as e:
+                errors.append(f"{member.filename}: {e}")
+                continue
+
+            documents_in_export.add(key[0])
+            pages_in_export.add(key)
+            existing = existing_pages.get(key)
+            if existing is None:
+                pages["add"] += 1
+            elif (
+                existing[1] == page_nr
+                and existing[2] == compute_content_digest(content)
+                and existing[3] is not None
+            ):
+                pages["unchanged"] += 1
+            else:
+                pages["update"] += 1
+                changed_page_ids.append(existing[0])
+
+    removed_documents = existing_documents - documents_in_export if delete_removed else set()
+    deleted_page_ids = [
+        page[0]
+        for key, page in existing_pages.items()
+        if key not in pages_in_export
+        and (key[0] in documents_in_export or key[0] in removed_documents)
+    ]
+    pages["delete"] = len(deleted_page_ids)
+
+    tags = {"resync": 0, "delete": 0, "assignments_lost": 0, "parked_lost": 0}
+    if force_recreate_tags:
+        project_tags = PageTag.objects.filter(project=project)
+        tags["resync"] = project_tags.count()
+        tags["assignments_lost"] = project_tags.filter(dictionary_entry__isnull=False).count()
+        tags["parked_lost"] = project_tags.filter(is_parked=True).count()
+    else:
+        for page_ids in batched(changed_page_ids, 500):
+            tags["resync"] += PageTag.objects.filter(page_id__in=page_ids).count()
+    for page_ids in batched(deleted_page_ids, 500):
+        deleted_tags = PageTag.objects.filter(page_id__in=page_ids)
+        tags["delete"] += deleted_tags.count()
+        if not force_recreate_tags:
+            tags["assignments_lost"] += deleted_tags.filter(dictionary_entry__isnull=False).count()
+            tags["parked_lost"] += deleted_tags.filter(is_parked=True).count()
+
+    return {
+        "documents": {
+            "add": sorted(documents_in_export - existing_documents),
+            "update": len(documents_in_export & existing_documents),
+            "delete": sorted(removed_documents),
+        },
+        "pages": pages,
+        "tags": tags,
+        "errors": errors,
+    }
 
-    # Separate page XML files from metadata files
+
+def log_sync_plan(celery_task, plan, duration):
+    """Append the report of a sync plan to the task text."""
+    documents = plan["documents"]
+    text = f"Sync plan computed in {duration:.1f}s. Nothing was changed.\n\n"
+    text += "Documents:\n"
+    text += f"  • To add: {len(documents['add'])}\n"
+    for doc_id in documents["add"][:10]:  # Show first 10
+        text += f"    + {doc_id}\n"
+    text += f"  • To update: {documents['update']}\n"
+    text += f"  • To delete: {len(documents['delete'])}\n"
+    for doc_id in documents["delete"][:10]:  # Show first 10
+        text += f"    - {doc_id}\n"
+    if len(documents["delete"]) > 10:
+        text += f"    ... and {len(documents['delete']) - 10} more\n"
+
+    text += "\nPages:\n"
+    text += f"  • To add: {plan['pages']['add']}\n"
+    text += f"  • To update: {plan['pages']['update']}\n"
+    text += f"  • Unchanged (skipped): {plan['pages']['unchanged']}\n"
+    text += f"  • To delete: {plan['pages']['delete']}\n"
+
+    text += "\nExisting tags:\n"
+    text += f"  • To re-sync: {plan['tags']['resync']}\n"
+    text += f"  • To delete: {plan['tags']['delete']}\n"
+    text += f"  • Dictionary assignments lost: {plan['tags']['assignments_lost']}\n"
+    text += f"  • Parked statuses lost: {plan['tags']['parked_lost']}\n"
+
+    if plan["errors"]:
+        text += f"\n⚠️  Unreadable page files: {len(plan['errors'])}\n"
+        for error in plan["errors"][:5]:  # Show first 5 errors
+            text += f"  - {error}\n"
+
+    celery_task.log(text)
+
+
+def split_export_files(files, celery_task):
+    """Separate the page XML files of an export from its metadata files.
+
+    Returns:
+        tuple: (page_xml_files, metadata_files)
+    """
     page_xml_files = []
     metadata_files = []
 
-    for file in copied_files:
-        file_str = str(file)
+    for file in files:
+        file_str = get_export_file_path(file)
         if file_str.endswith(("metadata.xml", "mets.xml")):
             metadata_files.append(file)
         else:
             page_xml_files.append(file)
 
-    if celery_task.twf_task:
-        celery_task.twf_task.text += (f"Found {len(metadata_files)} "
-                                      f"metadata files and {len(page_xml_files)} page files.\n")
-        celery_task.twf_task.save(update_fields=["text"])
-
-    stats = {
-        "added": 0,
-        "updated": 0,
-        "deleted": 0,
-        "pages_added": 0,
-        "pages_updated": 0,
-        "pages_deleted": 0,
+    if celery_task and celery_task.twf_task:
+        celery_task.log(
+            f"Found {len(metadata_files)} "
+            f"metadata files and {len(page_xml_files)} page files.\n"
+        )
+
+    return page_xml_files, metadata_files
+
+
+def build_sharded_sync(celery_task, zip_file, shard_size, delete_removed, checkpoint):
+    """Split an export into shards of documents and build the chord which syncs them.
+
+    Each shard holds the page and metadata files of up to shard_size document folders of
+    the export archive. The shards are synced by sync_document_shard_task on any worker,
+    reading their files directly from the archive. Once all shards are done,
+    finish_sharded_sync_task merges their results.
+
+    The shards which were synced before an interruption are recorded in the checkpoint
+    and not synced again (see finish_sharded_sync_task).
+
+    Args:
+        celery_task: The extract_zip_export_task instance
+        zip_file: The downloaded export
+        shard_size: Number of documents per shard
+        delete_removed: If True, delete documents not in the export
+        checkpoint: The checkpoint of the sync
+
+    Returns:
+        celery.chord: The chord to replace the sync task with
+    """
+    with zipfile.ZipFile(zip_file.path, "r") as zip_ref:
+        members = get_valid_zip_members(zip_ref)
+
+    members_by_document = defaultdict(list)
+    for member in members:
+        members_by_document[member.filename.split("/")[0]].append(member.filename)
+    # shard key (its document folders) -> names of the archive members
+    shards = {
+        "|".join(folders): [name for folder in folders for name in members_by_document[folder]]
+        for folders in batched(sorted(members_by_document), shard_size)
     }
+    completed_shards = checkpoint.get("shard_results", {})
+
+    project_id = celery_task.project.id
+    user_id = celery_task.user.id
+    header = [
+        sync_document_shard_task.s(
+            project_id,
+            user_id,
+            member_names=member_names,
+            shard_key=shard_key,
+            shard_number=shard_number,
+            shard_count=len(shards),
+            parent_task_id=celery_task.twf_task.pk,
+            pending_shard_count=len(shards) - len(completed_shards),
+            delete_removed=delete_removed,
+            started_at=checkpoint["started_at"],
+        )
+        for shard_number, (shard_key, member_names) in enumerate(shards.items(), start=1)
+        if shard_key not in completed_shards
+    ]
 
-    # Track document changes for sync history
-    doc_changes = defaultdict(
-        lambda: {
-            "pages": {"added": [], "updated": [], "deleted": []},
-            "metadata_updated": False,
-        }
+    celery_task.log(
+        f"✓ Split {len(members_by_document)} documents into {len(shards)} shard(s) "
+        f"of up to {shard_size} documents.\n"
+    )
+    if completed_shards:
+        celery_task.log(
+            f"↻ {len(shards) - len(header)} shard(s) were synced before the interruption.\n"
+        )
+    celery_task.log("\n")
+
+    # The shards count themselves in the progress of the task object
+    celery_task.twf_task.total_items = len(header)
+    celery_task.twf_task.processed_items = 0
+    celery_task.twf_task.successful_items = 0
+    celery_task.twf_task.failed_items = 0
+    celery_task.twf_task.save(
+        update_fields=["total_items", "processed_items", "successful_items", "failed_items"]
+    )
+    celery_task.update_progress(5, text=f"Syncing {len(header)} shard(s)")
+    # Nothing may be written after the shards started, as it would reset their progress
+    celery_task.flush_progress()
+
+    return chord(
+        header,
+        finish_sharded_sync_task.s(
+            project_id,
+            user_id,
+            delete_removed=delete_removed,
+            extracted_files=len(members),
+        ),
     )
 
-    # Process page XML files
-    total_files = len(page_xml_files)
-    for i, file in enumerate(page_xml_files, start=1):
-        try:
-            data = extract_transkribus_file_metadata(file)
-            doc_id = data["docId"]
-            page_id = data["pageId"]
-            page_nr = data["pageNr"]
 
-            # Track this document
-            documents_in_export.add(doc_id)
+def report_shard_to_parent(parent_task_id, pending_shard_count, failed):
+    """Count a finished shard in the progress of the task object of the sharded sync.
 
-            # Get or create document
-            doc_instance, doc_created = Document.objects.get_or_create(
-                project=project,
-                document_id=doc_id,
-                defaults={"created_by": user, "modified_by": user},
+    Shards finish concurrently, so the counters are incremented in the database.
+    """
+    if not parent_task_id:
+        return
+    Task.objects.filter(pk=parent_task_id).update(
+        processed_items=F("processed_items") + 1,
+        successful_items=F("successful_items") + (0 if failed else 1),
+        failed_items=F("failed_items") + (1 if failed else 0),
+        progress=5 + (F("processed_items") + 1) * 90 / max(1, pending_shard_count),
+    )
+
+
+@shared_task(bind=True, base=BaseTWFTask)
+def sync_document_shard_task(
+    self,
+    project_id,
+    user_id,
+    member_names=(),
+    shard_key="",
+    shard_number=1,
+    shard_count=1,
+    parent_task_id=None,
+    pending_shard_count=1,
+    delete_removed=True,
+    started_at=None,
+    **kwargs,
+):
+    """
+    Sync one shard of documents of a Transkribus export (sharded sync mode).
+
+    The documents and pages of the shard are upserted, removed pages are deleted, and the
+    changed pages are parsed and their tags synced. Removed documents and the sync history
+    are left to finish_sharded_sync_task, which needs the results of all shards.
+
+    A failing shard does not raise, so that the chord callback still runs and can report it.
+
+    Args:
+        project_id: Project ID
+        user_id: User performing sync
+        member_names: Names of the archive members of the shard
+        shard_key: Identifies the shard in the checkpoint of the sync
+        shard_number: Number of the shard (for logging)
+        shard_count: Number of shards of the sync (for logging)
+        parent_task_id: ID of the task object of the sharded sync
+        pending_shard_count: Number of shards synced by the chord
+        delete_removed: If True, delete pages not in the export
+        started_at: Start time of the sync (ISO format)
+        **kwargs: Additional options
+
+    Returns:
+        dict: The shard result, with status 'success' or 'failed'
+    """
+    zip_ref = None
+
+    try:
+        self.log(f"Syncing shard {shard_number}/{shard_count}.\n")
+
+        zip_ref = zipfile.ZipFile(self.project.downloaded_zip_file.path, "r")
+        files = [zip_ref.getinfo(name) for name in member_names]
+        page_xml_files, metadata_files = split_export_files(files, self)
+
+        with self.phase("sync_documents"):
+            engine = DocumentPageSyncEngine(
+                self.project,
+                self.user,
+                self,
+                metadata_files,
+                zip_ref=zip_ref,
+                batch_size=self.project.get_sync_configuration()["sync_batch_size"],
+                started_at=parse_datetime(started_at) if started_at else None,
+                preload=False,
             )
+            engine.sync_page_files(page_xml_files)
+            if delete_removed:
+                engine.delete_removed_pages()
+
+        changed_page_ids = engine.stats["changed_page_ids"]
+        with self.phase("enrich_metadata"):
+            enrich_documents_with_api_metadata(
+                self.project, engine.documents_in_export, self.user, self
+            )
+        with self.phase("parse"):
+            parse_pages(self.project, self.user, self, page_ids=changed_page_ids)
 
-            if doc_created:
-                stats["added"] += 1
-                if celery_task.twf_task:
-                    celery_task.twf_task.text += f"  + Created new document {doc_id}\n"
-            else:
-                stats["updated"] += 1
-
-            # Extract and update document metadata if available
-            if metadata_files:
-                document_metadata = parse_metadata_files(metadata_files, doc_id)
-                if document_metadata:
-                    # Set document title if available and not already set
-                    if "title" in document_metadata and not doc_instance.title:
-                        doc_instance.title = document_metadata["title"]
-
-                    # Update metadata field
-                    if hasattr(doc_instance, "metadata"):
-                        existing_metadata = doc_instance.metadata or {}
-                        if "transkribus" not in existing_metadata:
-                            existing_metadata["transkribus"] = {}
-                        existing_metadata["transkribus"].update(document_metadata)
-                        doc_instance.metadata = existing_metadata
-                        doc_changes[doc_instance.id]["metadata_updated"] = True
-
-                    doc_instance.save(current_user=user)
-
-            # Get or create page
-            page_instance, page_created = Page.objects.get_or_create(
-                document=doc_instance,
-                tk_page_id=page_id,
-                tk_page_number=page_nr,
-                defaults={"created_by": user, "modified_by": user},
+        # Import here to avoid circular import
+        from twf.tasks.tags_tasks import smart_sync_tags
+
+        with self.phase("tag_sync"):
+            tag_changes = smart_sync_tags(
+                self.project, self.user, self, page_ids=changed_page_ids
             )
-            pages_in_export[doc_instance.id].add(page_id)
 
-            # Update the page XML file
-            with open(file, "rb") as f:
-                file_name = os.path.basename(str(file))
-                page_instance.xml_file.save(file_name, f, save=False)
+        stats = {key: value for key, value in engine.stats.items() if key != "changed_page_ids"}
+        self.end_task(
+            status="SUCCESS",
+            parent_task=parent_task_id,
+            **get_sync_result_meta(len(files), stats, tag_changes),
+        )
+        report_shard_to_parent(parent_task_id, pending_shard_count, failed=False)
+        return {
+            "status": "success",
+            "shard_key": shard_key,
+            "shard_number": shard_number,
+            "task_id": self.twf_task.pk,
+            "stats": stats,
+            "tag_changes": tag_changes,
+            "doc_changes": dict(engine.doc_changes),
+            "created_documents": sorted(engine.created_documents),
+            "documents_in_export": sorted(engine.documents_in_export),
+        }
 
-            # Store TranskribusMetadata in page.metadata under 'transkribus' key
-            if hasattr(page_instance, "metadata"):
-                existing_metadata = page_instance.metadata or {}
+    except Exception as e:
+        error_msg = f"Shard {shard_number}/{shard_count}: {e}"
+        logger.error(f"Error in sync_document_shard_task: {error_msg}")
+        self.end_task(status="FAILURE", error_msg=error_msg, parent_task=parent_task_id)
+        report_shard_to_parent(parent_task_id, pending_shard_count, failed=True)
+        return {
+            "status": "failed",
+            "shard_key": shard_key,
+            "shard_number": shard_number,
+            "task_id": self.twf_task.pk if self.twf_task else None,
+            "error": error_msg,
+        }
 
-                # Create or update the "transkribus" key
-                if "transkribus" not in existing_metadata:
-                    existing_metadata["transkribus"] = {}
+    finally:
+        if zip_ref is not None:
+            zip_ref.close()
 
-                # Store all extracted TranskribusMetadata attributes
-                existing_metadata["transkribus"].update(data)
-                page_instance.metadata = existing_metadata
 
-            page_instance.save(current_user=user)
+@shared_task(bind=True, base=ChordCallbackTWFTask)
+def finish_sharded_sync_task(
+    self,
+    shard_results,
+    project_id,
+    user_id,
+    delete_removed=True,
+    extracted_files=0,
+    **kwargs,
+):
+    """
+    Merge the results of a sharded sync (chord callback).
 
-            if page_created:
-                stats["pages_added"] += 1
-                doc_changes[doc_instance.id]["pages"]["added"].append(page_instance.id)
-            else:
-                stats["pages_updated"] += 1
-                doc_changes[doc_instance.id]["pages"]["updated"].append(
-                    page_instance.id
-                )
+    The callback replaces extract_zip_export_task and runs under its task id, so it
+    continues the task object of the sync. It merges the statistics and the logs of all
+    shards, writes the sync history and deletes the documents which are no longer in the
+    export. No documents are deleted if a shard failed, as its documents would count as
+    removed.
+
+    The results of the successful shards are kept in the checkpoint when a shard failed,
+    so that a resumed sync only syncs the failed shards again.
+
+    Args:
+        shard_results: Results of the sync_document_shard_task shards (chord header)
+        project_id: Project ID
+        user_id: User performing sync
+        delete_removed: If True, delete documents not in the export
+        extracted_files: Number of files in the export
+        **kwargs: Additional options
 
-            # Advance progress
-            progress = (i / total_files) * 30  # Allocate 30% for document/page sync
-            celery_task.update_progress(
-                32 + progress,
-                text=f"Processing file {i}/{total_files}: document {doc_id}",
+    Returns:
+        dict: Comprehensive statistics about the sync operation
+    """
+    try:
+        # Keep the shard counters written by the shards
+        self.processed_items = self.twf_task.processed_items
+        self.successful_items = self.twf_task.successful_items
+        self.failed_items = self.twf_task.failed_items
+
+        self.log("=" * 60 + "\n")
+        self.log("MERGE SHARD RESULTS\n")
+        self.log("=" * 60 + "\n\n")
+
+        merge_shard_logs(self, shard_results)
+
+        # Shards synced before an interruption; their sync history is already written
+        completed_shards = self.get_checkpoint().get("shard_results", {})
+        results = list(completed_shards.values()) + list(shard_results)
+
+        doc_changes = defaultdict(int)
+        tag_changes = defaultdict(int)
+        tag_changes["warnings"] = []
+        history = {}
+        created_documents = set()
+        documents_in_export = set()
+        failures = []
+
+        for result in results:
+            if not isinstance(result, dict) or result.get("status") != "success":
+                failures.append(result.get("error") if isinstance(result, dict) else str(result))
+                continue
+            completed_shards[result["shard_key"]] = {**result, "doc_changes": {}}
+            for key, value in result["stats"].items():
+                doc_changes[key] += value
+            for key, value in result["tag_changes"].items():
+                tag_changes[key] += value
+            history.update(result["doc_changes"])
+            created_documents.update(result["created_documents"])
+            documents_in_export.update(result["documents_in_export"])
+
+        documents = {
+            document.document_id: document
+            for document in Document.objects.filter(project=self.project)
+        }
+        create_sync_history(
+            history, documents, created_documents, self.project, self.user, self.twf_task
+        )
+
+        if delete_removed and not failures:
+            removed_documents = [
+                document
+                for doc_id, document in documents.items()
+                if doc_id not in documents_in_export
+            ]
+            pages_by_document = defaultdict(list)
+            for page in Page.objects.filter(document__in=removed_documents).select_related(
+                "document"
+            ):
+                pages_by_document[page.document.document_id].append(page)
+            deleted, pages_deleted = delete_documents_with_pages(
+                removed_documents, pages_by_document, self.project, self.user, self
             )
+            doc_changes["deleted"] += deleted
+            doc_changes["pages_deleted"] += pages_deleted
+        elif delete_removed:
+            self.log("⚠️  Removed documents are not deleted because a shard failed.\n")
+
+        log_document_sync_summary(self, doc_changes)
+        log_tag_sync_summary(self, tag_changes)
+
+        if failures:
+            for failure in failures:
+                self.log(f"❌ {failure}\n")
+            self.save_checkpoint(shard_results=completed_shards)
+            error_msg = f"{len(failures)} of {len(results)} shard(s) failed"
+            self.end_task(status="FAILURE", error_msg=error_msg)
+            raise RuntimeError(error_msg)
+
+        self.log("=" * 60 + "\n")
+        self.log("SYNC COMPLETED SUCCESSFULLY\n")
+        self.log("=" * 60 + "\n")
 
-        except Exception as e:
-            error_msg = f"Failed to process file {file}: {e}"
-            logger.warning(error_msg)
-            if celery_task.twf_task:
-                celery_task.twf_task.text += f"  ✗ Error: {error_msg}\n"
+        self.end_task(
+            status="SUCCESS", **get_sync_result_meta(extracted_files, doc_changes, tag_changes)
+        )
+        schedule_tag_suggestions_after_sync(self)
+
+        return {
+            "status": "completed",
+            "extracted_files": extracted_files,
+            "doc_changes": dict(doc_changes),
+            "tag_changes": dict(tag_changes),
+        }
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Error in finish_sharded_sync_task: {error_msg}")
+        if self.twf_task.status != "FAILURE":
+            self.end_task(status="FAILURE", error_msg=error_msg)
+        raise
+
+
+def merge_shard_logs(celery_task, shard_results):
+    """Append the logs of the shard task objects to the log of the sharded sync.
+
+    The logs of failed shards are always kept, those of successful shards only at the
+    LOG_PROGRESS verbosity.
+    """
+    shard_tasks = Task.objects.in_bulk(
+        [result["task_id"] for result in shard_results if result.get("task_id")]
+    )
+    for result in sorted(shard_results, key=lambda result: result.get("shard_number", 0)):
+        shard_task = shard_tasks.get(result.get("task_id"))
+        if shard_task is None:
+            continue
+        level = LOG_PROGRESS if result.get("status") == "success" else LOG_SUMMARY
+        celery_task.log(
+            f"--- Shard {result.get('shard_number')} (task {shard_task.celery_task_id}) ---\n",
+            level,
+        )
+        celery_task.log(shard_task.get_log_text() + "\n", level)
+
+
+def get_export_fingerprint(project, **options):
+    """Identify the downloaded export and the sync options for resuming a sync.
+
+    Returns:
+        str: The fingerprint, or None if there is no downloaded export
+    """
+    zip_file = project.downloaded_zip_file
+    if not zip_file or not os.path.exists(zip_file.path):
+        return None
+    stat = os.stat(zip_file.path)
+    parts = [zip_file.name, str(stat.st_size), str(int(stat.st_mtime))]
+    parts += [f"{key}={value}" for key, value in sorted(options.items())]
+    return "|".join(parts)
 
-    # Enrich documents with API metadata (labels, tags, excluded status)
-    enrich_documents_with_api_metadata(project, documents_in_export, user, celery_task)
 
-    # Parse all pages
-    parse_pages(project, user, celery_task)
+def load_sync_checkpoint(celery_task, fingerprint):
+    """Return the checkpoint to resume a sync from, or start a new one.
 
-    # Handle deleted pages within existing documents (if enabled)
-    if delete_removed:
-        for doc_internal_id, seen_page_ids in pages_in_export.items():
+    The checkpoint is taken from the task object itself (a redelivered task) or from
+    the latest failed or cancelled sync of the project with the same fingerprint, i.e.
+    the same export file and options. A sync which is still running is never taken
+    over. A checkpoint taken over from an earlier task is removed from that task, so
+    that it is only resumed once.
+    """
+    checkpoint = celery_task.get_checkpoint() if fingerprint else {}
+    if checkpoint.get("fingerprint") != fingerprint:
+        checkpoint = {}
+
+    if fingerprint and not checkpoint:
+        previous_task = (
+            Task.objects.filter(
+                project=celery_task.project, meta__checkpoint__fingerprint=fingerprint
+            )
+            .exclude(pk=celery_task.twf_task.pk)
+            .filter(status__in=["FAILURE", "CANCELED"])
+            .order_by("-start_time")
+            .first()
+        )
+        if previous_task:
+            checkpoint = previous_task.meta.pop("checkpoint")
+            previous_task.save(update_fields=["meta"])
+
+    if checkpoint:
+        celery_task.log(
+            f"↻ Resuming interrupted sync (last finished phase: {checkpoint.get('phase') or 'none'}, "
+            f"{checkpoint.get('processed_files', 0)} page files synced).\n\n"
+        )
+    else:
+        checkpoint = {
+            "fingerprint": fingerprint,
+            "started_at": timezone.now().isoformat(),
+            "phase": None,
+            "processed_files": 0,
+        }
+
+    celery_task.save_checkpoint(**checkpoint)
+    return checkpoint
+
+
+def is_phase_done(checkpoint, phase):
+    """Return True if the checkpoint is at or past the given sync phase."""
+    done = checkpoint.get("phase")
+    return done in SYNC_PHASES and SYNC_PHASES.index(done) >= SYNC_PHASES.index(phase)
+
+
+def get_checkpoint_start(checkpoint):
+    """Return the start time of the (possibly interrupted) sync of a checkpoint."""
+    started_at = checkpoint.get("started_at")
+    return parse_datetime(started_at) if started_at else timezone.now()
+
+
+class DocumentPageSyncEngine:
+    """
+    Bulk synchronization of documents and pages with a Transkribus export.
+
+    The existing documents and pages of the project are preloaded into in-memory maps,
+    keyed by document_id and (document_id, tk_page_id). The page files are then processed
+    in batches: new documents and pages are inserted with bulk_create, changed ones are
+    written with bulk_update. The bulk operations bypass TimeStampedModel.save, so
+    created_by, modified_by and modified_at are set explicitly.
+
+    A shard of a sharded sync only covers some documents of the project. With
+    preload=False, the documents and their pages are loaded batch by batch instead, for
+    the documents found in the batch.
+    """
+
+    DOCUMENT_UPDATE_FIELDS = ["title", "metadata", "modified_at", "modified_by"]
+    PAGE_UPDATE_FIELDS = [
+        "tk_page_number",
+        "xml_file",
+        "xml_digest",
+        "metadata",
+        "modified_at",
+        "modified_by",
+    ]
+
+    def __init__(
+        self,
+        project,
+        user,
+        celery_task,
+        metadata_files,
+        zip_ref=None,
+        batch_size=500,
+        started_at=None,
+        preload=True,
+    ):
+        """
+        Initialize the engine and preload the project's documents and pages.
+
+        Args:
+            project: Project object
+            user: User performing the sync
+            celery_task: BaseTWFTask instance for progress tracking
+            metadata_files: List of metadata.xml and mets.xml files of the export
+            zip_ref: Open ZipFile of the export (streaming mode only)
+            batch_size: Number of page files to process per batch
+            started_at: Start time of the sync, earlier if it resumes an interrupted sync
+            preload: If False, load the documents of each batch instead of all documents
+        """
+        self.project = project
+        self.user = user
+        self.celery_task = celery_task
+        self.metadata_files = metadata_files
+        self.zip_ref = zip_ref
+        self.batch_size = max(1, int(batch_size or 500))
+        self.started_at = started_at or timezone.now()
+
+        # Parse every metadata file once, instead of once per page
+        self.metadata_index = build_metadata_index(metadata_files, zip_ref)
+
+        # document_id -> Document
+        self.documents = {}
+        # (document_id, tk_page_id) -> Page
+        self.pages = {}
+        # document_ids loaded so far, None if all documents of the project are loaded
+        self.loaded_document_ids = None
+        if preload:
+            self.index_documents(
+                Document.objects.filter(project=project),
+                Page.objects.filter(document__project=project),
+            )
+        else:
+            self.loaded_document_ids = set()
+
+        self.documents_in_export = set()
+        self.pages_in_export = set()
+        self.created_documents = set()
+        self.processed_files = 0
+
+        self.stats = {
+            "added": 0,
+            "updated": 0,
+            "deleted": 0,
+            "pages_added": 0,
+            "pages_updated": 0,
+            "pages_unchanged": 0,
+            "pages_deleted": 0,
+            "changed_page_ids": set(),
+        }
+
+        # Track document changes for sync history, keyed by document_id
+        self.doc_changes = defaultdict(
+            lambda: {
+                "pages": {"added": [], "updated": [], "unchanged": [], "deleted": []},
+                "metadata_updated": False,
+            }
+        )
+
+    def index_documents(self, documents, pages):
+        """Add documents and their pages to the in-memory maps."""
+        documents_by_pk = {}
+        for document in documents:
+            document.project = self.project
+            self.documents[document.document_id] = document
+            documents_by_pk[document.pk] = document
+
+        for page in pages.defer("parsed_data"):
+            document = documents_by_pk[page.document_id]
+            page.document = document
+            self.pages[(document.document_id, page.tk_page_id)] = page
+
+    def load_documents(self, doc_ids):
+        """Load the given documents and their pages, unless they are loaded already."""
+        if self.loaded_document_ids is None:
+            return
+        missing = set(doc_ids) - self.loaded_document_ids
+        if not missing:
+            return
+        self.loaded_document_ids |= missing
+        documents = list(Document.objects.filter(project=self.project, document_id__in=missing))
+        self.index_documents(documents, Page.objects.filter(document__in=documents))
+
+    def log(self, text, level=LOG_SUMMARY):
+        """Append a line to the task text, see BaseTWFTask.log."""
+        self.celery_task.log(text, level)
+
+    def log_item(self, text):
+        """Append a line about a single document or page to the task text."""
+        self.celery_task.log_item(text)
+
+    def sync_page_files(self, page_files, resume_from=0):
+        """Synchronize all page files, batch by batch.
+
+        The files are sorted, so that a resumed sync processes them in the same order.
+        After each batch, the number of synced files is saved to the task's checkpoint.
+
+        Args:
+            page_files: List of page XML files
+            resume_from: Number of files synced before an interruption
+        """
+        page_files = sorted(page_files, key=get_export_file_path)
+        total_files = len(page_files)
+        if resume_from:
+            self.replay_page_files(page_files[:resume_from])
+
+        for start in range(resume_from, total_files, self.batch_size):
+            self.sync_batch(page_files[start:start + self.batch_size], total_files)
+            self.celery_task.save_checkpoint(processed_files=self.processed_files)
+
+    def replay_page_files(self, page_files):
+        """Restore the state of the page files synced before an interruption.
+
+        Nothing is written. Whether a document or page was added, updated or left
+        unchanged is derived from its timestamps relative to the start of the sync.
+        """
+        for file in page_files:
+            self.processed_files += 1
             try:
-                doc = Document.objects.get(id=doc_internal_id)
-                pages_to_delete = Page.objects.filter(document=doc).exclude(
-                    tk_page_id__in=seen_page_ids
+                data = extract_transkribus_file_metadata(
+                    io.BytesIO(read_export_file(file, self.zip_ref))
                 )
-                deleted_count = pages_to_delete.count()
-                if deleted_count > 0:
-                    for page in pages_to_delete:
-                        doc_changes[doc_internal_id]["pages"]["deleted"].append(page.id)
-                    stats["pages_deleted"] += deleted_count
-                    pages_to_delete.delete()
-                    if celery_task.twf_task:
-                        celery_task.twf_task.text += (
-                            f"  - Deleted {deleted_count} removed page(s) "
-                            f"from document {doc.document_id}\n"
-                        )
-            except Document.DoesNotExist:
-                pass
-
-    # Handle deleted documents (if enabled)
-    if delete_removed:
-        all_project_docs = Document.objects.filter(project=project)
-        for doc in all_project_docs:
-            if doc.document_id not in documents_in_export:
-                # Document was removed from Transkribus
-                stats["deleted"] += 1
-
-                # Count deleted pages
-                deleted_page_count = doc.pages.count()
-                stats["pages_deleted"] += deleted_page_count
-
-                # Create sync history before deletion
-                DocumentSyncHistory.objects.create(
-                    document=doc,
-                    task=celery_task.twf_task,
-                    project=project,
-                    user=user,
-                    sync_type="deleted",
-                    changes={
-                        "pages": {
-                            "deleted": list(doc.pages.values_list("id", flat=True))
-                        },
-                        "reason": "Document not present in Transkribus export",
-                    },
-                    created_by=user,
-                    modified_by=user,
+                doc_id, page_id = data["docId"], data["pageId"]
+            except Exception:
+                continue
+
+            self.load_documents([doc_id])
+            document = self.documents.get(doc_id)
+            if document is None:
+                continue
+            if doc_id not in self.documents_in_export:
+                self.documents_in_export.add(doc_id)
+                if document.created_at >= self.started_at:
+                    self.stats["added"] += 1
+                    self.created_documents.add(doc_id)
+                else:
+                    self.stats["updated"] += 1
+                    if document.modified_at >= self.started_at:
+                        self.doc_changes[doc_id]["metadata_updated"] = True
+
+            key = (doc_id, page_id)
+            self.pages_in_export.add(key)
+            page = self.pages.get(key)
+            if page is None:
+                continue
+            if page.created_at >= self.started_at:
+                self.stats["pages_added"] += 1
+                self.stats["changed_page_ids"].add(page.id)
+                self.doc_changes[doc_id]["pages"]["added"].append(page.id)
+            elif page.modified_at >= self.started_at:
+                self.stats["pages_updated"] += 1
+                self.stats["changed_page_ids"].add(page.id)
+                self.doc_changes[doc_id]["pages"]["updated"].append(page.id)
+            else:
+                self.stats["pages_unchanged"] += 1
+                self.doc_changes[doc_id]["pages"]["unchanged"].append(page.id)
+
+        self.log(f"Restored the state of {len(page_files)} page files synced before the interruption.\n")
+
+    def sync_batch(self, batch, total_files):
+        """Read a batch of page files and upsert their documents and pages."""
+        records = []
+        for file in batch:
+            self.processed_files += 1
+            try:
+                content = read_export_file(file, self.zip_ref)
+                data = extract_transkribus_file_metadata(io.BytesIO(content))
+                records.append(
+                    {
+                        "file": file,
+                        "content": content,
+                        "data": data,
+                        "doc_id": data["docId"],
+                        "page_id": data["pageId"],
+                        "page_nr": data["pageNr"],
+                    }
                 )
+            except Exception as e:
+                error_msg = f"Failed to process file {get_export_file_path(file)}: {e}"
+                logger.warning(error_msg)
+                self.log(f"  ✗ Error: {error_msg}\n")
+
+        self.load_documents(record["doc_id"] for record in records)
+        with transaction.atomic():
+            self.upsert_documents(records)
+            self.upsert_pages(records)
+
+        progress = (self.processed_files / total_files) * 30  # Allocate 30% for document/page sync
+        last_doc_id = records[-1]["doc_id"] if records else ""
+        self.celery_task.update_progress(
+            32 + progress,
+            text=f"Processing file {self.processed_files}/{total_files}: document {last_doc_id}",
+        )
 
-                if celery_task.twf_task:
-                    celery_task.twf_task.text += (
-                        f"  - Deleted document {doc.document_id} (not in export)\n"
-                    )
+    def upsert_documents(self, records):
+        """Create the new documents of a batch and update the metadata of existing ones."""
+        new_documents = []
+        changed_documents = []
 
-                doc.delete()
+        for record in records:
+            doc_id = record["doc_id"]
+            if doc_id in self.documents_in_export:
+                continue
+            self.documents_in_export.add(doc_id)
 
-    # Create sync history for processed documents
-    for doc_id, changes in doc_changes.items():
-        try:
-            document = Document.objects.get(id=doc_id)
-
-            # Determine if this is a new document or updated
-            sync_type = (
-                "created"
-                if document.id
-                not in [d.id for d in Document.objects.filter(project=project)]
-                else "updated"
-            )
+            document = self.documents.get(doc_id)
+            doc_created = document is None
+            if doc_created:
+                document = Document(
+                    project=self.project,
+                    document_id=doc_id,
+                    created_by=self.user,
+                    modified_by=self.user,
+                )
+                self.documents[doc_id] = document
+                new_documents.append(document)
+                self.stats["added"] += 1
+                self.log_item(f"  + Created new document {doc_id}\n")
+            else:
+                self.stats["updated"] += 1
+
+            if self.apply_document_metadata(document, doc_id) and not doc_created:
+                document.modified_by = self.user
+                document.modified_at = timezone.now()
+                changed_documents.append(document)
+
+        Document.objects.bulk_create(new_documents, batch_size=self.batch_size)
+        self.created_documents.update(document.document_id for document in new_documents)
+        Document.objects.bulk_update(
+            changed_documents, self.DOCUMENT_UPDATE_FIELDS, batch_size=self.batch_size
+        )
+
+    def apply_document_metadata(self, document, doc_id):
+        """Merge the indexed export metadata into a document.
+
+        Returns:
+            bool: True if the title or the metadata of the document changed
+        """
+        if not self.metadata_files:
+            return False
+        document_metadata = get_indexed_metadata(
+            self.metadata_index, self.metadata_files, doc_id, self.zip_ref
+        )
+        if not document_metadata:
+            return False
+
+        changed = False
+
+        # Set document title if available and not already set
+        if "title" in document_metadata and not document.title:
+            document.title = document_metadata["title"]
+            changed = True
 
-            # Only create history if there were actual changes
+        # Update metadata field
+        existing_metadata = document.metadata or {}
+        if "transkribus" not in existing_metadata:
+            existing_metadata["transkribus"] = {}
+        old_transkribus_metadata = dict(existing_metadata["transkribus"])
+        existing_metadata["transkribus"].update(document_metadata)
+        document.metadata = existing_metadata
+        if existing_metadata["transkribus"] != old_transkribus_metadata:
+            changed = True
+            self.doc_changes[doc_id]["metadata_updated"] = True
+
+        return changed
+
+    def upsert_pages(self, records):
+        """Create the new pages of a batch and update the changed ones.
+
+        The PAGE XML is kept in the content-addressed store, so identical content is only
+        stored once. Pages whose PAGE XML has the same digest as in the last sync are
+        skipped: no file write, no parsing, no tag sync. Pages written since the sync started (by an
+        interrupted run) are never skipped, they may not have been parsed yet.
+        """
+        new_pages = []
+        changed_pages = []
+        released_files = []
+        reference_deltas = Counter()
+        now = timezone.now()
+
+        for record in records:
+            doc_id = record["doc_id"]
+            key = (doc_id, record["page_id"])
+            self.pages_in_export.add(key)
+
+            page = self.pages.get(key)
+            xml_digest = compute_content_digest(record["content"])
             if (
-                changes["pages"]["added"]
-                or changes["pages"]["updated"]
-                or changes["metadata_updated"]
+                page is not None
+                and page.tk_page_number == int(record["page_nr"])
+                and page.modified_at < self.started_at
+                and is_page_unchanged(page, xml_digest)
             ):
-                DocumentSyncHistory.objects.create(
+                self.stats["pages_unchanged"] += 1
+                self.doc_changes[doc_id]["pages"]["unchanged"].append(page.id)
+                continue
+
+            if page is None:
+                page = Page(
+                    document=self.documents[doc_id],
+                    tk_page_id=record["page_id"],
+                    created_by=self.user,
+                )
+                self.pages[key] = page
+                new_pages.append(page)
+            else:
+                # The file of the last sync is released once the batch is written
+                released_files.append(page.xml_file.name)
+                changed_pages.append(page)
+
+            page.tk_page_number = record["page_nr"]
+            page.xml_file = store_page_xml(record["content"], xml_digest)
+            page.xml_digest = xml_digest
+            reference_deltas[xml_digest] += 1
+
+            # Store TranskribusMetadata in page.metadata under 'transkribus' key
+            existing_metadata = page.metadata or {}
+            if "transkribus" not in existing_metadata:
+                existing_metadata["transkribus"] = {}
+            existing_metadata["transkribus"].update(record["data"])
+            page.metadata = existing_metadata
+
+            page.modified_by = self.user
+            page.modified_at = now
+
+        Page.objects.bulk_create(new_pages, batch_size=self.batch_size)
+        Page.objects.bulk_update(changed_pages, self.PAGE_UPDATE_FIELDS, batch_size=self.batch_size)
+        adjust_page_xml_references(reference_deltas)
+        release_page_xml_files(released_files)
+
+        for page in new_pages:
+            self.stats["pages_added"] += 1
+            self.stats["changed_page_ids"].add(page.id)
+            self.doc_changes[page.document.document_id]["pages"]["added"].append(page.id)
+        for page in changed_pages:
+            self.stats["pages_updated"] += 1
+            self.stats["changed_page_ids"].add(page.id)
+            self.doc_changes[page.document.document_id]["pages"]["updated"].append(page.id)
+
+    def delete_removed_pages(self):
+        """Delete the pages of synced documents which are no longer in the export."""
+        removed_pages = defaultdict(list)
+        for key, page in self.pages.items():
+            doc_id = key[0]
+            if doc_id in self.documents_in_export and key not in self.pages_in_export:
+                removed_pages[doc_id].append(page)
+
+        page_ids = []
+        for doc_id, pages in removed_pages.items():
+            for page in pages:
+                self.doc_changes[doc_id]["pages"]["deleted"].append(page.id)
+                page_ids.append(page.id)
+            self.stats["pages_deleted"] += len(pages)
+            self.log_item(f"  - Deleted {len(pages)} removed page(s) from document {doc_id}\n")
+
+        if page_ids:
+            release_page_xml_files(
+                page.xml_file.name for pages in removed_pages.values() for page in pages
+            )
+            Page.objects.filter(id__in=page_ids).delete()
+
+    def delete_removed_documents(self):
+        """Delete the documents which are no longer in the export."""
+        removed_documents = [
+            document
+            for doc_id, document in self.documents.items()
+            if doc_id not in self.documents_in_export
+        ]
+        pages_by_document = defaultdict(list)
+        for (doc_id, _), page in self.pages.items():
+            pages_by_document[doc_id].append(page)
+
+        deleted, pages_deleted = delete_documents_with_pages(
+            removed_documents,
+            pages_by_document,
+            self.project,
+            self.user,
+            self.celery_task,
+            self.batch_size,
+        )
+        self.stats["deleted"] += deleted
+        self.stats["pages_deleted"] += pages_deleted
+
+    def write_sync_history(self):
+        """Create DocumentSyncHistory records for the processed documents."""
+        create_sync_history(
+            self.doc_changes,
+            self.documents,
+            self.created_documents,
+            self.project,
+            self.user,
+            self.celery_task.twf_task,
+            self.batch_size,
+        )
+
+
+def delete_documents_with_pages(
+    removed_documents, pages_by_document, project, user, celery_task, batch_size=500
+):
+    """Delete documents which are no longer in the export, together with their page files.
+
+    Args:
+        removed_documents: List of Document objects to delete
+        pages_by_document: document_id -> list of the document's Page objects
+        project: Project object
+        user: User performing the sync
+        celery_task: BaseTWFTask instance of the sync
+        batch_size: Batch size for the bulk creation of the sync history
+
+    Returns:
+        tuple: (deleted documents, deleted pages)
+    """
+    if not removed_documents:
+        return 0, 0
+
+    pages_deleted = 0
+    history = []
+    for document in removed_documents:
+        # Document was removed from Transkribus
+        pages = pages_by_document[document.document_id]
+        pages_deleted += len(pages)
+
+        # Create sync history before deletion
+        history.append(
+            DocumentSyncHistory(
+                document=document,
+                task=celery_task.twf_task,
+                project=project,
+                user=user,
+                sync_type="deleted",
+                changes={
+                    "pages": {"deleted": [page.id for page in pages]},
+                    "reason": "Document not present in Transkribus export",
+                },
+                created_by=user,
+                modified_by=user,
+            )
+        )
+        celery_task.log_item(f"  - Deleted document {document.document_id} (not in export)\n")
+
+        release_page_xml_files(page.xml_file.name for page in pages)
+
+    DocumentSyncHistory.objects.bulk_create(history, batch_size=batch_size)
+    Document.objects.filter(id__in=[document.id for document in removed_documents]).delete()
+    return len(removed_documents), pages_deleted
+
+
+def create_sync_history(
+    doc_changes, documents, created_documents, project, user, twf_task, batch_size=500
+):
+    """Create DocumentSyncHistory records for the documents of a sync.
+
+    Args:
+        doc_changes: document_id -> changes of the document's pages and metadata
+        documents: document_id -> Document
+        created_documents: document_ids of the documents created by the sync
+        project: Project object
+        user: User performing the sync
+        twf_task: Task object of the sync, or None
+        batch_size: Batch size for the bulk creation
+    """
+    history = []
+    for doc_id, changes in doc_changes.items():
+        document = documents.get(doc_id)
+        if document is None or document.id is None:
+            logger.warning(f"Document {doc_id} not found when creating sync history")
+            continue
+
+        # Determine if this is a new, updated or unchanged document
+        if doc_id in created_documents:
+            sync_type = "created"
+        elif (
+            changes["pages"]["added"]
+            or changes["pages"]["updated"]
+            or changes["metadata_updated"]
+        ):
+            sync_type = "updated"
+        else:
+            sync_type = "unchanged"
+
+        # Only create history if there were actual changes or skipped pages to report
+        if sync_type != "unchanged" or changes["pages"]["unchanged"]:
+            history.append(
+                DocumentSyncHistory(
                     document=document,
-                    task=celery_task.twf_task,
+                    task=twf_task,
                     project=project,
                     user=user,
                     sync_type=sync_type,
@@ -1025,7 +2372,17 @@ def sync_documents_and_pages(
                     created_by=user,
                     modified_by=user,
                 )
-        except Document.DoesNotExist:
-            logger.warning(f"Document {doc_id} not found when creating sync history")
+            )
 
-    return stats
+    DocumentSyncHistory.objects.bulk_create(history, batch_size=batch_size)
+
+
+def is_page_unchanged(page, xml_digest):
+    """Return True if the page already holds a parsed copy of the PAGE XML with this digest."""
+    return (
+        bool(page.xml_digest)
+        and page.xml_digest == xml_digest
+        and page.last_parsed_at is not None
+        and bool(page.xml_file)
+        and page.xml_file.storage.exists(page.xml_file.name)
+    )
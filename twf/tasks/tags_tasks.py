@@ -2,15 +2,20 @@
 
 import logging
 from collections import defaultdict
+from itertools import batched, chain
+
 from celery import shared_task
+from django.db import transaction
 from django.utils import timezone
 
 from twf.models import Page, PageTag, Document, DocumentSyncHistory
 from twf.tasks.task_base import BaseTWFTask
+from twf.tasks.task_log import LOG_SUMMARY
+from twf.utils.tag_suggestions import refresh_tag_suggestions
 from twf.utils.tags_utils import (
-    assign_tag,
     extract_tags_from_parsed_data,
     SmartTagMatcher,
+    TagAssignmentResolver,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,12 +47,12 @@ def create_page_tags(self, project_id, user_id, **kwargs):
         self.set_total_items(total_pages)
 
         if self.twf_task:
-            self.twf_task.text += f"Creating tags for {total_pages} pages.\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"Creating tags for {total_pages} pages.\n")
 
         assigned_tags = 0
         total_tags = 0
         failed_pages = 0
+        resolver = TagAssignmentResolver(self.project)
 
         for page in pages:
             try:
@@ -62,6 +67,7 @@ def create_page_tags(self, project_id, user_id, **kwargs):
                     # Create PageTag with new explicit positional fields
                     tag = PageTag(
                         page=page,
+                        project=self.project,
                         variation=tag_data["variation"],
                         variation_type=tag_data["type"],
                         # New explicit fields (simple-alto-parser v0.0.22+)
@@ -77,7 +83,7 @@ def create_page_tags(self, project_id, user_id, **kwargs):
                             "continued": tag_data.get("continued", False),
                         },
                     )
-                    is_assigned = assign_tag(tag, self.user)
+                    is_assigned = resolver.assign(tag)
                     if is_assigned:
                         assigned_tags += 1
                     total_tags += 1
@@ -102,20 +108,18 @@ def create_page_tags(self, project_id, user_id, **kwargs):
                 logger.error(error_msg)
 
                 if self.twf_task:
-                    self.twf_task.text += f"  ✗ {error_msg}\n"
-                    self.twf_task.save(update_fields=["text"])
+                    self.log(f"  ✗ {error_msg}\n")
 
                 # Continue processing other pages
                 self.advance_task(status="failure")
 
         # Add summary to task text
         if self.twf_task:
-            self.twf_task.text += f"\nTag Creation Summary:\n"
-            self.twf_task.text += f"  • Total tags created: {total_tags}\n"
-            self.twf_task.text += f"  • Tags auto-assigned: {assigned_tags}\n"
-            self.twf_task.text += f"  • Pages processed: {total_pages - failed_pages}\n"
-            self.twf_task.text += f"  • Pages failed: {failed_pages}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"\nTag Creation Summary:\n")
+            self.log(f"  • Total tags created: {total_tags}\n")
+            self.log(f"  • Tags auto-assigned: {assigned_tags}\n")
+            self.log(f"  • Pages processed: {total_pages - failed_pages}\n")
+            self.log(f"  • Pages failed: {failed_pages}\n")
 
         self.end_task()
 
@@ -126,7 +130,44 @@ def create_page_tags(self, project_id, user_id, **kwargs):
         raise
 
 
-def smart_sync_tags(project, user, celery_task):
+@shared_task(bind=True, base=BaseTWFTask)
+def refresh_tag_suggestions_task(self, project_id, user_id, full=False, **kwargs):
+    """
+    Compute the dictionary entry suggestions for the unassigned tags of a project.
+
+    Only the suggestions of new tag texts and of tag types whose dictionaries changed
+    are computed, unless full is True.
+
+    Args:
+        self: Celery task instance
+        project_id: ID of the project to process
+        user_id: ID of the user performing the operation
+        full: If True, recompute all suggestions
+        **kwargs: Additional keyword arguments
+
+    Returns:
+        dict: The number of computed, unchanged and deleted suggestion sets
+    """
+    try:
+        result = refresh_tag_suggestions(self.project, celery_task=self, full=full)
+
+        if self.twf_task:
+            self.log("\nTag Suggestion Summary:\n")
+            self.log(f"  • Tag texts computed: {result['computed']}\n")
+            self.log(f"  • Tag texts unchanged: {result['unchanged']}\n")
+            self.log(f"  • Tag texts removed: {result['deleted']}\n")
+
+        self.end_task(status="SUCCESS", **result)
+        return result
+
+    except Exception as e:
+        error_msg = f"Tag suggestion task failed: {str(e)}"
+        logger.error(error_msg)
+        self.end_task(status="FAILURE", error_msg=error_msg)
+        raise
+
+
+def smart_sync_tags(project, user, celery_task, page_ids=None):
     """
     Smart synchronization of tags, preserving user work.
 
@@ -138,6 +179,7 @@ def smart_sync_tags(project, user, celery_task):
         project: Project object
         user: User performing the sync
         celery_task: BaseTWFTask instance for progress tracking
+        page_ids: Optional collection of Page IDs to sync. If None, all pages are synced.
 
     Returns:
         dict: Statistics about the sync operation:
@@ -151,66 +193,185 @@ def smart_sync_tags(project, user, celery_task):
             'warnings': [str]              # Any issues encountered
         }
     """
-    pages = Page.objects.filter(document__project=project).order_by(
-        "document__document_id", "tk_page_number"
+    engine = SmartTagSyncEngine(
+        project,
+        user,
+        celery_task,
+        batch_size=project.get_sync_configuration()["sync_batch_size"],
     )
-    total_pages = pages.count()
-    celery_task.set_total_items(total_pages)
-
-    matcher = SmartTagMatcher()
-    stats = {
-        "added": 0,
-        "updated": 0,
-        "deleted": 0,
-        "preserved_assignments": 0,
-        "preserved_parked": 0,
-        "auto_assigned": 0,
-        "warnings": [],
-    }
+    return engine.sync(page_ids)
+
 
-    # Track changes per document for DocumentSyncHistory
-    doc_changes = defaultdict(
-        lambda: {
-            "tags": {
-                "added": 0,
-                "updated": 0,
-                "deleted": 0,
-                "preserved_assignments": 0,
-                "preserved_parked": 0,
-                "auto_assigned": 0,
-                "offset_shifts": [],
-            },
-            "transcription_changes": False,
+class SmartTagSyncEngine:
+    """
+    Batched synchronization of the tags of pages with their parsed data.
+
+    The pages are processed in batches. The old tags of a batch are loaded in one query
+    and matched to the new tags with the SmartTagMatcher, page by page as before. The
+    resulting changes are collected in memory and flushed per batch: new tags with
+    bulk_create, matched tags with bulk_update, removed tags with a single delete. The
+    bulk operations bypass TimeStampedModel.save, so created_by, modified_by and
+    modified_at are set explicitly.
+    """
+
+    TAG_UPDATE_FIELDS = [
+        "variation",
+        "region_index",
+        "line_index_in_region",
+        "line_index_global",
+        "line_text",
+        "offset_in_line",
+        "length",
+        "additional_information",
+        "modified_at",
+        "modified_by",
+    ]
+    PAGE_UPDATE_FIELDS = ["num_tags", "modified_at", "modified_by"]
+
+    def __init__(self, project, user, celery_task, batch_size=500):
+        """
+        Initialize the engine.
+
+        Args:
+            project: Project object
+            user: User performing the sync
+            celery_task: BaseTWFTask instance for progress tracking
+            batch_size: Number of pages to process per batch
+        """
+        self.project = project
+        self.user = user
+        self.celery_task = celery_task
+        self.batch_size = max(1, int(batch_size or 500))
+        self.matcher = SmartTagMatcher()
+        self.resolver = TagAssignmentResolver(project)
+
+        self.stats = {
+            "added": 0,
+            "updated": 0,
+            "deleted": 0,
+            "preserved_assignments": 0,
+            "preserved_parked": 0,
+            "auto_assigned": 0,
             "warnings": [],
         }
-    )
 
-    for page in pages:
-        # Get existing tags
-        old_tags = list(PageTag.objects.filter(page=page))
+        # Track changes per document for DocumentSyncHistory, keyed by Document pk
+        self.doc_changes = defaultdict(
+            lambda: {
+                "tags": {
+                    "added": 0,
+                    "updated": 0,
+                    "deleted": 0,
+                    "preserved_assignments": 0,
+                    "preserved_parked": 0,
+                    "auto_assigned": 0,
+                    "offset_shifts": [],
+                },
+                "transcription_changes": False,
+                "warnings": [],
+            }
+        )
+
+    def log(self, text, level=LOG_SUMMARY):
+        """Append a line to the task log, see BaseTWFTask.log."""
+        self.celery_task.log(text, level)
+
+    def log_item(self, text):
+        """Append a line about a single tag or document to the task log."""
+        self.celery_task.log_item(text)
 
-        # Extract new tags from parsed_data
+    def sync(self, page_ids=None):
+        """
+        Synchronize the tags of the project's pages.
+
+        Args:
+            page_ids: Optional collection of Page IDs to sync. If None, all pages are synced.
+
+        Returns:
+            dict: Statistics about the sync operation, see smart_sync_tags
+        """
+        pages = Page.objects.filter(document__project=self.project).order_by(
+            "document__document_id", "tk_page_number"
+        )
+        if page_ids is not None:
+            pages = pages.filter(id__in=page_ids)
+        ordered_ids = list(pages.values_list("id", flat=True))
+        self.celery_task.set_total_items(len(ordered_ids))
+
+        for batch_ids in batched(ordered_ids, self.batch_size):
+            self.sync_batch(batch_ids)
+
+        self.write_sync_history()
+        return self.stats
+
+    def sync_batch(self, batch_ids):
+        """Match the tags of a batch of pages and write the changes in bulk."""
+        pages = {
+            page.id: page
+            for page in Page.objects.filter(id__in=batch_ids).select_related("document")
+        }
+        old_tags_by_page = defaultdict(list)
+        for tag in PageTag.objects.filter(page_id__in=batch_ids):
+            old_tags_by_page[tag.page_id].append(tag)
+
+        to_create = []
+        to_update = []
+        to_delete = []
+        synced_pages = []
+
+        for page_id in batch_ids:
+            page = pages.get(page_id)
+            if page is None:  # Deleted in the meantime
+                continue
+            page.document.project = self.project
+            old_tags = old_tags_by_page.get(page_id, [])
+            for tag in old_tags:
+                tag.page = page
+
+            created, updated, deleted = self.match_page(page, old_tags)
+            to_create.extend(created)
+            to_update.extend(updated)
+            to_delete.extend(deleted)
+
+            page.num_tags = len(old_tags) - len(deleted) + len(created)
+            synced_pages.append(page)
+
+        self.flush(to_create, to_update, to_delete, synced_pages)
+
+        for page in synced_pages:
+            self.celery_task.advance_task(
+                text=f"Synced tags for page {page.tk_page_number}", status="success"
+            )
+
+    def match_page(self, page, old_tags):
+        """
+        Match the old tags of a page to the tags of its parsed data.
+
+        Args:
+            page: Page object
+            old_tags: The existing PageTag objects of the page
+
+        Returns:
+            tuple: (to_create, to_update, to_delete) lists of PageTag objects
+        """
+        doc_changes = self.doc_changes[page.document_id]
         new_tags_data = extract_tags_from_parsed_data(page.parsed_data)
 
-        # Match old → new
-        matches, unmatched_old, unmatched_new = matcher.match_tags(
+        matches, unmatched_old, unmatched_new = self.matcher.match_tags(
             old_tags, new_tags_data, page
         )
 
-        # Clear previous ambiguous matches
-        matcher.clear_ambiguous_matches()
-
-        # Process matches (UPDATE)
+        to_update = []
         for old_tag, new_tag_data, score in matches:
-            preserved_assignment = old_tag.dictionary_entry is not None
+            preserved_assignment = old_tag.dictionary_entry_id is not None
             preserved_parked = old_tag.is_parked
 
             # Check if offset changed (transcription edit)
             old_offset = old_tag.offset_in_line
             new_offset = new_tag_data["offset"]
             if old_offset != new_offset:
-                doc_changes[page.document.id]["transcription_changes"] = True
-                doc_changes[page.document.id]["tags"]["offset_shifts"].append(
+                doc_changes["transcription_changes"] = True
+                doc_changes["tags"]["offset_shifts"].append(
                     {
                         "line": new_tag_data["line_id"],
                         "tag": new_tag_data["variation"],
@@ -220,132 +381,130 @@ def smart_sync_tags(project, user, celery_task):
                 )
 
             # Update tag with new data while preserving user modifications
-            old_tag.variation = new_tag_data["variation"]
-            # Update new explicit positional fields
-            old_tag.region_index = new_tag_data.get("region_index", 0)
-            old_tag.line_index_in_region = new_tag_data.get("line_index_in_region", 0)
-            old_tag.line_index_global = new_tag_data.get("line_index_global", 0)
-            old_tag.line_text = new_tag_data.get("line_text", "")
-            old_tag.offset_in_line = new_tag_data.get("offset", 0)
-            old_tag.length = new_tag_data.get("length", len(new_tag_data["variation"]))
-            # DEPRECATED: Keep additional_information for backward compatibility
-            old_tag.additional_information = {
-                "line_id": new_tag_data.get("line_id", ""),
-                "continued": new_tag_data.get("continued", False),
-            }
             # PRESERVE: dictionary_entry, date_variation_entry, is_parked
-            old_tag.save(current_user=user)
-
-            stats["updated"] += 1
-            doc_changes[page.document.id]["tags"]["updated"] += 1
+            set_tag_data(old_tag, new_tag_data)
+            to_update.append(old_tag)
 
+            self.count(doc_changes, "updated")
             if preserved_assignment:
-                stats["preserved_assignments"] += 1
-                doc_changes[page.document.id]["tags"]["preserved_assignments"] += 1
+                self.count(doc_changes, "preserved_assignments")
             if preserved_parked:
-                stats["preserved_parked"] += 1
-                doc_changes[page.document.id]["tags"]["preserved_parked"] += 1
+                self.count(doc_changes, "preserved_parked")
 
-            if celery_task.twf_task:
-                celery_task.twf_task.text += (
-                    f"  ✓ Matched tag '{old_tag.variation}' on page {page.tk_page_number} "
-                    f"(score: {score})\n"
-                )
+            self.log_item(
+                f"  ✓ Matched tag '{old_tag.variation}' on page {page.tk_page_number} "
+                f"(score: {score})\n"
+            )
 
-        # Process unmatched old (DELETE)
         for old_tag in unmatched_old:
-            if celery_task.twf_task:
-                celery_task.twf_task.text += (f"  - Deleted tag '{old_tag.variation}' from "
-                                              f"page {page.tk_page_number} (removed from TK)\n")
-            old_tag.delete()
-            stats["deleted"] += 1
-            doc_changes[page.document.id]["tags"]["deleted"] += 1
-
-        # Process unmatched new (CREATE)
+            self.log_item(f"  - Deleted tag '{old_tag.variation}' from "
+                          f"page {page.tk_page_number} (removed from TK)\n")
+            self.count(doc_changes, "deleted")
+
+        to_create = []
         for new_tag_data in unmatched_new:
             new_tag = PageTag(
-                page=page,
-                variation=new_tag_data["variation"],
-                variation_type=new_tag_data["type"],
-                # New explicit positional fields (simple-alto-parser v0.0.22+)
-                region_index=new_tag_data.get("region_index", 0),
-                line_index_in_region=new_tag_data.get("line_index_in_region", 0),
-                line_index_global=new_tag_data.get("line_index_global", 0),
-                line_text=new_tag_data.get("line_text", ""),
-                offset_in_line=new_tag_data.get("offset", 0),
-                length=new_tag_data.get("length", len(new_tag_data["variation"])),
-                # DEPRECATED: Keep additional_information for backward compatibility
-                additional_information={
-                    "line_id": new_tag_data.get("line_id", ""),
-                    "continued": new_tag_data.get("continued", False),
-                },
+                page=page, project=self.project, variation_type=new_tag_data["type"]
             )
+            set_tag_data(new_tag, new_tag_data)
 
             # Try auto-assign via Variation
-            was_assigned = assign_tag(new_tag, user)
-            new_tag.save(current_user=user)
-
-            stats["added"] += 1
-            doc_changes[page.document.id]["tags"]["added"] += 1
+            was_assigned = self.resolver.assign(new_tag)
+            to_create.append(new_tag)
 
+            self.count(doc_changes, "added")
             if was_assigned:
-                stats["auto_assigned"] += 1
-                doc_changes[page.document.id]["tags"]["auto_assigned"] += 1
-                if celery_task.twf_task:
-                    celery_task.twf_task.text += (f"  + Created & auto-assigned tag "
-                                                  f"'{new_tag.variation}' on page {page.tk_page_number}\n")
+                self.count(doc_changes, "auto_assigned")
+                self.log_item(f"  + Created & auto-assigned tag "
+                              f"'{new_tag.variation}' on page {page.tk_page_number}\n")
             else:
-                if celery_task.twf_task:
-                    celery_task.twf_task.text += (f"  + Created new tag '{new_tag.variation}' on "
-                                                  f"page {page.tk_page_number} (unassigned)\n")
+                self.log_item(f"  + Created new tag '{new_tag.variation}' on "
+                              f"page {page.tk_page_number} (unassigned)\n")
 
         # Log ambiguous matches
-        ambiguous = matcher.get_ambiguous_matches()
-        if ambiguous:
-            for amb in ambiguous:
-                warning = (
-                    f"Page {amb['page']}, line {amb['line']}: "
-                    f"Ambiguous match for '{amb['old_text']}' → '{amb['new_text']}' (score: {amb['score']})"
+        for amb in self.matcher.get_ambiguous_matches():
+            warning = (
+                f"Page {amb['page']}, line {amb['line']}: "
+                f"Ambiguous match for '{amb['old_text']}' → '{amb['new_text']}' (score: {amb['score']})"
+            )
+            self.stats["warnings"].append(warning)
+            doc_changes["warnings"].append(warning)
+            self.log(f"  ⚠ {warning}\n")
+        self.matcher.clear_ambiguous_matches()
+
+        return to_create, to_update, unmatched_old
+
+    def count(self, doc_changes, key):
+        """Increment a counter in the stats and in the document's changes."""
+        self.stats[key] += 1
+        doc_changes["tags"][key] += 1
+
+    def flush(self, to_create, to_update, to_delete, pages):
+        """Write the collected changes of a batch."""
+        now = timezone.now()
+        for tag in to_create:
+            tag.created_by = self.user
+            tag.modified_by = self.user
+        for obj in chain(to_update, pages):
+            obj.modified_at = now
+            obj.modified_by = self.user
+
+        with transaction.atomic():
+            if to_delete:
+                PageTag.objects.filter(id__in=[tag.id for tag in to_delete]).delete()
+            if to_update:
+                PageTag.objects.bulk_update(
+                    to_update, self.TAG_UPDATE_FIELDS, batch_size=self.batch_size
+                )
+            if to_create:
+                PageTag.objects.bulk_create(to_create, batch_size=self.batch_size)
+            if pages:
+                Page.objects.bulk_update(pages, self.PAGE_UPDATE_FIELDS)
+
+    def write_sync_history(self):
+        """Create a DocumentSyncHistory record for every document with synced pages."""
+        self.log("\n=== Creating sync history records ===\n")
+
+        documents = Document.objects.in_bulk(list(self.doc_changes))
+        histories = []
+        for doc_id, changes in self.doc_changes.items():
+            document = documents.get(doc_id)
+            if document is None:
+                continue
+
+            # Determine sync type
+            any_changes = any(changes["tags"].values())
+            sync_type = "updated" if any_changes else "unchanged"
+
+            histories.append(
+                DocumentSyncHistory(
+                    document=document,
+                    task=self.celery_task.twf_task,
+                    project=self.project,
+                    user=self.user,
+                    sync_type=sync_type,
+                    changes=changes,
+                    created_by=self.user,
+                    modified_by=self.user,
                 )
-                stats["warnings"].append(warning)
-                doc_changes[page.document.id]["warnings"].append(warning)
-                if celery_task.twf_task:
-                    celery_task.twf_task.text += f"  ⚠ {warning}\n"
-
-        # Update page metadata
-        page.num_tags = len(old_tags) - len(unmatched_old) + len(unmatched_new)
-        page.save(current_user=user)
-
-        # Advance progress
-        celery_task.advance_task(
-            text=f"Synced tags for page {page.tk_page_number}", status="success"
-        )
-
-    # Create DocumentSyncHistory records
-    if celery_task.twf_task:
-        celery_task.twf_task.text += "\n=== Creating sync history records ===\n"
-
-    for doc_id, changes in doc_changes.items():
-        document = Document.objects.get(id=doc_id)
-
-        # Determine sync type
-        any_changes = any(changes["tags"].values())
-        sync_type = "updated" if any_changes else "unchanged"
-
-        DocumentSyncHistory.objects.create(
-            document=document,
-            task=celery_task.twf_task,
-            project=project,
-            user=user,
-            sync_type=sync_type,
-            changes=changes,
-            created_by=user,
-            modified_by=user,
-        )
-
-        if celery_task.twf_task:
-            celery_task.twf_task.text += (
-                f"  Created sync history for document {document.document_id}\n"
             )
-
-    return stats
+            self.log_item(f"  Created sync history for document {document.document_id}\n")
+
+        DocumentSyncHistory.objects.bulk_create(histories, batch_size=self.batch_size)
+
+
+def set_tag_data(tag, tag_data):
+    """Set the text and positional fields of a PageTag from extracted tag data."""
+    tag.variation = tag_data["variation"]
+    # New explicit positional fields (simple-alto-parser v0.0.22+)
+    tag.region_index = tag_data.get("region_index", 0)
+    tag.line_index_in_region = tag_data.get("line_index_in_region", 0)
+    tag.line_index_global = tag_data.get("line_index_global", 0)
+    tag.line_text = tag_data.get("line_text", "")
+    tag.offset_in_line = tag_data.get("offset", 0)
+    tag.length = tag_data.get("length", len(tag_data["variation"]))
+    # DEPRECATED: Keep additional_information for backward compatibility
+    tag.additional_information = {
+        "line_id": tag_data.get("line_id", ""),
+        "continued": tag_data.get("continued", False),
+    }
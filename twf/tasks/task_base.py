@@ -10,14 +10,23 @@ The primary class, BaseTWFTask, extends Celery's Task class with TWF-specific tr
 reporting, and AI interaction capabilities.
 """
 
+import cProfile
+import marshal
 import time
 import logging
+from contextlib import contextmanager
 
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import Max
 from django.utils import timezone
 from celery import Task as CeleryTask
 
 from twf.clients.ai_client_adapter import create_ai_client
 from twf.models import Task, Project, User, Document, Page, CollectionItem
+from twf.tasks.task_log import TaskLogBuffer, LOG_SUMMARY, LOG_PROGRESS, LOG_ITEMS
+from twf.tasks.task_phases import PhaseTimer, add_phase_timing
+from twf.tasks.task_progress import ProgressPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +58,12 @@ class BaseTWFTask(CeleryTask):
         "extract_zip_export_task": "Unified synchronization of documents, pages, and tags from "
                                    "Transkribus export. Intelligently preserves user assignments "
                                    "and parked status.",
+        "sync_document_shard_task": "Synchronization of one shard of documents, pages, and tags "
+                                    "of a Transkribus export (sharded sync).",
+        "download_transkribus_export_task": "Download of the Transkribus export "
+                                            "into the project storage.",
+        "refresh_tag_suggestions_task": "Computation of the dictionary entry suggestions "
+                                        "for the unassigned tags.",
         "create_collection": "Creation of a new collection in the project.",
         # AI collection processing tasks
         "search_openai_for_collection": "OpenAI processing of collection items "
@@ -85,6 +100,40 @@ class BaseTWFTask(CeleryTask):
         "copy_project": "Copying of a project to create a new instance.",
     }
 
+    twf_task = None
+    task_log = None
+    progress_publisher = None
+
+    def __call__(self, *args, **kwargs):
+        """Run the task, under cProfile if the profile keyword argument or the
+        TWF_TASK_PROFILE setting is set."""
+        if not kwargs.get("profile", getattr(settings, "TWF_TASK_PROFILE", False)):
+            return super().__call__(*args, **kwargs)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return super().__call__(*args, **kwargs)
+        finally:
+            profiler.disable()
+            self.save_profile(profiler)
+
+    def save_profile(self, profiler):
+        """Attach the statistics of a profiler to the task object.
+
+        The file has the format of cProfile's dump_stats and can be read with pstats.
+        """
+        if not self.twf_task:
+            return
+        profiler.create_stats()
+        self.twf_task.profile_file.save(
+            f"task_{self.twf_task.pk}.prof",
+            ContentFile(marshal.dumps(profiler.stats)),
+            save=False,
+        )
+        self.twf_task.save(update_fields=["profile_file"])
+        self.log(f"Profile saved to {self.twf_task.profile_file.name}.\n")
+
     def before_start(self, task_id, args, kwargs):
         """Initialize project and user before the task starts."""
         self.task_id = task_id
@@ -106,18 +155,36 @@ class BaseTWFTask(CeleryTask):
         # Determine category based on task name
         category = self._get_task_category()
 
-        # Create a new task object in the database
-        self.twf_task = Task.objects.create(
-            celery_task_id=task_id,
-            project=self.project,
-            user=self.user,
-            status="STARTED",
-            task_type="celery",
-            category=category,
-            title=f"Started: {self.name}",
-            description=task_description,
-            text=f"Task initiated at {self.start_datetime.strftime('%Y-%m-%d %H:%M:%S')}.\n",
-        )
+        # A redelivered message (e.g. after the worker was killed) and a task replaced by
+        # a chord keep their task id: reuse the task object, so that its log and checkpoint
+        # carry over
+        self.twf_task = Task.objects.filter(celery_task_id=task_id).first()
+        if self.twf_task:
+            self.start_datetime = self.twf_task.start_time
+            self.twf_task.status = "STARTED"
+            self.twf_task.end_time = None
+            self.twf_task.save(update_fields=["status", "end_time"])
+            last_seq = self.twf_task.log_lines.aggregate(last_seq=Max("seq"))["last_seq"] or 0
+            self.task_log = TaskLogBuffer(
+                self.twf_task, verbosity=kwargs.get("log_verbosity"), last_seq=last_seq
+            )
+            self.log(f"Task resumed at {timezone.now().strftime('%Y-%m-%d %H:%M:%S')}.\n")
+        else:
+            # Create a new task object in the database
+            self.twf_task = Task.objects.create(
+                celery_task_id=task_id,
+                project=self.project,
+                user=self.user,
+                status="STARTED",
+                task_type="celery",
+                category=category,
+                title=f"Started: {self.name}",
+                description=task_description,
+                text=f"Task initiated at {self.start_datetime.strftime('%Y-%m-%d %H:%M:%S')}.\n",
+            )
+            self.task_log = TaskLogBuffer(self.twf_task, verbosity=kwargs.get("log_verbosity"))
+
+        self.progress_publisher = ProgressPublisher(self.write_progress)
 
         logger.info(
             f"Starting task {self.name} (ID: {task_id}) for project {self.project.title}"
@@ -126,6 +193,37 @@ class BaseTWFTask(CeleryTask):
             state="STARTED", meta={"current": 0, "total": 100, "text": "Task started"}
         )
 
+    def after_return(self, status, retval, task_id, args, kwargs, einfo):
+        """Save the pending progress and the buffered log lines, also of a failed task."""
+        self.flush_progress()
+        self.flush_log()
+        super().after_return(status, retval, task_id, args, kwargs, einfo)
+
+    def log(self, text, level=LOG_SUMMARY):
+        """Append text to the task log.
+
+        The text is buffered and saved with the next flush, see TaskLogBuffer. Text
+        above the task's log verbosity is dropped.
+
+        Args:
+            text: The text to append, including its line breaks
+            level: LOG_SUMMARY, LOG_PROGRESS or LOG_ITEMS
+        """
+        if self.task_log:
+            self.task_log.write(text, level)
+
+    def log_item(self, text):
+        """Append a line about a single processed item to the task log.
+
+        Below the LOG_ITEMS verbosity, only a sample of the item lines is kept.
+        """
+        self.log(text, LOG_ITEMS)
+
+    def flush_log(self):
+        """Save the buffered log lines to the task object."""
+        if self.task_log:
+            self.task_log.flush()
+
     def _get_task_category(self):
         """Determine the category of a task based on its name."""
         task_name = self.name.lower()
@@ -139,7 +237,7 @@ class BaseTWFTask(CeleryTask):
             return 'enrichment'
 
         # Import/extraction tasks
-        if any(x in task_name for x in ['extract', 'import', 'load']):
+        if any(x in task_name for x in ['extract', 'import', 'load', 'sync']):
             return 'import'
 
         # Export tasks
@@ -219,10 +317,10 @@ class BaseTWFTask(CeleryTask):
         if self.twf_task and total > 0:
             item_type = self.get_item_type_name()
             self.twf_task.title = f"Processing {total} {item_type}"
-            self.twf_task.text += f"Found {total} {item_type} to process.\n"
+            self.log(f"Found {total} {item_type} to process.\n")
             self.twf_task.total_items = total
             self.twf_task.processed_items = 0
-            self.twf_task.save(update_fields=["title", "text", "total_items", "processed_items"])
+            self.twf_task.save(update_fields=["title", "total_items", "processed_items"])
             logger.info(f"Task {self.task_id}: set to process {total} {item_type}")
 
     def get_item_type_name(self):
@@ -262,7 +360,7 @@ class BaseTWFTask(CeleryTask):
             detailed_text = f"{text} ({self.processed_items}/{self.total_items})"
             self.update_progress(progress, detailed_text)
 
-            # Update text in database with more detail if appropriate
+            # Log the progress with more detail if appropriate
             if (
                 self.processed_items % 10 == 0
                 or self.processed_items == self.total_items
@@ -274,37 +372,102 @@ class BaseTWFTask(CeleryTask):
                         if self.processed_items > 0
                         else 0
                     )
-                    self.twf_task.text += f"Progress: {self.processed_items}/{self.total_items} items processed "
-                    self.twf_task.text += (
-                        f"({elapsed:.1f}s elapsed, {avg_time:.2f}s per item).\n"
+                    self.log(
+                        f"Progress: {self.processed_items}/{self.total_items} items processed "
+                        f"({elapsed:.1f}s elapsed, {avg_time:.2f}s per item).\n",
+                        LOG_PROGRESS,
                     )
-                    # Update database item counters
-                    self.twf_task.processed_items = self.processed_items
-                    self.twf_task.successful_items = self.successful_items
-                    self.twf_task.failed_items = self.failed_items
-                    self.twf_task.save(update_fields=[
-                        "text",
-                        "processed_items",
-                        "successful_items",
-                        "failed_items"
-                    ])
+
+    @contextmanager
+    def phase(self, name):
+        """Measure a phase of the task.
+
+        The wall time, CPU time, number of database queries and database time of the
+        phase are added to the phase's timing in the task's meta (see task_phases).
+        Phases can be nested and repeated.
+
+        Args:
+            name: The name of the phase
+        """
+        timer = PhaseTimer()
+        try:
+            with timer:
+                yield timer
+        finally:
+            if self.twf_task:
+                meta = self.twf_task.meta or {}
+                timing = add_phase_timing(meta.setdefault("phases", []), name, timer)
+                self.twf_task.meta = meta
+                self.twf_task.save(update_fields=["meta"])
+                self.log(
+                    f"Phase {name}: {timer.wall_time:.2f}s ({timer.cpu_time:.2f}s CPU), "
+                    f"{timer.queries.count} queries ({timer.queries.time:.2f}s).\n",
+                    LOG_PROGRESS,
+                )
+                logger.info(f"Task {self.task_id}: phase {name} took {timing}")
+
+    def get_checkpoint(self):
+        """Return the checkpoint stored on the task object, or an empty dict."""
+        if self.twf_task:
+            return dict((self.twf_task.meta or {}).get("checkpoint", {}))
+        return {}
+
+    def save_checkpoint(self, **values):
+        """Merge values into the checkpoint stored on the task object.
+
+        Long-running tasks persist their progress this way, so that a restarted task
+        can continue where the interrupted one stopped. The checkpoint is kept when
+        the task fails and dropped when it succeeds.
+        """
+        if self.twf_task:
+            meta = self.twf_task.meta or {}
+            meta["checkpoint"] = {**meta.get("checkpoint", {}), **values}
+            self.twf_task.meta = meta
+            self.twf_task.save(update_fields=["meta"])
 
     def update_progress(self, progress, text="In progress"):
-        """Update task progress in the database."""
+        """Update task progress.
+
+        The update is written to the result backend and the database when enough time
+        has passed or the progress advanced enough since the last write, see
+        ProgressPublisher.
+        """
         if self.twf_task:
-            self.update_state(
-                state="PROGRESS", meta={"current": progress, "total": 100, "text": text}
-            )
-            self.twf_task.progress = progress
+            self.progress_publisher.publish(progress, text)
 
-            # Update the title to reflect progress
-            if progress < 100:
-                item_type = self.get_item_type_name()
-                if self.total_items:
-                    self.twf_task.title = (f"Processing {self.processed_items}/{self.total_items} "
-                                           f"{item_type} ({progress}%)")
+            # Long phases without log lines still show the lines logged before them
+            if self.task_log:
+                self.task_log.flush_if_due()
+
+    def write_progress(self, progress, text):
+        """Write the task progress and item counters to the result backend and the database."""
+        self.update_state(
+            state="PROGRESS", meta={"current": progress, "total": 100, "text": text}
+        )
+        self.twf_task.progress = progress
 
-            self.twf_task.save(update_fields=["progress", "title"])
+        # Update the title to reflect progress
+        if progress < 100:
+            item_type = self.get_item_type_name()
+            if self.total_items:
+                self.twf_task.title = (f"Processing {self.processed_items}/{self.total_items} "
+                                       f"{item_type} ({progress}%)")
+
+        self.twf_task.processed_items = self.processed_items
+        self.twf_task.successful_items = self.successful_items
+        self.twf_task.failed_items = self.failed_items
+        self.twf_task.save(update_fields=[
+            "progress",
+            "title",
+            "processed_items",
+            "successful_items",
+            "failed_items"
+        ])
+
+    def flush_progress(self):
+        """Write the pending progress update."""
+        if self.progress_publisher:
+            self.progress_publisher.flush()
 
     def process_ai_request(
         self,
@@ -392,9 +555,7 @@ class BaseTWFTask(CeleryTask):
                 logger.error(f"Error processing item with {client_name}: {error_msg}")
 
                 # Add error details to the task text
-                self.twf_task.text += (
-                    f"Error processing item {self.processed_items+1}: {error_msg}\n"
-                )
+                self.log(f"Error processing item {self.processed_items+1}: {error_msg}\n")
 
                 # Track the failure in the progress indicators
                 self.advance_task(
@@ -494,16 +655,16 @@ class BaseTWFTask(CeleryTask):
                 image_count += self._prepare_page_images(pages)
 
             if image_count > 0:
-                self.twf_task.text += f"Included {image_count} images in the prompt.\n"
+                self.log(f"Included {image_count} images in the prompt.\n")
             else:
-                self.twf_task.text += (
-                    "No valid images found in the selected documents.\n"
-                )
+                self.log("No valid images found in the selected documents.\n")
 
                 # If we're in images-only mode but found no images, warn user and fall back to text
                 if is_image_prompt_mode:
-                    self.twf_task.text += ("Warning: No images found but 'Images only' mode selected. "
-                                           "Including text context instead.\n")
+                    self.log(
+                        "Warning: No images found but 'Images only' mode selected. "
+                        "Including text context instead.\n"
+                    )
                     prompt_mode = "text_only"
 
         # Prepare the prompt text based on mode
@@ -526,9 +687,7 @@ class BaseTWFTask(CeleryTask):
                 full_prompt = "Please describe what you see in these images."
 
             # Images-only should NOT include text context
-            self.twf_task.text += (
-                "Images-only mode: Using only images without text context.\n"
-            )
+            self.log("Images-only mode: Using only images without text context.\n")
 
         # Call the API with proper error handling
         try:
@@ -561,9 +720,13 @@ class BaseTWFTask(CeleryTask):
             end_time = timezone.now()
             duration = (end_time - self.start_datetime).total_seconds()
 
+            # The last progress update may not be written yet
+            self.flush_progress()
+
             # Format summary for the task text
             summary = self._generate_task_summary(status, duration, error_msg)
-            self.twf_task.text += summary
+            self.log(summary)
+            self.flush_log()
 
             # Update the final task title with a concise summary
             item_type = self.get_item_type_name()
@@ -597,6 +760,16 @@ class BaseTWFTask(CeleryTask):
             if kwargs:
                 meta.update(kwargs)
 
+            # Keep the checkpoint of a failed task, so that it can be resumed
+            checkpoint = (self.twf_task.meta or {}).get("checkpoint")
+            if checkpoint and status != "SUCCESS":
+                meta["checkpoint"] = checkpoint
+
+            # Keep the phase timings
+            phases = (self.twf_task.meta or {}).get("phases")
+            if phases:
+                meta["phases"] = phases
+
             # Update task state (skip for FAILURE as Celery will handle it when exception is raised)
             if status != "FAILURE":
                 self.update_state(state=status, meta=meta)
@@ -611,7 +784,6 @@ class BaseTWFTask(CeleryTask):
             self.twf_task.save(
                 update_fields=[
                     "title",
-                    "text",
                     "end_time",
                     "status",
                     "meta",
@@ -636,7 +808,7 @@ class BaseTWFTask(CeleryTask):
 
         if prompt_mode in ["images_only", "text_and_images"] and not img_support:
             fallback_message = f"Warning: {self.client} does not support images. Falling back to text-only mode.\n"
-            self.twf_task.text += fallback_message
+            self.log(fallback_message)
             return False
 
         if prompt_mode in ["images_only", "text_and_images"] and img_support:
@@ -651,26 +823,27 @@ class BaseTWFTask(CeleryTask):
             img_url = page.get_image_url(scale_percent=50)
             if img_url:
                 self.client.add_image_resource(img_url)
-                self.twf_task.text += f"Added image from page {page.tk_page_number} of document {page.document.title}\n"
+                self.log_item(
+                    f"Added image from page {page.tk_page_number} of document {page.document.title}\n"
+                )
                 image_count += 1
         return image_count
 
     def _generate_task_init_description(self, prompt, role_description, prompt_mode):
         if self.twf_task:
-            self.twf_task.text += f"AI Client: {self.client}\n"
-            self.twf_task.text += f"Model: {self.credentials['default_model']}\n"
-            self.twf_task.text += (
+            self.log(f"AI Client: {self.client}\n")
+            self.log(f"Model: {self.credentials['default_model']}\n")
+            self.log(
                 f"Role: {role_description[:100]}...\n"
                 if len(role_description) > 100
                 else f"Role: {role_description}\n"
             )
-            self.twf_task.text += (
+            self.log(
                 f"Prompt: {prompt[:100]}...\n"
                 if len(prompt) > 100
                 else f"Prompt: {prompt}\n"
             )
-            self.twf_task.text += f"Prompt mode: {prompt_mode}\n"
-            self.twf_task.save(update_fields=["text"])
+            self.log(f"Prompt mode: {prompt_mode}\n")
 
     def _handle_task_success(self, **kwargs):
         if self.twf_task:
@@ -681,10 +854,13 @@ class BaseTWFTask(CeleryTask):
             for key, value in kwargs.items():
                 self.twf_task.meta[key] = value
 
-            self.twf_task.text += "\n---- TASK SUMMARY ----\n"
-            self.twf_task.text += "Status: SUCCESS\n"
-            self.twf_task.text += f"Duration: {(timezone.now() - self.start_datetime).total_seconds():.2f} seconds\n"
-            self.twf_task.text += "----------------------\n"
+            self.log("\n---- TASK SUMMARY ----\n")
+            self.log("Status: SUCCESS\n")
+            self.log(
+                f"Duration: {(timezone.now() - self.start_datetime).total_seconds():.2f} seconds\n"
+            )
+            self.log("----------------------\n")
+            self.flush_log()
             self.twf_task.save()
 
     def _generate_task_failure_description(self, error_msg):
@@ -692,7 +868,7 @@ class BaseTWFTask(CeleryTask):
 
         # Record the error in the database task
         if self.twf_task:
-            self.twf_task.text += f"Error: {error_msg}\n"
+            self.log(f"Error: {error_msg}\n")
             self.twf_task.status = "FAILURE"
             self.twf_task.end_time = timezone.now()
             self.twf_task.title = (
@@ -700,11 +876,14 @@ class BaseTWFTask(CeleryTask):
                 if len(error_msg) > 50
                 else f"Failed: {error_msg}"
             )
-            self.twf_task.text += "\n---- TASK SUMMARY ----\n"
-            self.twf_task.text += "Status: FAILURE\n"
-            self.twf_task.text += f"Duration: {(timezone.now() - self.start_datetime).total_seconds():.2f} seconds\n"
-            self.twf_task.text += f"Error: {error_msg}\n"
-            self.twf_task.text += "----------------------\n"
+            self.log("\n---- TASK SUMMARY ----\n")
+            self.log("Status: FAILURE\n")
+            self.log(
+                f"Duration: {(timezone.now() - self.start_datetime).total_seconds():.2f} seconds\n"
+            )
+            self.log(f"Error: {error_msg}\n")
+            self.log("----------------------\n")
+            self.flush_log()
             self.twf_task.save()
 
     def _generate_task_summary(self, status, duration, error_msg=None):
@@ -843,3 +1022,16 @@ class BaseTWFTask(CeleryTask):
             # Reraise the exception to be handled by the calling function
             logger.error(f"Error in prompt_client: {str(e)}")
             raise
+
+
+class ChordCallbackTWFTask(BaseTWFTask):
+    """
+    Base task class for TWF tasks which are the callback of a chord.
+
+    Celery passes the results of the chord header as the first positional argument of the
+    callback, so the project and user IDs follow it.
+    """
+
+    def before_start(self, task_id, args, kwargs):
+        """Initialize project and user from the arguments after the header results."""
+        super().before_start(task_id, args[1:], kwargs)
@@ -0,0 +1,115 @@
+"""
+Buffered log of the TWF tasks.
+
+Tasks used to append every log line to Task.text and save the whole text column, so a
+task logging a line per item rewrote its growing log for every item. TaskLogBuffer
+collects the lines in memory and appends them as numbered TaskLogLine rows when enough
+lines are buffered or enough time has passed since the last save, and when the task
+ends. Task.get_log_text joins them into the full log.
+
+Every line has a verbosity level. Lines above the configured verbosity are dropped,
+except item lines (one per processed item): of those, the first ITEM_LINE_SAMPLE lines
+between two saves are kept, and the others are counted in a single line.
+
+The verbosity and the thresholds can be set with the TWF_TASK_LOG_VERBOSITY,
+TWF_TASK_LOG_FLUSH_INTERVAL and TWF_TASK_LOG_FLUSH_LINES settings; a task can override
+the verbosity with its log_verbosity keyword argument.
+"""
+
+import time
+
+from django.conf import settings
+
+from twf.models import TaskLogLine
+
+# Verbosity levels of the task log lines
+LOG_SUMMARY = 0  # Phases, summaries, warnings and errors
+LOG_PROGRESS = 1  # Progress and per-batch lines
+LOG_ITEMS = 2  # A line for every processed item
+
+DEFAULT_VERBOSITY = LOG_PROGRESS
+
+# Seconds and number of buffered lines after which the buffer is saved
+DEFAULT_FLUSH_INTERVAL = 5
+DEFAULT_FLUSH_LINES = 500
+
+# Item lines kept per save if the verbosity is below LOG_ITEMS
+ITEM_LINE_SAMPLE = 20
+
+
+class TaskLogBuffer:
+    """
+    In-memory buffer of the log lines of a task object.
+    """
+
+    def __init__(self, task, verbosity=None, last_seq=0):
+        """
+        Create the buffer.
+
+        Args:
+            task: The Task object the lines are written to
+            verbosity: Highest level of the lines to keep (default: TWF_TASK_LOG_VERBOSITY)
+            last_seq: Number of the task's last log line, for a resumed task
+        """
+        self.task = task
+        self.last_seq = last_seq
+        if verbosity is None:
+            verbosity = getattr(settings, "TWF_TASK_LOG_VERBOSITY", DEFAULT_VERBOSITY)
+        self.verbosity = int(verbosity)
+        self.flush_interval = getattr(
+            settings, "TWF_TASK_LOG_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL
+        )
+        self.flush_lines = getattr(settings, "TWF_TASK_LOG_FLUSH_LINES", DEFAULT_FLUSH_LINES)
+        self.lines = []
+        self.sampled_items = 0
+        self.omitted_items = 0
+        self.flushed_at = time.monotonic()
+
+    def write(self, text, level=LOG_SUMMARY):
+        """
+        Add text to the log. It is saved with the next flush.
+
+        Args:
+            text: The text to append, including its line breaks
+            level: The verbosity level of the text
+        """
+        if level > self.verbosity:
+            if level < LOG_ITEMS:
+                return
+            if self.sampled_items >= ITEM_LINE_SAMPLE:
+                self.omitted_items += 1
+                return
+            self.sampled_items += 1
+
+        self.lines.append(text)
+        self.flush_if_due()
+
+    def flush_if_due(self):
+        """Save the buffered lines if the line or time threshold is reached."""
+        if (
+            len(self.lines) >= self.flush_lines
+            or time.monotonic() - self.flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Append the buffered lines to the task's log."""
+        if self.omitted_items:
+            self.lines.append(f"  ... {self.omitted_items} more item lines not logged\n")
+        self.sampled_items = 0
+        self.omitted_items = 0
+        self.flushed_at = time.monotonic()
+
+        if not self.lines:
+            return
+        lines = list(enumerate(self.lines, start=self.last_seq + 1))
+        self.lines = []
+        self.last_seq += len(lines)
+        if self.task:
+            self.save_lines(lines)
+
+    def save_lines(self, lines):
+        """Insert (seq, text) lines into the task's log."""
+        TaskLogLine.objects.bulk_create(
+            [TaskLogLine(task=self.task, seq=seq, text=text) for seq, text in lines]
+        )
@@ -0,0 +1,85 @@
+"""
+Phase timing of the TWF tasks.
+
+A task measures the phases of its work with BaseTWFTask.phase. For every phase, the
+wall time, the CPU time of the process, the number of database queries and the time
+spent in them are added up and stored in the task's meta under 'phases', which the
+task detail page shows.
+"""
+
+import time
+
+from django.db import connection
+
+
+class QueryCounter:
+    """
+    Database execute wrapper counting the queries and the time spent in them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.time += time.perf_counter() - start
+
+
+class PhaseTimer:
+    """
+    Measures one run of a phase. Use it as a context manager.
+    """
+
+    def __init__(self):
+        self.queries = QueryCounter()
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+
+    def __enter__(self):
+        self.wrapper = connection.execute_wrapper(self.queries)
+        self.wrapper.__enter__()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.wall_time = time.perf_counter() - self.wall_start
+        self.cpu_time = time.process_time() - self.cpu_start
+        self.wrapper.__exit__(exc_type, exc_value, traceback)
+        return False
+
+
+def add_phase_timing(phases, name, timer):
+    """
+    Add the measurements of a phase run to a list of phase timings.
+
+    Args:
+        phases: List of phase timing dicts, in the order the phases first ended
+        name: The name of the phase
+        timer: The PhaseTimer of the run
+
+    Returns:
+        dict: The timing of the phase, summed over all its runs
+    """
+    timing = next((phase for phase in phases if phase["name"] == name), None)
+    if timing is None:
+        timing = {
+            "name": name,
+            "runs": 0,
+            "wall_time": 0.0,
+            "cpu_time": 0.0,
+            "queries": 0,
+            "db_time": 0.0,
+        }
+        phases.append(timing)
+    timing["runs"] += 1
+    timing["wall_time"] = round(timing["wall_time"] + timer.wall_time, 3)
+    timing["cpu_time"] = round(timing["cpu_time"] + timer.cpu_time, 3)
+    timing["queries"] += timer.queries.count
+    timing["db_time"] = round(timing["db_time"] + timer.queries.time, 3)
+    return timing
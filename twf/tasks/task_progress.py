@@ -0,0 +1,75 @@
+"""
+Throttled progress updates of the TWF tasks.
+
+Tasks used to write every progress update to the Celery result backend and to the task
+object, and advance_task updates the progress for every processed item. ProgressPublisher
+keeps the latest update and only writes it when enough time has passed or the progress
+advanced enough since the last write. The final progress (100%) is always written, and
+the task writes the pending update before it ends.
+
+The thresholds can be set with the TWF_TASK_PROGRESS_INTERVAL_MS and
+TWF_TASK_PROGRESS_STEP settings.
+"""
+
+import time
+
+from django.conf import settings
+
+# Milliseconds and percentage points after which a progress update is written
+DEFAULT_PROGRESS_INTERVAL_MS = 1000
+DEFAULT_PROGRESS_STEP = 5
+
+
+class ProgressPublisher:
+    """
+    Coalesces the progress updates of a task.
+    """
+
+    def __init__(self, write, interval_ms=None, step=None):
+        """
+        Create the publisher.
+
+        Args:
+            write: Function called with (progress, text) to write an update
+            interval_ms: Milliseconds between writes (default: TWF_TASK_PROGRESS_INTERVAL_MS)
+            step: Progress in percent which is written at once (default: TWF_TASK_PROGRESS_STEP)
+        """
+        self.write = write
+        if interval_ms is None:
+            interval_ms = getattr(
+                settings, "TWF_TASK_PROGRESS_INTERVAL_MS", DEFAULT_PROGRESS_INTERVAL_MS
+            )
+        if step is None:
+            step = getattr(settings, "TWF_TASK_PROGRESS_STEP", DEFAULT_PROGRESS_STEP)
+        self.interval = interval_ms / 1000
+        self.step = step
+        self.pending = None
+        self.written_progress = None
+        self.written_at = None
+
+    def publish(self, progress, text):
+        """
+        Set the progress of the task. It is written if a threshold is reached.
+
+        Args:
+            progress: The progress in percent
+            text: The text describing the current step
+        """
+        self.pending = (progress, text)
+        if (
+            self.written_progress is None
+            or progress >= 100
+            or abs(progress - self.written_progress) >= self.step
+            or time.monotonic() - self.written_at >= self.interval
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write the pending progress update, if there is one."""
+        if self.pending is None:
+            return
+        progress, text = self.pending
+        self.pending = None
+        self.written_progress = progress
+        self.written_at = time.monotonic()
+        self.write(progress, text)
@@ -9,9 +9,47 @@ from twf.models import Task
 logger = logging.getLogger(__name__)
 
 
+def get_db_task(task_id):
+    """Return the task object of a Celery task ID (or of a database ID), or None."""
+    db_task = Task.objects.filter(celery_task_id=task_id).first()
+    if not db_task and task_id.isdigit():
+        db_task = Task.objects.filter(pk=task_id).first()
+    return db_task
+
+
+def get_task_log_update(db_task, after_seq):
+    """Return the log lines of a task after a sequence number, with its counters.
+
+    The first update (after_seq 0) starts with the task text, which holds the header
+    written before the first log line.
+    """
+    lines = db_task.get_log_lines(after_seq)
+    texts = [text for _, text in lines]
+    if after_seq == 0 and db_task.text:
+        texts.insert(0, db_task.text)
+    return {
+        "lines": texts,
+        "last_seq": lines[-1][0] if lines else after_seq,
+        "db_status": db_task.status,
+        "db_progress": db_task.progress,
+        "total_items": db_task.total_items,
+        "processed_items": db_task.processed_items,
+        "successful_items": db_task.successful_items,
+        "failed_items": db_task.failed_items,
+    }
+
+
 def task_status_view(request, task_id):
-    """View to check the status of a task by its task_id and return the progress or result."""
+    """View to check the status of a task by its task_id and return the progress or result.
+
+    With the after_seq parameter, the log lines after that sequence number and the item
+    counters are returned instead of the full log text.
+    """
     try:
+        after_seq = request.GET.get("after_seq")
+        after_seq = int(after_seq) if after_seq and after_seq.isdigit() else None
+        db_task = None
+
         # Get the task result by its task_id
         task_result = AsyncResult(task_id)
 
@@ -25,25 +63,13 @@ def task_status_view(request, task_id):
         # If the task is in progress, return the progress meta information
         if task_result.state == "PROGRESS":
             # Get the task from the database to retrieve the full log
+            full_text = None
             try:
-                # Try all possible ways to find the task
-                db_task = Task.objects.filter(celery_task_id=task_id).first()
-
-                if not db_task:
-                    # Try using task_id directly (it might be the DB task ID, not celery ID)
-                    db_task = Task.objects.filter(pk=task_id).first()
-
-                if not db_task:
-                    # Try looking for a task with this ID in meta field
-                    db_task = Task.objects.filter(meta__contains=task_id).first()
-
-                full_text = (
-                    db_task.text if db_task else task_result.info.get("text", "")
-                )
-                logger.info(
-                    f"Task status - Found task in DB: {bool(db_task)}, task_id: {task_id}, "
-                    f"text length: {len(full_text) if full_text else 0}"
-                )
+                db_task = get_db_task(task_id)
+                if after_seq is None:
+                    full_text = (
+                        db_task.get_log_text() if db_task else task_result.info.get("text", "")
+                    )
             except Exception as e:
                 logger.error(f"Error retrieving full task text: {e}")
                 full_text = task_result.info.get("text", "")
@@ -61,17 +87,16 @@ def task_status_view(request, task_id):
                 )
                 * 100,
                 "text": task_result.info.get("text", ""),  # Latest progress update
-                "full_text": full_text,  # Complete task log
                 "db_task_id": db_task_id,  # Database ID for the task
             }
+            if full_text is not None:
+                response_data["full_text"] = full_text  # Complete task log
 
         # If the task is completed, return the result
         elif task_result.state == "SUCCESS":
             # Try to get the database task ID
             try:
-                db_task = Task.objects.filter(celery_task_id=task_id).first()
-                if not db_task:
-                    db_task = Task.objects.filter(meta__contains=task_id).first()
+                db_task = get_db_task(task_id)
                 db_task_id = db_task.pk if db_task else None
             except Exception:
                 db_task_id = None
@@ -86,9 +111,7 @@ def task_status_view(request, task_id):
         elif task_result.state == "FAILURE":
             # Try to get the database task ID
             try:
-                db_task = Task.objects.filter(celery_task_id=task_id).first()
-                if not db_task:
-                    db_task = Task.objects.filter(meta__contains=task_id).first()
+                db_task = get_db_task(task_id)
                 db_task_id = db_task.pk if db_task else None
             except Exception:
                 db_task_id = None
@@ -107,6 +130,13 @@ def task_status_view(request, task_id):
         else:
             response_data = {"status": task_result.state}
 
+        # New log lines for clients polling incrementally
+        if after_seq is not None:
+            if db_task is None and task_result.state not in ("PENDING", "PROGRESS"):
+                db_task = get_db_task(task_id)
+            if db_task:
+                response_data.update(get_task_log_update(db_task, after_seq))
+
         # Return the response as JSON
         return JsonResponse(response_data)
 
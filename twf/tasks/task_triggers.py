@@ -80,14 +80,24 @@ def trigger_ai_task(request, task_function, **kwargs):
     return trigger_task(request, task_function, **kwargs)
 
 
+def is_checked(request, name):
+    """Return True if a checkbox of the posted form is checked.
+
+    A checked checkbox is posted as "on" (or "true"/"1" by scripts), an unchecked one
+    is not posted at all.
+    """
+    return request.POST.get(name, "").lower() in ("on", "true", "1")
+
+
 ##############################
 ## PROJECT TASKS
 def start_extraction(request):
     """Start Transkribus export zip extraction and unified smart sync process.
 
-    Optional parameters:
-    - force_recreate_tags: Boolean to force recreation of all tags (default: False)
-    - delete_removed_documents: Boolean to delete documents not in export (default: True)
+    Optional parameters (checkboxes, unchecked if not posted):
+    - force_recreate_tags: Boolean to force recreation of all tags
+    - delete_removed_documents: Boolean to delete documents not in export (checked in the form)
+    - dry_run: Boolean to only report what the sync would change
     - transkribus_username: Transkribus username (will be saved to project)
     - transkribus_password: Transkribus password (will be saved to project)
     """
@@ -109,16 +119,14 @@ def start_extraction(request):
             project.save()
 
     # Extract optional parameters from form
-    force_recreate_tags = (
-        request.POST.get("force_recreate_tags", "false").lower() == "true"
-    )
-    delete_removed_documents = (
-        request.POST.get("delete_removed_documents", "true").lower() == "true"
-    )
+    force_recreate_tags = is_checked(request, "force_recreate_tags")
+    delete_removed_documents = is_checked(request, "delete_removed_documents")
+    dry_run = is_checked(request, "dry_run")
 
     kwargs = {
         "force_recreate_tags": force_recreate_tags,
         "delete_removed_documents": delete_removed_documents,
+        "dry_run": dry_run,
     }
 
     return trigger_task(request, extract_zip_export_task, **kwargs)
@@ -0,0 +1,241 @@
+"""Celery tasks for downloading the Transkribus export of a project."""
+
+import glob
+import logging
+import os
+import time
+
+import requests
+from celery import shared_task
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from twf.tasks.task_base import BaseTWFTask
+
+logger = logging.getLogger(__name__)
+
+# Size of the chunks read from the response and written to disk
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Number of attempts to continue an interrupted download (with an HTTP Range request)
+MAX_DOWNLOAD_ATTEMPTS = 5
+
+# Connect and read timeouts of the download requests, in seconds
+DOWNLOAD_TIMEOUT = (10, 120)
+
+
+@shared_task(bind=True, base=BaseTWFTask)
+def download_transkribus_export_task(self, project_id, user_id, **kwargs):
+    """
+    Celery task to download the Transkribus export of a project.
+
+    The export is streamed into a .part file next to its final location in the project
+    storage, in large chunks. The .part file is named after the export job, so that a
+    file left by an earlier export is never continued. If the connection breaks, the
+    download continues where it stopped with an HTTP Range request; a .part file left by
+    an earlier, interrupted task of the same job is continued as well, if the server
+    confirms it is still the same file (see download_with_resume). Once the size matches
+    the announced content length, the file is moved into place and becomes the project's
+    downloaded_zip_file. There is no temporary copy.
+
+    The progress is published through the task object (and the Celery result backend),
+    which every web worker can read.
+
+    Args:
+        project_id: Project ID
+        user_id: User ID
+        **kwargs: Additional options
+
+    Returns:
+        dict: The number of downloaded bytes
+    """
+    try:
+        url = self.project.job_download_url
+        if not url:
+            raise ValueError("The project has no Transkribus export to download.")
+
+        file_name = f"transkribus_exports/{self.project.collection_id}_export.zip"
+        file_path = default_storage.path(file_name)
+        part_path = f"{file_path}.{self.project.transkribus_job_id or 'download'}.part"
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        remove_stale_part_files(file_path, part_path)
+
+        total_size = download_with_resume(self, url, part_path)
+
+        # Replace the previous export
+        old_file = self.project.downloaded_zip_file
+        if old_file and old_file.name != file_name:
+            old_file.delete(save=False)
+        os.replace(part_path, file_path)
+
+        self.project.downloaded_zip_file.name = file_name
+        self.project.downloaded_at = timezone.now()
+        self.project.save(current_user=self.user)
+
+        self.log(f"✓ Downloaded {total_size} bytes to {file_name}.\n")
+        self.end_task(status="SUCCESS", downloaded_bytes=total_size)
+        return {"downloaded_bytes": total_size}
+
+    except Exception as e:
+        error_msg = str(e)
+        logger.error(f"Error in download_transkribus_export_task: {error_msg}")
+        self.end_task(status="FAILURE", error_msg=error_msg)
+        raise
+
+
+def remove_stale_part_files(file_path, part_path):
+    """Delete the .part files of other export jobs, and their validator files."""
+    for path in glob.glob(f"{glob.escape(file_path)}.*.part"):
+        if path != part_path:
+            remove_part_file(path)
+
+
+def remove_part_file(part_path):
+    """Delete a .part file and its validator file, if they exist."""
+    for path in (part_path, get_validator_path(part_path)):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def get_validator_path(part_path):
+    """Return the path of the file holding the validator of a .part file."""
+    return f"{part_path}.validator"
+
+
+def read_validator(part_path):
+    """Return the validator stored for a .part file, or None."""
+    validator_path = get_validator_path(part_path)
+    if not os.path.exists(validator_path):
+        return None
+    with open(validator_path, encoding="utf-8") as validator_file:
+        return validator_file.read().strip() or None
+
+
+def get_response_validator(response):
+    """Return the validator of a response for an If-Range header: its strong ETag,
+    else its Last-Modified date, or None."""
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("last-modified")
+
+
+def download_with_resume(celery_task, url, part_path):
+    """Download a URL into a file, continuing after interruptions.
+
+    The validator (ETag or Last-Modified) of the response is stored next to the file. A
+    download is only continued with an If-Range header carrying the validator, so the
+    server sends the whole file again (status 200) if it changed. An existing file
+    without a validator is discarded. Within one call, a download without a validator
+    is continued with a plain Range request.
+
+    Args:
+        celery_task: BaseTWFTask instance for progress tracking
+        url: The URL to download
+        part_path: Path of the file to download into. An existing file is continued.
+
+    Returns:
+        int: The size of the downloaded file
+
+    Raises:
+        ValueError: If the size of the download does not match the content length
+    """
+    validator = read_validator(part_path)
+    downloaded = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if downloaded and not validator:
+        celery_task.log("Discarding a partial download which cannot be verified.\n")
+        remove_part_file(part_path)
+        downloaded = 0
+    total_size = None
+    attempt = 0
+
+    while True:
+        headers = {}
+        if downloaded:
+            headers["Range"] = f"bytes={downloaded}-"
+            if validator:
+                headers["If-Range"] = validator
+        try:
+            with requests.get(
+                url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers
+            ) as response:
+                if response.status_code == 416 and downloaded:
+                    # Nothing left to download, the size is verified below
+                    total_size = get_content_range_total(response) or downloaded
+                    break
+                response.raise_for_status()
+
+                if response.status_code == 206:
+                    total_size = get_content_range_total(response)
+                    mode = "ab"
+                else:
+                    # The server sends the whole file: the file changed since the partial
+                    # download (If-Range did not match), or it ignores Range requests
+                    if downloaded:
+                        celery_task.log("The server sent the whole file, restarting the download.\n")
+                    content_length = response.headers.get("content-length")
+                    total_size = int(content_length) if content_length else None
+                    downloaded = 0
+                    mode = "wb"
+                    validator = get_response_validator(response)
+                    remove_part_file(part_path)
+                    if validator:
+                        with open(get_validator_path(part_path), "w", encoding="utf-8") as f:
+                            f.write(validator)
+
+                if downloaded:
+                    celery_task.log(f"Continuing the download at byte {downloaded}.\n")
+
+                last_progress = -1
+                with open(part_path, mode) as part_file:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                        if not chunk:  # filter out keep-alive chunks
+                            continue
+                        part_file.write(chunk)
+                        downloaded += len(chunk)
+                        if total_size:
+                            progress = int(downloaded / total_size * 100)
+                            if progress != last_progress:
+                                last_progress = progress
+                                celery_task.update_progress(
+                                    progress,
+                                    text=f"Downloaded {downloaded}/{total_size} bytes",
+                                )
+            if total_size is None or downloaded >= total_size:
+                break
+            # The response ended early, continue with a Range request
+            raise requests.exceptions.ChunkedEncodingError(
+                "Response ended before the content length"
+            )
+
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ) as e:
+            attempt += 1
+            if attempt >= MAX_DOWNLOAD_ATTEMPTS:
+                raise
+            celery_task.log(
+                f"Download interrupted at byte {downloaded} ({e}), "
+                f"retrying ({attempt}/{MAX_DOWNLOAD_ATTEMPTS}).\n"
+            )
+            time.sleep(min(2 ** attempt, 30))
+
+    if total_size is not None and downloaded != total_size:
+        # Longer than announced: the file cannot be continued
+        remove_part_file(part_path)
+        raise ValueError(
+            f"Downloaded {downloaded} bytes, but the content length is {total_size} bytes."
+        )
+    validator_path = get_validator_path(part_path)
+    if os.path.exists(validator_path):
+        os.remove(validator_path)
+    return downloaded
+
+
+def get_content_range_total(response):
+    """Return the total size from the Content-Range header of a response, or None."""
+    content_range = response.headers.get("content-range", "")
+    total = content_range.rsplit("/", 1)[-1]
+    return int(total) if total.isdigit() else None
@@ -0,0 +1,50 @@
+"""Query budget assertions for the tests of the twf app."""
+
+from contextlib import contextmanager
+
+from django.db import connection
+
+from twf.utils.query_inspection import QueryRecorder
+
+
+class QueryBudgetMixin:
+    """
+    Mixin for test cases which limit the number of queries of views and functions.
+
+    Unlike assertNumQueries, the budget is an upper limit, and the failure message lists
+    the repeated query shapes with the code running them, so that N+1 queries are found
+    quickly.
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, max_queries, max_repeats=None):
+        """
+        Fail if the block runs more than max_queries queries, or (if given) a query
+        shape more than max_repeats times.
+        """
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            yield recorder
+
+        threshold = max_repeats + 1 if max_repeats is not None else 2
+        if recorder.count > max_queries:
+            self.fail(
+                f"{recorder.count} queries exceed the budget of {max_queries}: "
+                f"{recorder.format_report(threshold)}"
+            )
+        if max_repeats is not None and recorder.get_repeated(threshold):
+            self.fail(
+                f"Queries repeated more than {max_repeats} times: "
+                f"{recorder.format_report(threshold)}"
+            )
+
+    def assertViewQueryBudget(self, url, max_queries, max_repeats=None):
+        """Request a URL with the test client and check the query budget of the view.
+
+        Returns:
+            The response
+        """
+        with self.assertQueryBudget(max_queries, max_repeats):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
@@ -0,0 +1,103 @@
+"""Helpers for the tests of the Transkribus sync."""
+
+import shutil
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from twf.models import Project, Task, User
+
+PAGE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<PcGts xmlns="http://schema.primaresearch.org/PAGE/gts/pagecontent/2013-07-15">
+    <Metadata>
+        <Creator>TWF tests</Creator>
+        <TranskribusMetadata docId="{doc_id}" pageId="{page_id}" pageNr="{page_nr}"/>
+    </Metadata>
+    <Page imageFilename="page.jpg" imageWidth="100" imageHeight="100">
+        <TextRegion id="r1" custom="readingOrder {{index:0;}}">
+            <Coords points="0,0 100,0 100,100 0,100"/>
+            <TextLine id="r1l1" custom="readingOrder {{index:0;}}">
+                <Coords points="0,0 100,0 100,20 0,20"/>
+                <TextEquiv><Unicode>Page {page_nr}</Unicode></TextEquiv>
+            </TextLine>
+            <TextEquiv><Unicode>Page {page_nr}</Unicode></TextEquiv>
+        </TextRegion>
+    </Page>
+</PcGts>
+"""
+
+
+class StubSyncTask:
+    """Stands in for the BaseTWFTask running a sync."""
+
+    def __init__(self, project, twf_task=None):
+        self.project = project
+        self.twf_task = twf_task
+        self.result_meta = None
+        self.statuses = []
+
+    def log(self, text, level=0):
+        """Append a line to the text of the task object."""
+        self.twf_task.text += text
+
+    def log_item(self, text):
+        """Append a line about a single document or page to the text of the task object."""
+        self.log(text)
+
+    def update_progress(self, progress, text="In progress"):
+        """Ignore the progress."""
+
+    def set_total_items(self, total):
+        """Ignore the number of items."""
+
+    def advance_task(self, text="In progress", status="success"):
+        """Record the status of a processed item."""
+        self.statuses.append(status)
+
+    def get_checkpoint(self):
+        """Return the checkpoint of the task object."""
+        return dict((self.twf_task.meta or {}).get("checkpoint", {}))
+
+    def save_checkpoint(self, **values):
+        """Merge values into the checkpoint of the task object."""
+        meta = self.twf_task.meta or {}
+        meta["checkpoint"] = {**meta.get("checkpoint", {}), **values}
+        self.twf_task.meta = meta
+        self.twf_task.save(update_fields=["meta"])
+
+    def end_task(self, status="SUCCESS", error_msg=None, **kwargs):
+        """Record the result."""
+        self.result_meta = kwargs
+
+
+class SyncTestCase(TestCase):
+    """Test case with a project, the task object of a sync and a temporary MEDIA_ROOT."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(
+            username="syncuser", password="password123", email="syncuser@example.com"
+        )
+        self.project = Project(
+            title="Sync Project",
+            collection_id="sync_collection",
+            description="A test project",
+            owner=self.user.profile,
+        )
+        self.project.save(current_user=self.user)
+        self.twf_task = self.create_sync_task("sync-task", "STARTED")
+
+    def create_sync_task(self, celery_task_id, status, meta=None):
+        """Create the task object of a sync."""
+        return Task.objects.create(
+            celery_task_id=celery_task_id,
+            project=self.project,
+            user=self.user,
+            status=status,
+            meta=meta or {},
+        )
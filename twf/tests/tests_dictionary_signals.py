@@ -0,0 +1,77 @@
+"""Test cases for the signals refreshing the tag suggestions after dictionary edits."""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from twf.models import (
+    Dictionary,
+    DictionaryEntry,
+    Project,
+    TagSuggestion,
+    TagSuggestionSet,
+    User,
+    Variation,
+)
+
+
+class DictionarySignalsTest(TestCase):
+    """Edited and deleted variations and entries refresh the tag suggestions."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="dictuser", password="password123", email="dictuser@example.com"
+        )
+        self.project = Project(
+            title="Dictionary Project",
+            collection_id="dictionary_collection",
+            description="A test project",
+            owner=self.user.profile,
+        )
+        self.project.save(current_user=self.user)
+        self.dictionary = Dictionary.objects.create(label="Places", type="place")
+        self.entry = DictionaryEntry.objects.create(dictionary=self.dictionary, label="Basel")
+        self.variation = Variation.objects.create(entry=self.entry, variation="Basel")
+
+        self.suggestion_set = TagSuggestionSet.objects.create(
+            project=self.project, variation="Basle", variation_type="place"
+        )
+        TagSuggestion.objects.create(
+            suggestion_set=self.suggestion_set,
+            entry=self.entry,
+            variation=self.variation,
+            score=90,
+        )
+
+    def test_saved_variation_schedules_refresh_by_entry(self):
+        """Test that saving a variation schedules the refresh without loading its entry."""
+        variation = Variation.objects.get(pk=self.variation.pk)
+        with mock.patch(
+            "twf.signals.schedule_entry_tag_suggestions_refresh"
+        ) as schedule, self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(1):
+                variation.save(current_user=self.user)
+
+        schedule.assert_called_once_with(self.entry.pk, self.user.pk)
+
+    def test_deleted_variation_drops_its_suggestions(self):
+        """Test that deleting a variation drops the suggestion sets suggesting it."""
+        with mock.patch(
+            "twf.signals.schedule_entry_tag_suggestions_refresh"
+        ) as schedule, self.captureOnCommitCallbacks(execute=True):
+            self.variation.delete()
+
+        self.assertFalse(TagSuggestionSet.objects.exists())
+        schedule.assert_called_once_with(self.entry.pk, None)
+
+    def test_deleted_entry_schedules_refresh_of_dictionary(self):
+        """Test that deleting an entry drops its suggestions and refreshes its dictionary."""
+        with mock.patch(
+            "twf.signals.schedule_tag_suggestions_refresh"
+        ) as schedule, mock.patch(
+            "twf.signals.schedule_entry_tag_suggestions_refresh"
+        ), self.captureOnCommitCallbacks(execute=True):
+            self.entry.delete()
+
+        self.assertFalse(TagSuggestionSet.objects.exists())
+        schedule.assert_called_once_with(self.dictionary.pk, None)
@@ -0,0 +1,122 @@
+"""Test cases for propagating assignments and enrichments to identical tags."""
+
+from django.test import TestCase
+from django.utils import timezone
+
+from twf.models import (
+    Dictionary,
+    DictionaryEntry,
+    Document,
+    Page,
+    PageTag,
+    Project,
+    User,
+    Variation,
+    Workflow,
+)
+from twf.utils.tags_utils import assign_identical_tags, enrich_identical_tags
+
+
+class IdenticalTagsTest(TestCase):
+    """Identical tags are updated with one UPDATE, including the audit fields."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="tagsuser", password="password123", email="tagsuser@example.com"
+        )
+        self.project = Project(
+            title="Tags Project",
+            collection_id="tags_collection",
+            description="A test project",
+            owner=self.user.profile,
+        )
+        self.project.save(current_user=self.user)
+        document = Document.objects.create(project=self.project, document_id="123")
+        self.page = Page.objects.create(document=document, tk_page_id="10", tk_page_number=1)
+        self.ignored_page = Page.objects.create(
+            document=document, tk_page_id="20", tk_page_number=2, is_ignored=True
+        )
+
+        dictionary = Dictionary.objects.create(label="Persons", type="person")
+        self.entry = DictionaryEntry.objects.create(dictionary=dictionary, label="Wagner")
+        self.other_entry = DictionaryEntry.objects.create(
+            dictionary=dictionary, label="Wagner, Cosima"
+        )
+
+    def create_tag(self, page=None, variation="Wagner", **fields):
+        """Create a person tag."""
+        return PageTag.objects.create(
+            page=page or self.page,
+            project=self.project,
+            variation=variation,
+            variation_type="person",
+            **fields,
+        )
+
+    def test_assign_identical_tags(self):
+        """Test that the tag and its identical unassigned tags are assigned."""
+        clicked_tag = self.create_tag(dictionary_entry=self.other_entry)
+        identical_tags = [self.create_tag(), self.create_tag()]
+        assigned_tag = self.create_tag(dictionary_entry=self.other_entry)
+        ignored_tag = self.create_tag(page=self.ignored_page)
+        other_tag = self.create_tag(variation="Liszt")
+
+        before = timezone.now()
+        count = assign_identical_tags(clicked_tag, self.entry, self.user)
+
+        self.assertEqual(count, 3)
+        for tag in [clicked_tag, *identical_tags]:
+            tag.refresh_from_db()
+            self.assertEqual(tag.dictionary_entry, self.entry)
+            self.assertEqual(tag.modified_by, self.user)
+            self.assertGreaterEqual(tag.modified_at, before)
+        for tag, entry in ((assigned_tag, self.other_entry), (ignored_tag, None), (other_tag, None)):
+            tag.refresh_from_db()
+            self.assertEqual(tag.dictionary_entry, entry)
+        self.assertEqual(
+            list(Variation.objects.filter(entry=self.entry).values_list("variation", flat=True)),
+            ["Wagner"],
+        )
+
+    def test_assign_keeps_existing_variation(self):
+        """Test that a variation the entry already has is not created again."""
+        Variation.objects.create(entry=self.entry, variation="Wagner")
+        tag = self.create_tag()
+
+        with self.assertNumQueries(4):
+            self.assertEqual(assign_identical_tags(tag, self.entry, self.user), 1)
+        self.assertEqual(Variation.objects.filter(entry=self.entry).count(), 1)
+
+    def test_enrich_identical_tags(self):
+        """Test that the enrichment is merged into identical tags, keeping their other
+        enrichment types."""
+        enrichment = {"wikidata_id": "Q1511"}
+        tag = self.create_tag(enrichment={"person": enrichment})
+        workflow = Workflow.objects.create(
+            project=self.project,
+            user=self.user,
+            workflow_type="review_tags_enrichment",
+            item_count=4,
+        )
+        empty_tag = self.create_tag()
+        other_type_tag = self.create_tag(enrichment={"gnd": {"id": "118594117"}})
+        enriched_tag = self.create_tag(enrichment={"person": {"wikidata_id": "Q2"}})
+        outside_tag = self.create_tag()
+        workflow.assigned_tag_items.add(tag, empty_tag, other_type_tag, enriched_tag)
+
+        before = timezone.now()
+        count = enrich_identical_tags(tag, "person", self.user, workflow=workflow)
+
+        self.assertEqual(count, 2)
+        empty_tag.refresh_from_db()
+        self.assertEqual(empty_tag.enrichment, {"person": enrichment})
+        self.assertEqual(empty_tag.modified_by, self.user)
+        self.assertGreaterEqual(empty_tag.modified_at, before)
+        other_type_tag.refresh_from_db()
+        self.assertEqual(
+            other_type_tag.enrichment, {"gnd": {"id": "118594117"}, "person": enrichment}
+        )
+        enriched_tag.refresh_from_db()
+        self.assertEqual(enriched_tag.enrichment, {"person": {"wikidata_id": "Q2"}})
+        outside_tag.refresh_from_db()
+        self.assertEqual(outside_tag.enrichment, {})
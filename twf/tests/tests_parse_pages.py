@@ -0,0 +1,53 @@
+"""Test cases for parsing the PAGE XML files of synced pages."""
+
+from pathlib import Path
+
+from twf.models import Page
+from twf.tasks.structure_tasks import (
+    DocumentPageSyncEngine,
+    get_parse_pool_settings,
+    parse_pages_in_pool,
+)
+from twf.tests.sync_helpers import PAGE_XML, StubSyncTask, SyncTestCase
+
+
+class ParsePagesInPoolTest(SyncTestCase):
+    """Pages parsed in the worker pool are written back in batches."""
+
+    def setUp(self):
+        super().setUp()
+        files = []
+        for page_nr in range(1, 4):
+            path = Path(self.media_root) / f"123_{page_nr}.xml"
+            path.write_text(PAGE_XML.format(doc_id="123", page_id=page_nr * 10, page_nr=page_nr))
+            files.append(path)
+        engine = DocumentPageSyncEngine(
+            self.project, self.user, StubSyncTask(self.project, self.twf_task), []
+        )
+        engine.sync_page_files(files)
+
+    def test_pages_are_parsed_in_pool(self):
+        """Test that two workers parse all pages and a broken page is counted as failed."""
+        broken_page = Page.objects.get(tk_page_id=30)
+        Path(broken_page.xml_file.path).write_text("<PcGts")
+        pages = Page.objects.filter(document__project=self.project).order_by("tk_page_number")
+        task = StubSyncTask(self.project, self.twf_task)
+
+        parsed, failed = parse_pages_in_pool(pages, 3, self.user, task, workers=2, batch_size=2)
+
+        self.assertEqual((parsed, failed), (2, 1))
+        self.assertEqual(task.statuses, ["success", "success", "failure"])
+        for page in Page.objects.exclude(pk=broken_page.pk):
+            self.assertTrue(page.parsed_data)
+            self.assertIsNotNone(page.last_parsed_at)
+            self.assertEqual(page.modified_by, self.user)
+        broken_page.refresh_from_db()
+        self.assertIsNone(broken_page.last_parsed_at)
+
+    def test_invalid_settings_are_clamped(self):
+        """Test that invalid parse settings are replaced and reported in the task log."""
+        task = StubSyncTask(self.project, self.twf_task)
+        settings = get_parse_pool_settings({"parse_workers": 500, "parse_batch_size": "x"}, task)
+        self.assertEqual(settings, (64, 200))
+        self.assertIn("parse_workers=500", self.twf_task.text)
+        self.assertIn("parse_batch_size='x'", self.twf_task.text)
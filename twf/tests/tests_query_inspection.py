@@ -0,0 +1,46 @@
+"""Test cases for the query shapes and the query budget assertions."""
+
+from django.test import SimpleTestCase, TestCase
+
+from twf.models import User
+from twf.tests.query_budget import QueryBudgetMixin
+from twf.utils.query_inspection import get_query_shape
+
+
+class QueryShapeTest(SimpleTestCase):
+    """Queries for different rows must have the same shape."""
+
+    def test_in_lists_and_literals(self):
+        """Test that IN lists of any length and literals are removed."""
+        self.assertEqual(
+            get_query_shape('SELECT "id" FROM "twf_page" WHERE "id" IN (%s, %s, %s) LIMIT 21'),
+            get_query_shape('SELECT "id" FROM "twf_page"\n WHERE "id" IN (%s) LIMIT 1'),
+        )
+
+    def test_values_lists(self):
+        """Test that bulk inserts of any size have the same shape."""
+        self.assertEqual(
+            get_query_shape('INSERT INTO "twf_tag" ("a", "b") VALUES (%s, %s), (%s, %s)'),
+            'INSERT INTO "twf_tag" ("a", "b") VALUES (?)',
+        )
+
+
+class QueryBudgetTest(QueryBudgetMixin, TestCase):
+    """The budget assertions must catch too many and repeated queries."""
+
+    def test_repeated_queries_fail(self):
+        """Test that a query run per row exceeds the repeat limit."""
+        with self.assertRaises(AssertionError) as context:
+            with self.assertQueryBudget(10, max_repeats=2):
+                for i in range(3):
+                    User.objects.filter(username=f"user{i}").exists()
+        self.assertIn("3x", str(context.exception))
+
+    def test_budget(self):
+        """Test that the number of queries is checked against the budget."""
+        with self.assertQueryBudget(1, max_repeats=1):
+            User.objects.filter(username__in=["user1", "user2"]).exists()
+        with self.assertRaises(AssertionError):
+            with self.assertQueryBudget(1):
+                User.objects.count()
+                User.objects.exists()
@@ -0,0 +1,98 @@
+"""Test cases for the batched smart tag sync of SmartTagSyncEngine."""
+
+from django.utils import timezone
+
+from twf.models import Dictionary, DictionaryEntry, Document, Page, PageTag, User
+from twf.tasks.tags_tasks import smart_sync_tags
+from twf.tests.sync_helpers import StubSyncTask, SyncTestCase
+
+
+def tag_data(text, tag_type, offset):
+    """Return a tag of the custom_list_structure of a parsed page."""
+    return {"type": tag_type, "text": text, "offset": offset, "length": len(text)}
+
+
+class SmartTagSyncTest(SyncTestCase):
+    """A re-sync keeps the user work on matched tags and writes the changes in bulk."""
+
+    def setUp(self):
+        super().setUp()
+        document = Document.objects.create(
+            project=self.project, document_id="123", created_by=self.user, modified_by=self.user
+        )
+        self.page = Page.objects.create(
+            document=document,
+            tk_page_id="10",
+            tk_page_number=1,
+            num_tags=3,
+            parsed_data={
+                "elements": [
+                    {
+                        "id": "r1",
+                        "element_data": {
+                            "text_lines": ["Basel Zürich Bern"],
+                            "custom_list_structure": [
+                                tag_data("Basel", "place", 0),
+                                tag_data("Zürich", "place", 6),
+                                tag_data("Bern", "place", 13),
+                            ],
+                        },
+                    }
+                ]
+            },
+        )
+        dictionary = Dictionary.objects.create(label="Places", type="place")
+        self.entry = DictionaryEntry.objects.create(dictionary=dictionary, label="Basel")
+
+        self.old_user = User.objects.create_user(
+            username="olduser", password="password123", email="olduser@example.com"
+        )
+        self.assigned_tag = self.create_tag("Basel", 0, "r1", dictionary_entry=self.entry)
+        self.parked_tag = self.create_tag("Zürich", 8, "r1", is_parked=True)
+        self.legacy_tag = self.create_tag("Bern", 15, "")
+        self.removed_tag = self.create_tag("Genf", 30, "r1")
+
+    def create_tag(self, text, offset, line_id, **fields):
+        """Create an existing tag of the page."""
+        return PageTag.objects.create(
+            page=self.page,
+            project=self.project,
+            variation=text,
+            variation_type="place",
+            offset_in_line=offset,
+            length=len(text),
+            additional_information={"line_id": line_id, "continued": False},
+            created_by=self.old_user,
+            modified_by=self.old_user,
+            **fields,
+        )
+
+    def test_resync_keeps_user_work(self):
+        """Test that matched tags keep their assignment and parked status, removed tags
+        are deleted, and the bulk writes set the audit fields."""
+        before_sync = timezone.now()
+        stats = smart_sync_tags(self.project, self.user, StubSyncTask(self.project, self.twf_task))
+
+        self.assertEqual(stats["updated"], 3)
+        self.assertEqual(stats["deleted"], 1)
+        self.assertEqual(stats["added"], 0)
+        self.assertEqual(stats["preserved_assignments"], 1)
+        self.assertEqual(stats["preserved_parked"], 1)
+
+        tags = {tag.pk: tag for tag in PageTag.objects.filter(page=self.page)}
+        self.assertEqual(
+            set(tags), {self.assigned_tag.pk, self.parked_tag.pk, self.legacy_tag.pk}
+        )
+        self.assertEqual(tags[self.assigned_tag.pk].dictionary_entry, self.entry)
+        self.assertTrue(tags[self.parked_tag.pk].is_parked)
+        self.assertEqual(tags[self.parked_tag.pk].offset_in_line, 6)
+        self.assertEqual(tags[self.legacy_tag.pk].additional_information["line_id"], "r1")
+        for tag in tags.values():
+            self.assertEqual(tag.modified_by, self.user)
+            self.assertGreaterEqual(tag.modified_at, before_sync)
+            self.assertEqual(tag.created_by, self.old_user)
+
+        self.page.refresh_from_db()
+        self.assertEqual(self.page.num_tags, 3)
+        self.assertEqual(self.page.modified_by, self.user)
+        self.assertGreaterEqual(self.page.modified_at, before_sync)
@@ -0,0 +1,50 @@
+"""Test cases for resuming an interrupted Transkribus sync from its checkpoint."""
+
+from twf.tasks.structure_tasks import load_sync_checkpoint
+from twf.tests.sync_helpers import StubSyncTask, SyncTestCase
+
+FINGERPRINT = "transkribus_exports/export.zip|1000|1700000000|delete_removed_documents=True"
+
+
+class LoadSyncCheckpointTest(SyncTestCase):
+    """Only failed or cancelled syncs may be resumed by a new sync."""
+
+    def get_checkpoint(self, previous_status):
+        """Return the checkpoint a new sync starts with, after a sync with a status."""
+        previous_task = self.create_sync_task(
+            "previous-sync",
+            previous_status,
+            {
+                "checkpoint": {
+                    "fingerprint": FINGERPRINT,
+                    "started_at": "2026-03-01T10:00:00+00:00",
+                    "phase": "documents",
+                    "processed_files": 40,
+                    "changed_page_ids": [3, 5],
+                }
+            },
+        )
+        checkpoint = load_sync_checkpoint(StubSyncTask(self.project, self.twf_task), FINGERPRINT)
+        previous_task.refresh_from_db()
+        return checkpoint, previous_task
+
+    def test_failed_sync_is_resumed(self):
+        """Test that a failed sync's checkpoint is taken over, with its changed pages."""
+        checkpoint, previous_task = self.get_checkpoint("FAILURE")
+        self.assertEqual(checkpoint["phase"], "documents")
+        self.assertEqual(checkpoint["processed_files"], 40)
+        self.assertEqual(checkpoint["changed_page_ids"], [3, 5])
+        self.assertNotIn("checkpoint", previous_task.meta)
+        self.twf_task.refresh_from_db()
+        self.assertEqual(self.twf_task.meta["checkpoint"]["phase"], "documents")
+
+    def test_running_sync_is_not_taken_over(self):
+        """Test that a sync which is still running keeps its checkpoint."""
+        for status in ("STARTED", "PROGRESS"):
+            with self.subTest(status=status):
+                checkpoint, previous_task = self.get_checkpoint(status)
+                self.assertIsNone(checkpoint["phase"])
+                self.assertEqual(checkpoint["processed_files"], 0)
+                self.assertEqual(previous_task.meta["checkpoint"]["processed_files"], 40)
+                previous_task.delete()
+                self.twf_task.meta = {}
@@ -0,0 +1,96 @@
+"""Test cases for the dry run of the Transkribus sync."""
+
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from twf.models import Document, Page
+from twf.tasks.structure_tasks import run_sync_dry_run
+from twf.tasks.task_triggers import start_extraction
+from twf.tests.sync_helpers import PAGE_XML, StubSyncTask, SyncTestCase
+
+
+class SyncDryRunTest(SyncTestCase):
+    """A dry run must only plan the sync."""
+
+    def setUp(self):
+        super().setUp()
+        # A document which a real sync would delete, as it is not in the export
+        Document.objects.create(
+            project=self.project,
+            document_id="999",
+            created_by=self.user,
+            modified_by=self.user,
+        )
+
+        export_path = Path(self.media_root) / "transkribus_exports" / "export.zip"
+        export_path.parent.mkdir(parents=True)
+        with zipfile.ZipFile(export_path, "w") as zip_ref:
+            zip_ref.writestr(
+                "123/page/0001.xml", PAGE_XML.format(doc_id="123", page_id=10, page_nr=1)
+            )
+        self.project.downloaded_zip_file.name = "transkribus_exports/export.zip"
+        self.project.save(current_user=self.user)
+
+    def get_writes(self, queries):
+        """Return the writing queries, except those to the task object."""
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].split(" ", 1)[0] in ("INSERT", "UPDATE", "DELETE")
+            and '"twf_task"' not in query["sql"]
+        ]
+
+    def test_dry_run_reports_plan_without_writes(self):
+        """Test that a dry run reports the plan and writes nothing but the task text."""
+        stub_task = StubSyncTask(self.project, self.twf_task)
+        with CaptureQueriesContext(connection) as queries:
+            result = run_sync_dry_run(
+                stub_task, force_recreate_tags=False, delete_removed_documents=True
+            )
+
+        self.assertEqual(self.get_writes(queries), [])
+        self.assertEqual(result["status"], "dry_run")
+        self.assertEqual(result["plan"]["documents"]["add"], ["123"])
+        self.assertEqual(result["plan"]["documents"]["delete"], ["999"])
+        self.assertEqual(result["plan"]["pages"]["add"], 1)
+        self.assertTrue(Document.objects.filter(document_id="999").exists())
+        self.assertFalse(Page.objects.exists())
+        self.assertEqual(stub_task.result_meta["documents_added"], 1)
+        self.assertEqual(stub_task.result_meta["documents_deleted"], 1)
+        self.assertIn("DRY RUN: SYNC PLAN", self.twf_task.text)
+
+    def test_checkbox_starts_dry_run_without_writes(self):
+        """Test that a checked Dry Run checkbox, posted as "on", starts a dry run."""
+        stub_task = StubSyncTask(self.project, self.twf_task)
+        started = []
+
+        def delay(project_id, user_id, **kwargs):
+            started.append(kwargs)
+            if kwargs["dry_run"]:
+                run_sync_dry_run(
+                    stub_task, kwargs["force_recreate_tags"], kwargs["delete_removed_documents"]
+                )
+            return SimpleNamespace(id="dry-run-task")
+
+        request = RequestFactory().post("/", {"dry_run": "on", "delete_removed_documents": "on"})
+        request.session = {"project_id": self.project.id}
+        request.user = self.user
+
+        with mock.patch("twf.tasks.task_triggers.extract_zip_export_task") as task:
+            task.delay.side_effect = delay
+            with CaptureQueriesContext(connection) as queries:
+                start_extraction(request)
+
+        self.assertEqual(
+            started,
+            [{"force_recreate_tags": False, "delete_removed_documents": True, "dry_run": True}],
+        )
+        self.assertEqual(self.get_writes(queries), [])
+        self.assertTrue(Document.objects.filter(document_id="999").exists())
+        self.assertEqual(stub_task.result_meta["documents_deleted"], 1)
@@ -0,0 +1,40 @@
+"""Test cases for the document and page sync of DocumentPageSyncEngine."""
+
+from pathlib import Path
+
+from twf.models import Document, DocumentSyncHistory, Page
+from twf.tasks.structure_tasks import DocumentPageSyncEngine
+from twf.tests.sync_helpers import PAGE_XML, StubSyncTask, SyncTestCase
+
+
+class DocumentPageSyncEngineTest(SyncTestCase):
+    """A sync must write the documents, pages and the sync history of its task."""
+
+    def write_page_files(self, doc_id, page_count):
+        """Write PAGE XML files of a document and return their paths."""
+        files = []
+        for page_nr in range(1, page_count + 1):
+            path = Path(self.media_root) / f"{doc_id}_{page_nr}.xml"
+            path.write_text(PAGE_XML.format(doc_id=doc_id, page_id=page_nr * 10, page_nr=page_nr))
+            files.append(path)
+        return files
+
+    def test_sync_writes_documents_pages_and_history(self):
+        """Test that a sync with new pages creates them in bulk, with the task's history."""
+        engine = DocumentPageSyncEngine(
+            self.project, self.user, StubSyncTask(self.project, self.twf_task), [], batch_size=1
+        )
+        engine.sync_page_files(self.write_page_files("123", 2))
+        engine.write_sync_history()
+
+        self.assertEqual(engine.stats["added"], 1)
+        self.assertEqual(engine.stats["pages_added"], 2)
+        document = Document.objects.get(project=self.project, document_id="123")
+        self.assertEqual(document.created_by, self.user)
+        pages = Page.objects.filter(document=document).order_by("tk_page_number")
+        self.assertEqual([page.tk_page_number for page in pages], [1, 2])
+        self.assertTrue(all(page.modified_by == self.user for page in pages))
+        history = DocumentSyncHistory.objects.get(document=document)
+        self.assertEqual(history.task, self.twf_task)
+        self.assertEqual(history.sync_type, "created")
+        self.assertEqual(len(history.changes["pages"]["added"]), 2)
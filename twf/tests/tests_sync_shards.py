@@ -0,0 +1,84 @@
+"""Test cases for the sharded mode of the Transkribus sync."""
+
+import zipfile
+from pathlib import Path
+
+from twf.models import TaskLogLine
+from twf.tasks.structure_tasks import (
+    build_sharded_sync,
+    merge_shard_logs,
+    report_shard_to_parent,
+)
+from twf.tests.sync_helpers import PAGE_XML, StubSyncTask, SyncTestCase
+
+
+class StubShardedSyncTask(StubSyncTask):
+    """Stands in for the BaseTWFTask splitting a sync into shards."""
+
+    def flush_progress(self):
+        """Ignore the progress."""
+
+
+class ShardedSyncTest(SyncTestCase):
+    """The shards of a sync report to the task object of the sync."""
+
+    def setUp(self):
+        super().setUp()
+        export_path = Path(self.media_root) / "transkribus_exports" / "export.zip"
+        export_path.parent.mkdir(parents=True)
+        with zipfile.ZipFile(export_path, "w") as zip_ref:
+            for doc_id in ("1", "2", "3"):
+                zip_ref.writestr(
+                    f"{doc_id}/page/0001.xml",
+                    PAGE_XML.format(doc_id=doc_id, page_id=int(doc_id) * 10, page_nr=1),
+                )
+        self.project.downloaded_zip_file.name = "transkribus_exports/export.zip"
+        self.project.save(current_user=self.user)
+
+    def test_completed_shards_are_skipped(self):
+        """Test that the shards in the checkpoint are not synced again."""
+        checkpoint = {
+            "started_at": "2026-03-01T10:00:00+00:00",
+            "shard_results": {"1|2": {"status": "success", "shard_key": "1|2"}},
+        }
+        sync_chord = build_sharded_sync(
+            StubShardedSyncTask(self.project, self.twf_task),
+            self.project.downloaded_zip_file,
+            2,
+            True,
+            checkpoint,
+        )
+
+        shard_kwargs = [shard.kwargs for shard in sync_chord.tasks]
+        self.assertEqual([kwargs["shard_key"] for kwargs in shard_kwargs], ["3"])
+        self.assertEqual(shard_kwargs[0]["parent_task_id"], self.twf_task.pk)
+        self.assertEqual(shard_kwargs[0]["pending_shard_count"], 1)
+        self.assertIn("1 shard(s) were synced before the interruption", self.twf_task.text)
+        self.twf_task.refresh_from_db()
+        self.assertEqual(self.twf_task.total_items, 1)
+
+    def test_shards_count_in_parent_progress(self):
+        """Test that finished shards advance the counters and the progress of the sync."""
+        report_shard_to_parent(self.twf_task.pk, 4, failed=False)
+        report_shard_to_parent(self.twf_task.pk, 4, failed=True)
+
+        self.twf_task.refresh_from_db()
+        self.assertEqual(self.twf_task.processed_items, 2)
+        self.assertEqual(self.twf_task.successful_items, 1)
+        self.assertEqual(self.twf_task.failed_items, 1)
+        self.assertEqual(self.twf_task.progress, 50)
+
+    def test_shard_logs_are_merged(self):
+        """Test that the log of a failed shard is appended to the log of the sync."""
+        shard_task = self.create_sync_task("shard-task", "FAILURE")
+        shard_task.text = "Task initiated.\n"
+        shard_task.save()
+        TaskLogLine.objects.create(task=shard_task, seq=1, text="Shard log line.\n")
+
+        merge_shard_logs(
+            StubSyncTask(self.project, self.twf_task),
+            [{"status": "failed", "shard_number": 2, "task_id": shard_task.pk}],
+        )
+
+        self.assertIn("--- Shard 2 (task shard-task) ---", self.twf_task.text)
+        self.assertIn("Task initiated.\nShard log line.\n", self.twf_task.text)
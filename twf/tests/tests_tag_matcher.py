@@ -0,0 +1,35 @@
+"""Test cases for the bucketed SmartTagMatcher in tags_utils.py."""
+
+from django.test import SimpleTestCase
+
+from twf.utils.tag_matcher_benchmark import build_synthetic_page, summarize_result
+from twf.utils.tags_utils import SmartTagMatcher
+
+
+class SmartTagMatcherIndexTest(SimpleTestCase):
+    """The indexed matcher must give the same result as scoring all pairs."""
+
+    def assert_same_result(self, page, old_tags, new_tags_data):
+        """Match with and without the index and compare the results."""
+        summaries = []
+        for indexed in (False, True):
+            matcher = SmartTagMatcher(indexed=indexed)
+            result = matcher.match_tags(old_tags, new_tags_data, page)
+            summaries.append(summarize_result(result, matcher))
+        self.assertEqual(summaries[0], summaries[1])
+
+    def test_same_result_as_all_pairs(self):
+        """Test synthetic pages with different shares of legacy tags."""
+        for seed in range(5):
+            for legacy_share in (0, 0.1, 1):
+                with self.subTest(seed=seed, legacy_share=legacy_share):
+                    self.assert_same_result(
+                        *build_synthetic_page(15, 6, legacy_share, seed)
+                    )
+
+    def test_new_tags_without_line_id(self):
+        """Test that new tags without line ID are scored against all tags of their type."""
+        page, old_tags, new_tags_data = build_synthetic_page(15, 6, 0.1, seed=1)
+        for tag_data in new_tags_data[::3]:
+            tag_data["line_id"] = ""
+        self.assert_same_result(page, old_tags, new_tags_data)
@@ -0,0 +1,105 @@
+"""Test cases for reserving tags for the tag workflows."""
+
+from unittest import mock
+
+from django.db import connections, transaction
+from django.test import TestCase, TransactionTestCase
+
+from twf.models import Document, Page, PageTag, Project, User, Workflow
+from twf.workflows.tag_workflows import (
+    create_tag_grouping_workflow,
+    reserve_tag_variations,
+    reserve_tags,
+)
+
+
+class ReservationTestMixin:
+    """Creates a project with a page with tags."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="reserveuser", password="password123", email="reserveuser@example.com"
+        )
+        self.project = Project(
+            title="Reservation Project",
+            collection_id="reservation_collection",
+            description="A test project",
+            owner=self.user.profile,
+        )
+        self.project.save(current_user=self.user)
+        document = Document.objects.create(project=self.project, document_id="123")
+        self.page = Page.objects.create(document=document, tk_page_id="10", tk_page_number=1)
+        for variation, count in (("Basel", 3), ("Bern", 2), ("Genf", 1)):
+            for _ in range(count):
+                PageTag.objects.create(
+                    page=self.page, project=self.project, variation=variation,
+                    variation_type="place",
+                )
+
+    def get_available_tags(self):
+        """Return the available place tags of the project."""
+        return PageTag.objects.filter(
+            project=self.project,
+            variation_type="place",
+            dictionary_entry__isnull=True,
+            is_parked=False,
+            is_reserved=False,
+        )
+
+
+class ReserveTagsTest(ReservationTestMixin, TestCase):
+    """Reservations take a fixed number of queries and whole variations."""
+
+    def test_variations_reserved_with_all_their_tags(self):
+        """Test that all tags of each chosen variation are reserved."""
+        with transaction.atomic(), self.assertNumQueries(3):
+            variations, tag_ids = reserve_tag_variations(self.get_available_tags(), 2)
+
+        self.assertEqual(variations, ["Basel", "Bern"])
+        reserved = PageTag.objects.filter(is_reserved=True)
+        self.assertEqual(set(reserved.values_list("id", flat=True)), set(tag_ids))
+        self.assertEqual(reserved.count(), 5)
+
+    def test_query_count_does_not_grow_with_item_count(self):
+        """Test that reserving more tags takes the same queries."""
+        for item_count in (1, 6):
+            with self.subTest(item_count=item_count):
+                PageTag.objects.update(is_reserved=False)
+                with transaction.atomic(), self.assertNumQueries(2):
+                    tag_ids = reserve_tags(self.get_available_tags(), item_count)
+                self.assertEqual(len(tag_ids), item_count)
+
+    def test_failed_workflow_creation_releases_tags(self):
+        """Test that the tags are not reserved if the workflow cannot be created."""
+        with mock.patch.object(Workflow.objects, "create", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                create_tag_grouping_workflow(self.project, self.user, "place", item_count=2)
+
+        self.assertFalse(PageTag.objects.filter(is_reserved=True).exists())
+
+
+class ConcurrentReservationTest(ReservationTestMixin, TransactionTestCase):
+    """A reservation skips the variations locked by a parallel one."""
+
+    def test_locked_variation_is_skipped(self):
+        """Test that a second connection's lock makes the reservation take the next variation."""
+        first_basel_tag = PageTag.objects.filter(variation="Basel").order_by("id").first()
+        other_connection = connections.create_connection("default")
+        self.addCleanup(other_connection.close)
+        with other_connection.cursor() as cursor:
+            cursor.execute("BEGIN")
+            cursor.execute(
+                f"SELECT id FROM {PageTag._meta.db_table} WHERE id = %s FOR UPDATE",
+                [first_basel_tag.id],
+            )
+
+            with transaction.atomic():
+                variations, tag_ids = reserve_tag_variations(self.get_available_tags(), 1)
+
+            cursor.execute("ROLLBACK")
+
+        self.assertEqual(variations, ["Bern"])
+        self.assertEqual(
+            set(PageTag.objects.filter(is_reserved=True).values_list("variation", flat=True)),
+            {"Bern"},
+        )
@@ -0,0 +1,88 @@
+"""Test cases for the buffered task log in task_log.py."""
+
+from django.test import SimpleTestCase, override_settings
+
+from twf.models import TaskLogLine
+
+from twf.tasks.task_log import (
+    ITEM_LINE_SAMPLE,
+    LOG_ITEMS,
+    LOG_PROGRESS,
+    LOG_SUMMARY,
+    TaskLogBuffer,
+)
+from twf.tasks.task_status import get_task_log_update
+from twf.tests.sync_helpers import SyncTestCase
+
+
+class RecordingLogBuffer(TaskLogBuffer):
+    """TaskLogBuffer which records the saved lines instead of inserting them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.saved = []
+        self.saves = 0
+
+    def save_lines(self, lines):
+        """Record the lines."""
+        self.saved.extend(lines)
+        self.saves += 1
+
+
+@override_settings(TWF_TASK_LOG_FLUSH_INTERVAL=3600, TWF_TASK_LOG_FLUSH_LINES=1000)
+class TaskLogBufferTest(SimpleTestCase):
+    """The buffer must keep the lines in order and save them at once."""
+
+    def test_lines_are_saved_on_flush(self):
+        """Test that lines are only saved when flushed, numbered after the last line."""
+        buffer = RecordingLogBuffer(object(), verbosity=LOG_ITEMS, last_seq=4)
+        buffer.write("first\n")
+        buffer.write("second\n", LOG_ITEMS)
+        self.assertEqual(buffer.saved, [])
+
+        buffer.flush()
+        self.assertEqual(buffer.saved, [(5, "first\n"), (6, "second\n")])
+        self.assertEqual(buffer.saves, 1)
+
+    def test_item_lines_are_sampled(self):
+        """Test that item lines above the verbosity are sampled and counted."""
+        buffer = RecordingLogBuffer(object(), verbosity=LOG_SUMMARY)
+        buffer.write("progress\n", LOG_PROGRESS)
+        for i in range(ITEM_LINE_SAMPLE + 5):
+            buffer.write(f"item {i}\n", LOG_ITEMS)
+        buffer.flush()
+
+        lines = [text for _, text in buffer.saved]
+        self.assertNotIn("progress\n", lines)
+        self.assertEqual(len(lines), ITEM_LINE_SAMPLE + 1)
+        self.assertIn("5 more item lines", lines[-1])
+
+    @override_settings(TWF_TASK_LOG_FLUSH_LINES=3)
+    def test_flush_on_line_threshold(self):
+        """Test that the buffer is saved when the line threshold is reached."""
+        buffer = RecordingLogBuffer(object())
+        for i in range(7):
+            buffer.write(f"line {i}\n")
+        self.assertEqual(buffer.saves, 2)
+        self.assertEqual(len(buffer.lines), 1)
+        self.assertEqual(buffer.last_seq, 6)
+
+
+class TaskLogUpdateTest(SyncTestCase):
+    """The incremental log update must include the task text once."""
+
+    def test_first_update_starts_with_task_text(self):
+        """Test that the task text is only sent with the first update."""
+        task = self.create_sync_task("log-update", "PROGRESS")
+        task.text = "Task initiated at 2026-01-01\n"
+        task.save()
+        TaskLogLine.objects.create(task=task, seq=1, text="first\n")
+        TaskLogLine.objects.create(task=task, seq=2, text="second\n")
+
+        update = get_task_log_update(task, 0)
+        self.assertEqual(update["lines"], ["Task initiated at 2026-01-01\n", "first\n", "second\n"])
+        self.assertEqual(update["last_seq"], 2)
+
+        update = get_task_log_update(task, 1)
+        self.assertEqual(update["lines"], ["second\n"])
+        self.assertEqual(update["last_seq"], 2)
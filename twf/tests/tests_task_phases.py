@@ -0,0 +1,44 @@
+"""Test cases for the phase timing in task_phases.py."""
+
+from django.test import SimpleTestCase
+
+from twf.tasks.task_phases import PhaseTimer, add_phase_timing
+
+
+class PhaseTimingTest(SimpleTestCase):
+    """The timings of repeated phases must be summed up, in the order of the phases."""
+
+    def make_timer(self, wall_time, cpu_time, queries, db_time):
+        timer = PhaseTimer()
+        timer.wall_time = wall_time
+        timer.cpu_time = cpu_time
+        timer.queries.count = queries
+        timer.queries.time = db_time
+        return timer
+
+    def test_repeated_phases_are_summed(self):
+        """Test that a phase run twice has one timing with the sums."""
+        phases = []
+        add_phase_timing(phases, "parse", self.make_timer(1.5, 1.0, 10, 0.2))
+        add_phase_timing(phases, "tag_sync", self.make_timer(2.0, 0.5, 100, 1.0))
+        add_phase_timing(phases, "parse", self.make_timer(0.5, 0.25, 5, 0.1))
+
+        self.assertEqual([phase["name"] for phase in phases], ["parse", "tag_sync"])
+        self.assertEqual(
+            phases[0],
+            {
+                "name": "parse",
+                "runs": 2,
+                "wall_time": 2.0,
+                "cpu_time": 1.25,
+                "queries": 15,
+                "db_time": 0.3,
+            },
+        )
+
+    def test_timer_measures_time(self):
+        """Test that the timer measures a phase without queries."""
+        with PhaseTimer() as timer:
+            sum(range(1000))
+        self.assertGreaterEqual(timer.wall_time, 0)
+        self.assertEqual(timer.queries.count, 0)
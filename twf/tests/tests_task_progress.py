@@ -0,0 +1,46 @@
+"""Test cases for the throttled progress updates in task_progress.py."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from twf.tasks.task_progress import ProgressPublisher
+
+
+class ProgressPublisherTest(SimpleTestCase):
+    """The publisher must coalesce the updates and never lose the last one."""
+
+    def setUp(self):
+        self.written = []
+        self.publisher = ProgressPublisher(
+            lambda progress, text: self.written.append((progress, text)),
+            interval_ms=1000,
+            step=10,
+        )
+
+    def test_updates_are_coalesced(self):
+        """Test that only the first update and updates after a step are written."""
+        for progress in range(25):
+            self.publisher.publish(progress, f"item {progress}")
+        self.assertEqual([progress for progress, _ in self.written], [0, 10, 20])
+
+    def test_final_update_is_written(self):
+        """Test that 100% is always written and that flush writes the pending update."""
+        self.publisher.publish(0, "start")
+        self.publisher.publish(3, "pending")
+        self.publisher.publish(100, "done")
+        self.assertEqual(self.written[-1], (100, "done"))
+
+        self.publisher.publish(100, "done")
+        self.publisher.flush()
+        self.publisher.flush()
+        self.assertEqual(len(self.written), 3)
+
+    def test_update_after_interval(self):
+        """Test that a small step is written once the interval has passed."""
+        with mock.patch("twf.tasks.task_progress.time.monotonic", return_value=0):
+            self.publisher.publish(0, "start")
+            self.publisher.publish(1, "small step")
+        with mock.patch("twf.tasks.task_progress.time.monotonic", return_value=1.5):
+            self.publisher.publish(2, "later")
+        self.assertEqual(self.written, [(0, "start"), (2, "later")])
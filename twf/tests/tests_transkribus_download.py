@@ -0,0 +1,95 @@
+"""Test cases for continuing an interrupted download of the Transkribus export."""
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from twf.tasks.transkribus_download_tasks import download_with_resume, get_validator_path
+
+NEW_EXPORT = b"0123456789"
+
+
+class FakeResponse:
+    """A streamed response of requests.get."""
+
+    def __init__(self, status_code, body, headers):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        """Accept every status of the test responses."""
+
+    def iter_content(self, chunk_size):
+        """Return the body in one chunk."""
+        return [self.body]
+
+
+class StubDownloadTask:
+    """Stands in for the BaseTWFTask running the download."""
+
+    def log(self, text, level=0):
+        """Ignore the log lines."""
+
+    def update_progress(self, progress, text="In progress"):
+        """Ignore the progress."""
+
+
+class DownloadWithResumeTest(SimpleTestCase):
+    """A partial download may only be continued if it is part of the same file."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.part_path = os.path.join(self.directory, "export.zip.42.part")
+
+    def write_part_file(self, content, validator=None):
+        with open(self.part_path, "wb") as part_file:
+            part_file.write(content)
+        if validator:
+            with open(get_validator_path(self.part_path), "w", encoding="utf-8") as f:
+                f.write(validator)
+
+    def download(self, response):
+        with mock.patch(
+            "twf.tasks.transkribus_download_tasks.requests.get", return_value=response
+        ) as get:
+            size = download_with_resume(StubDownloadTask(), "https://example.org/x", self.part_path)
+        with open(self.part_path, "rb") as part_file:
+            return size, part_file.read(), get.call_args.kwargs["headers"]
+
+    def test_part_file_without_validator_is_discarded(self):
+        """Test that a part file of unknown origin is not continued."""
+        self.write_part_file(b"stale")
+        size, content, headers = self.download(
+            FakeResponse(200, NEW_EXPORT, {"content-length": "10", "etag": '"new"'})
+        )
+        self.assertEqual(headers, {})
+        self.assertEqual((size, content), (10, NEW_EXPORT))
+
+    def test_changed_file_is_downloaded_again(self):
+        """Test that a 200 response to If-Range replaces the part file."""
+        self.write_part_file(b"stale", validator='"old"')
+        size, content, headers = self.download(
+            FakeResponse(200, NEW_EXPORT, {"content-length": "10", "etag": '"new"'})
+        )
+        self.assertEqual(headers, {"Range": "bytes=5-", "If-Range": '"old"'})
+        self.assertEqual((size, content), (10, NEW_EXPORT))
+        self.assertFalse(os.path.exists(get_validator_path(self.part_path)))
+
+    def test_same_file_is_continued(self):
+        """Test that a 206 response is appended to the part file."""
+        self.write_part_file(NEW_EXPORT[:5], validator='"same"')
+        size, content, _ = self.download(
+            FakeResponse(206, NEW_EXPORT[5:], {"content-range": "bytes 5-9/10"})
+        )
+        self.assertEqual((size, content), (10, NEW_EXPORT))
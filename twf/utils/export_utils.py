@@ -476,7 +476,7 @@ def get_dictionary_csv_data(pk, include_metadata=True, include_uses=False):
 
 def get_tags_json_data(project_id):
     """Get the JSON data for the tags."""
-    tags = PageTag.objects.filter(page__document__project_id=project_id)
+    tags = PageTag.objects.filter(project_id=project_id)
 
     json_data = {"entries": []}
 
@@ -498,7 +498,7 @@ def get_tags_json_data(project_id):
 def get_tags_csv_data(project_id):
     """Get the CSV data for the tags."""
     csv_data = "entry;type;documents\n"
-    tags = PageTag.objects.filter(page__document__project_id=project_id)
+    tags = PageTag.objects.filter(project_id=project_id)
     for tag in tags:
         documents = (
             Document.objects.filter(pages__tags=tag)
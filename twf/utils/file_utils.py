@@ -1,5 +1,6 @@
 """This module contains utility functions for working with files and directories."""
 
+import hashlib
 import shutil
 from pathlib import Path
 
@@ -24,3 +25,8 @@ def delete_all_in_folder(folder_path):
                 shutil.rmtree(item_path)
         except Exception as e:
             print(f"Failed to delete {item_path}. Reason: {e}")
+
+
+def compute_content_digest(content):
+    """Return the SHA-256 hex digest of a bytes object."""
+    return hashlib.sha256(content).hexdigest()
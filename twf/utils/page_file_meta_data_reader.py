@@ -8,7 +8,8 @@ def extract_transkribus_file_metadata(file_path):
     """Extract metadata from a Transkribus XML file.
 
     Args:
-        file_path (str): The path to the Transkribus XML file.
+        file_path (str or file-like object): The path to the Transkribus XML file,
+            or an open binary stream of its content.
 
     Returns:
         dict: A dictionary containing the metadata.
@@ -48,3 +49,32 @@ def extract_transkribus_file_metadata(file_path):
         return {"error": "TranskribusMetadata block not found in the file."}
 
     return result
+
+
+def extract_transkribus_header_metadata(file_path):
+    """Extract the TranskribusMetadata of a Transkribus XML file without parsing all of it.
+
+    The TranskribusMetadata block is in the Metadata element at the top of the file, so
+    the file is parsed incrementally and parsing stops once the block (or the Page
+    element) is reached. Used where many files are only inspected, e.g. for a sync plan.
+
+    Args:
+        file_path (str or file-like object): The path to the Transkribus XML file,
+            or an open binary stream of its content.
+
+    Returns:
+        dict: A dictionary containing the metadata.
+    """
+    for _, element in ETree.iterparse(file_path, events=("end",)):
+        tag = element.tag.split("}")[-1]
+        if tag == "TranskribusMetadata":
+            result = {}
+            for t_property in element.iter():
+                if t_property.tag.split("}")[-1] == "Property":
+                    result[t_property.attrib.get("key")] = t_property.attrib.get("value")
+            result.update(element.attrib)
+            return result
+        if tag == "Metadata":
+            break
+
+    return {"error": "TranskribusMetadata block not found in the file."}
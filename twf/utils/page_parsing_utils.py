@@ -0,0 +1,54 @@
+"""This module contains the functions for parsing PAGE XML files.
+
+The functions in this module do not touch the database. This keeps them safe to run in
+worker processes of a process pool, where they are used to parse many pages in parallel.
+"""
+
+import logging
+
+from simple_alto_parser import PageFileParser
+
+PAGE_PARSER_CONFIG = {
+    "line_type": "TextRegion",
+    "logging": {"level": logging.WARN},
+    "export": {
+        "json": {
+            "print_files": True,
+            "print_filename": True,
+            "print_file_meta_data": True,
+        }
+    },
+}
+
+
+def parse_page_file(xml_file_path):
+    """Parse a PAGE XML file.
+
+    Args:
+        xml_file_path (str): The path to the PAGE XML file.
+
+    Returns:
+        dict: The standalone JSON object of the parsed page.
+    """
+    page_parser = PageFileParser(parser_config=PAGE_PARSER_CONFIG)
+    page_parser.add_file(xml_file_path)
+    page_parser.parse()
+    return page_parser.get_alto_files()[0].get_standalone_json_object()
+
+
+def safe_parse_page_file(xml_file_path):
+    """Parse a PAGE XML file without raising.
+
+    Used as the process pool worker, so that a single broken page does not abort
+    the whole batch.
+
+    Args:
+        xml_file_path (str): The path to the PAGE XML file.
+
+    Returns:
+        tuple: (parsed_data, error) where exactly one of both is None.
+    """
+    try:
+        return parse_page_file(xml_file_path), None
+    except Exception as e:
+        return None, str(e)
@@ -0,0 +1,125 @@
+"""This module contains the content-addressed store for PAGE XML files.
+
+Each distinct PAGE XML content is stored once, under page_xml/<aa>/<bb>/<digest>.xml, and
+Page.xml_file points to that path. Pages with identical content (repeated syncs, copied
+projects) share the file. A PageXmlBlob row per file counts the referencing pages; files
+are never deleted when a page lets go of them, the gc_page_xml management command removes
+unreferenced files.
+
+Files stored before the store existed (transkribus_exports/<collection_id>/<uuid>.xml)
+belong to a single page and are still deleted together with it.
+"""
+
+import os
+from collections import Counter
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import F
+from django.utils import timezone
+
+from twf.models import PageXmlBlob
+from twf.utils.file_utils import compute_content_digest
+
+STORE_ROOT = "page_xml"
+
+
+def get_store_path(digest):
+    """Return the storage path of the content with this digest."""
+    return f"{STORE_ROOT}/{digest[:2]}/{digest[2:4]}/{digest}.xml"
+
+
+def is_stored_file(name):
+    """Return True if the file name is a path in the content-addressed store."""
+    return bool(name) and name.startswith(f"{STORE_ROOT}/")
+
+
+def get_digest_from_path(name):
+    """Return the digest of a file in the store from its path."""
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def store_page_xml(content, digest=None):
+    """Store PAGE XML content, unless the same content is stored already.
+
+    The reference count is not changed, see adjust_page_xml_references.
+
+    Args:
+        content (bytes): The PAGE XML content.
+        digest (str): The SHA-256 hex digest of the content, if already known.
+
+    Returns:
+        str: The storage path of the content.
+    """
+    digest = digest or compute_content_digest(content)
+    name = get_store_path(digest)
+    if not default_storage.exists(name):
+        saved_name = default_storage.save(name, ContentFile(content))
+        if saved_name != name:
+            # Stored concurrently by another worker, the storage picked another name
+            default_storage.delete(saved_name)
+
+    blob, created = PageXmlBlob.objects.get_or_create(
+        digest=digest, defaults={"size": len(content)}
+    )
+    if not created:
+        # Protects the file from a concurrent garbage collection
+        PageXmlBlob.objects.filter(pk=blob.pk).update(last_stored_at=timezone.now())
+    return name
+
+
+def adjust_page_xml_references(deltas):
+    """Apply reference count changes.
+
+    Args:
+        deltas (dict): digest -> change of the reference count.
+    """
+    digests_by_delta = {}
+    for digest, delta in deltas.items():
+        if delta:
+            digests_by_delta.setdefault(delta, []).append(digest)
+
+    for delta, digests in digests_by_delta.items():
+        PageXmlBlob.objects.filter(digest__in=digests).update(
+            ref_count=F("ref_count") + delta
+        )
+
+
+def share_page_xml_file(page):
+    """Add a reference to the XML file of a page, for a copy of the page.
+
+    A file from before the store is copied into the store first, the page itself keeps it.
+
+    Args:
+        page (Page): The page to copy.
+
+    Returns:
+        tuple: (name, digest) The storage path and digest for the copy.
+    """
+    name = page.xml_file.name
+    if is_stored_file(name):
+        digest = get_digest_from_path(name)
+    else:
+        with page.xml_file.open("rb") as xml_file:
+            content = xml_file.read()
+        digest = compute_content_digest(content)
+        name = store_page_xml(content, digest)
+    adjust_page_xml_references({digest: 1})
+    return name, digest
+
+
+def release_page_xml_files(names):
+    """Let go of the XML files of pages which are deleted or get a new file.
+
+    Files in the store lose a reference. Files from before the store are deleted.
+
+    Args:
+        names (iterable): The xml_file names of the pages.
+    """
+    deltas = Counter()
+    for name in names:
+        if is_stored_file(name):
+            deltas[get_digest_from_path(name)] -= 1
+        elif name:
+            default_storage.delete(name)
+    adjust_page_xml_references(deltas)
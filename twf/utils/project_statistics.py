@@ -49,7 +49,7 @@ def get_document_statistics(project):
 def get_tag_statistics(project):
     """Get statistics for tags."""
 
-    total_tags = PageTag.objects.filter(page__document__project=project).count()
+    total_tags = PageTag.objects.filter(project=project).count()
     total_pages = Page.objects.filter(document__project=project).count()
 
     # Calculate tags per page
@@ -57,15 +57,15 @@ def get_tag_statistics(project):
 
     # Calculate open and resolved tags
     open_tags = PageTag.objects.filter(
-        page__document__project=project, is_parked=False
+        project=project, is_parked=False
     ).count()
     resolved_tags = PageTag.objects.filter(
-        page__document__project=project, is_parked=True
+        project=project, is_parked=True
     ).count()
 
     # Get tag types distribution
     tag_types = (
-        PageTag.objects.filter(page__document__project=project)
+        PageTag.objects.filter(project=project)
         .values("variation_type")
         .annotate(count=Count("id"))
         .order_by("-count")[:5]
@@ -89,7 +89,7 @@ def get_dictionary_statistics(project):
     # Top entries per dictionary type
     top_entries_per_type = defaultdict(list)
     entry_counts = (
-        PageTag.objects.filter(page__document__project=project)
+        PageTag.objects.filter(project=project)
         .values(
             "dictionary_entry__id",
             "dictionary_entry__label",
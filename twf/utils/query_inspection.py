@@ -0,0 +1,92 @@
+"""This module records the database queries of a block of code, grouped by their shape.
+
+A query shape is the SQL of a query with its literals and the lengths of its IN and
+VALUES lists removed, so that the same query for different rows has the same shape. A
+shape repeated many times within a request usually means that a queryset is evaluated
+once per row (an N+1 query). The QueryRecorder is used by the QueryInspectionMiddleware
+and by the query budget assertions of the tests.
+"""
+
+import re
+import time
+import traceback
+from pathlib import Path
+
+from django.conf import settings
+
+# Number of project stack frames kept for a repeated query
+STACK_DEPTH = 8
+
+_IN_LIST = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_VALUES_LIST = re.compile(r"(\(\?\))(?:\s*,\s*\(\?\))+")
+_NUMBER = re.compile(r"\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def get_query_shape(sql):
+    """Return the shape of an SQL statement."""
+    shape = _IN_LIST.sub("(?)", sql)
+    shape = _NUMBER.sub("?", shape).replace("%s", "?")
+    shape = _VALUES_LIST.sub(r"\1", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def get_project_stack():
+    """Return the formatted innermost stack frames of the project's own code."""
+    base_dir = str(Path(settings.BASE_DIR))
+    this_file = str(Path(__file__))
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(base_dir)
+        and frame.filename != this_file
+        and "site-packages" not in frame.filename
+    ]
+    return "".join(traceback.format_list(frames[-STACK_DEPTH:]))
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper recording the number and time of the queries per shape.
+
+    The stack of a shape is recorded when the shape is executed the second time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.shapes = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            shape = get_query_shape(sql)
+            query = self.shapes.setdefault(
+                shape, {"shape": shape, "count": 0, "time": 0.0, "stack": ""}
+            )
+            query["count"] += 1
+            query["time"] += duration
+            if query["count"] == 2:
+                query["stack"] = get_project_stack()
+            self.count += 1
+            self.time += duration
+
+    def get_repeated(self, threshold):
+        """Return the shapes executed at least threshold times, most frequent first."""
+        return sorted(
+            (query for query in self.shapes.values() if query["count"] >= threshold),
+            key=lambda query: query["count"],
+            reverse=True,
+        )
+
+    def format_report(self, threshold):
+        """Return a report of the shapes executed at least threshold times."""
+        lines = [f"{self.count} queries in {self.time:.3f}s"]
+        for query in self.get_repeated(threshold):
+            lines.append(
+                f"\n{query['count']}x ({query['time']:.3f}s): {query['shape']}\n{query['stack']}"
+            )
+        return "\n".join(lines)
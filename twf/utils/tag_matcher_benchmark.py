@@ -0,0 +1,96 @@
+"""Synthetic tag-dense pages for comparing the SmartTagMatcher with scoring all pairs.
+
+Used by the benchmark_tag_matcher command and the tests of the matcher.
+"""
+
+import random
+
+from twf.models import Page, PageTag
+
+TAG_TYPES = ["person", "place", "organization", "date"]
+
+
+def build_synthetic_page(num_lines, tags_per_line, legacy_share=0.02, seed=0):
+    """
+    Build the old tags and new tag data of a synthetic page, without database access.
+
+    The new tags are the old tags after a transcription edit: offsets shift, some
+    variations get a typo fixed, some tags are removed and some are added. A share of the
+    old tags are legacy tags without line ID.
+
+    Args:
+        num_lines: Number of lines on the page
+        tags_per_line: Number of tags per line
+        legacy_share: Share of old tags without line ID
+        seed: Seed of the random generator
+
+    Returns:
+        tuple: (page, old_tags, new_tags_data)
+    """
+    rng = random.Random(seed)
+    page = Page(tk_page_number=1)
+    old_tags = []
+    new_tags_data = []
+    tag_id = 0
+
+    for line in range(num_lines):
+        line_id = f"r1_l{line}"
+        for position in range(tags_per_line):
+            tag_id += 1
+            tag_type = rng.choice(TAG_TYPES)
+            variation = f"Name {rng.randint(0, 50)} {rng.choice('ABCDEFGH')}"
+            offset = position * 12
+            old_tags.append(
+                PageTag(
+                    id=tag_id,
+                    page=page,
+                    variation=variation,
+                    variation_type=tag_type,
+                    offset_in_line=offset,
+                    length=len(variation),
+                    additional_information={
+                        "line_id": "" if rng.random() < legacy_share else line_id,
+                        "continued": False,
+                    },
+                )
+            )
+
+            roll = rng.random()
+            if roll < 0.05:
+                continue  # Removed from the transcription
+            if roll < 0.15:
+                variation = variation[:-1] + rng.choice("xyz")  # Typo fixed
+            new_tags_data.append(
+                {
+                    "variation": variation,
+                    "type": tag_type,
+                    "offset": offset + rng.randint(0, 6),
+                    "length": len(variation),
+                    "continued": False,
+                    "line_id": line_id,
+                }
+            )
+            if roll > 0.95:  # Added in the transcription
+                new_tags_data.append(
+                    {
+                        "variation": f"Added {tag_id}",
+                        "type": rng.choice(TAG_TYPES),
+                        "offset": offset + 6,
+                        "length": len(f"Added {tag_id}"),
+                        "continued": False,
+                        "line_id": line_id,
+                    }
+                )
+
+    return page, old_tags, new_tags_data
+
+
+def summarize_result(result, matcher):
+    """Reduce a match_tags result and the ambiguous matches to comparable values."""
+    matches, unmatched_old, unmatched_new = result
+    return (
+        [(old_tag.id, id(new_tag_data), score) for old_tag, new_tag_data, score in matches],
+        [old_tag.id for old_tag in unmatched_old],
+        [id(new_tag_data) for new_tag_data in unmatched_new],
+        list(matcher.get_ambiguous_matches()),
+    )
@@ -0,0 +1,326 @@
+"""This module contains the precomputed dictionary entry suggestions for unassigned tags.
+
+For every distinct (variation, variation_type) of the unassigned tags of a project, the
+closest dictionary entries are stored in a TagSuggestionSet with its TagSuggestions. The
+refresh_tag_suggestions_task keeps them up to date: it runs after a sync and after
+dictionary edits, and only computes the suggestions of new tag texts and of tag texts close
+to a variation changed since their suggestions were computed. The grouping views read the
+stored suggestions; a tag text without suggestions yet is computed on the spot.
+"""
+
+from collections import defaultdict
+from itertools import batched
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+
+from twf.models import (
+    DictionaryEntry,
+    Project,
+    PageTag,
+    TagSuggestion,
+    TagSuggestionSet,
+    Variation,
+)
+from twf.utils.tags_utils import (
+    get_enrichment_types,
+    get_excluded_types,
+    get_translated_tag_type,
+    rank_closest_entries,
+)
+from twf.utils.variation_index import VariationIndex
+
+# Number of suggestions stored per tag text
+SUGGESTION_LIMIT = 5
+
+# Number of tag texts computed and written per transaction
+SUGGESTION_BATCH_SIZE = 200
+
+# Seconds to wait after a dictionary edit before refreshing, further edits join the refresh
+REFRESH_DELAY = 60
+
+# Cache shared by all web and worker processes, which debounces the refreshes
+REFRESH_CACHE = "shared"
+
+
+def get_unassigned_tag_keys(project):
+    """Return the distinct (variation, variation_type) of the project's unassigned tags
+    which are grouped into dictionary entries."""
+    return set(
+        PageTag.objects.filter(
+            project=project,
+            page__is_ignored=False,
+            dictionary_entry__isnull=True,
+        )
+        .exclude(variation_type__in=get_excluded_types(project))
+        .exclude(variation_type__in=list(get_enrichment_types(project)))
+        .values_list("variation", "variation_type")
+        .distinct()
+    )
+
+
+def get_changed_variations(project, dictionary_type, changed_since):
+    """Return the variations of the project's dictionaries of a type changed since a time.
+
+    Returns:
+        list: (variation_id, variation, entry_id, modified_at) tuples
+    """
+    return list(
+        Variation.objects.filter(
+            entry__dictionary__in=project.selected_dictionaries.filter(type=dictionary_type),
+            modified_at__gt=changed_since,
+        ).values_list("id", "variation", "entry_id", "modified_at")
+    )
+
+
+def is_affected_by_changes(suggestion_set, changes_index, changed_at):
+    """
+    Return True if changed variations could alter the suggestions of a set.
+
+    Args:
+        suggestion_set: dict with the set's 'variation', 'computed_at', 'count' and
+            'min_score'
+        changes_index: VariationIndex over the changed variations
+        changed_at: dict of variation_id -> modified_at of the changed variations
+    """
+    min_score = suggestion_set["min_score"] if suggestion_set["count"] >= SUGGESTION_LIMIT else 0
+    for variation_id, _, score in changes_index.search(suggestion_set["variation"]):
+        if score < min_score:
+            break
+        if changed_at[variation_id] > suggestion_set["computed_at"]:
+            return True
+    return False
+
+
+def store_tag_suggestions(project, suggestions, computed_at):
+    """
+    Write suggestion sets, replacing their previous suggestions.
+
+    Args:
+        project: Project object
+        suggestions: dict of (variation, variation_type) -> rank_closest_entries() result
+        computed_at: The time the computation started
+    """
+    with transaction.atomic():
+        suggestion_sets = TagSuggestionSet.objects.bulk_create(
+            [
+                TagSuggestionSet(
+                    project=project,
+                    variation=variation,
+                    variation_type=variation_type,
+                    computed_at=computed_at,
+                )
+                for variation, variation_type in suggestions
+            ],
+            update_conflicts=True,
+            unique_fields=["project", "variation", "variation_type"],
+            update_fields=["computed_at"],
+        )
+        TagSuggestion.objects.filter(suggestion_set__in=suggestion_sets).delete()
+        TagSuggestion.objects.bulk_create(
+            [
+                TagSuggestion(
+                    suggestion_set=suggestion_set,
+                    variation_id=variation_id,
+                    entry_id=entry_id,
+                    score=score,
+                    strong_match_count=strong_match_count,
+                    rank=rank,
+                )
+                for suggestion_set in suggestion_sets
+                for rank, (variation_id, entry_id, score, strong_match_count) in enumerate(
+                    suggestions[(suggestion_set.variation, suggestion_set.variation_type)]
+                )
+            ]
+        )
+
+
+def refresh_tag_suggestions(project, celery_task=None, full=False):
+    """
+    Bring the suggestion sets of a project up to date.
+
+    Sets of tag texts without unassigned tags are deleted. Missing sets are computed. Of
+    the existing sets, only those are recomputed whose tag text is close enough to a
+    variation changed after their computation to enter the suggestions.
+
+    Args:
+        project: Project object
+        celery_task: BaseTWFTask instance for progress tracking (optional)
+        full: If True, recompute all sets
+
+    Returns:
+        dict: The number of 'computed', 'unchanged' and 'deleted' sets
+    """
+    keys = get_unassigned_tag_keys(project)
+    existing = {
+        (suggestion_set["variation"], suggestion_set["variation_type"]): suggestion_set
+        for suggestion_set in TagSuggestionSet.objects.filter(project=project)
+        .annotate(count=Count("suggestions"), min_score=Min("suggestions__score"))
+        .values("id", "variation", "variation_type", "computed_at", "count", "min_score")
+    }
+
+    obsolete_ids = [
+        suggestion_set["id"]
+        for key, suggestion_set in existing.items()
+        if key not in keys
+    ]
+    for batch in batched(obsolete_ids, 1000):
+        TagSuggestionSet.objects.filter(id__in=batch).delete()
+
+    # Missing sets, and existing sets grouped by dictionary type
+    to_compute = []
+    sets_by_type = defaultdict(list)
+    for key in keys:
+        if full or key not in existing:
+            to_compute.append(key)
+        else:
+            sets_by_type[get_translated_tag_type(project, key[1])].append(existing[key])
+
+    # Only sets close to a variation changed after their computation are recomputed
+    checked_ids = []
+    for dictionary_type, suggestion_sets in sets_by_type.items():
+        changed_since = min(suggestion_set["computed_at"] for suggestion_set in suggestion_sets)
+        changes = get_changed_variations(project, dictionary_type, changed_since)
+        if not changes:
+            continue
+        changes_index = VariationIndex(
+            (variation_id, variation, entry_id) for variation_id, variation, entry_id, _ in changes
+        )
+        changed_at = {variation_id: modified_at for variation_id, _, _, modified_at in changes}
+        for suggestion_set in suggestion_sets:
+            if is_affected_by_changes(suggestion_set, changes_index, changed_at):
+                to_compute.append(
+                    (suggestion_set["variation"], suggestion_set["variation_type"])
+                )
+            else:
+                checked_ids.append(suggestion_set["id"])
+
+    # Unaffected sets are up to date with the changes
+    checked_at = timezone.now()
+    for batch in batched(checked_ids, 1000):
+        TagSuggestionSet.objects.filter(id__in=batch).update(computed_at=checked_at)
+
+    computed = 0
+    for batch in batched(sorted(to_compute), SUGGESTION_BATCH_SIZE):
+        # Dictionary changes during the computation make the sets stale again
+        computed_at = timezone.now()
+        suggestions = {
+            key: rank_closest_entries(project, key[0], key[1], limit=SUGGESTION_LIMIT)
+            for key in batch
+        }
+        store_tag_suggestions(project, suggestions, computed_at)
+        computed += len(batch)
+        if celery_task:
+            celery_task.update_progress(
+                int(computed / len(to_compute) * 100),
+                text=f"Computed suggestions for {computed}/{len(to_compute)} tag texts",
+            )
+
+    return {
+        "computed": computed,
+        "unchanged": len(keys) - computed,
+        "deleted": len(obsolete_ids),
+    }
+
+
+def get_tag_suggestions(page_tag):
+    """
+    Return the suggested dictionary entries for a tag, like get_closest_variations.
+
+    The tag's suggestion set is computed and stored if it does not exist yet.
+
+    Returns:
+        List of tuples: (variation, score, match_count)
+    """
+    project = page_tag.page.document.project
+    suggestion_set = TagSuggestionSet.objects.filter(
+        project=project,
+        variation=page_tag.variation,
+        variation_type=page_tag.variation_type,
+    ).first()
+
+    if suggestion_set is None:
+        key = (page_tag.variation, page_tag.variation_type)
+        computed_at = timezone.now()
+        store_tag_suggestions(
+            project,
+            {key: rank_closest_entries(project, *key, limit=SUGGESTION_LIMIT)},
+            computed_at,
+        )
+        suggestion_set = TagSuggestionSet.objects.get(
+            project=project, variation=key[0], variation_type=key[1]
+        )
+
+    suggestions = suggestion_set.suggestions.select_related(
+        "variation__entry"
+    ).prefetch_related("variation__entry__variations")
+    return [
+        (suggestion.variation, suggestion.score, suggestion.strong_match_count)
+        for suggestion in suggestions
+    ]
+
+
+def schedule_tag_suggestions_refresh(dictionary_id, user_id=None):
+    """
+    Refresh the suggestions of the projects using a dictionary, after it was edited.
+
+    The refresh starts after REFRESH_DELAY seconds; edits until then are covered by it.
+    The pending refreshes are tracked in the REFRESH_CACHE, so that edits in all processes
+    join the same refresh.
+
+    Args:
+        dictionary_id: ID of the edited dictionary
+        user_id: ID of the user who edited it (the project owner if None)
+    """
+    if not caches[REFRESH_CACHE].add(
+        f"tag_suggestions_refresh_{dictionary_id}", True, REFRESH_DELAY
+    ):
+        return
+
+    from twf.tasks.tags_tasks import refresh_tag_suggestions_task
+
+    projects = Project.objects.filter(selected_dictionaries__id=dictionary_id).values_list(
+        "id", "owner__user_id"
+    )
+    for project_id, owner_user_id in projects:
+        refresh_tag_suggestions_task.apply_async(
+            (project_id, user_id or owner_user_id), countdown=REFRESH_DELAY
+        )
+
+
+def schedule_entry_tag_suggestions_refresh(entry_id, user_id=None):
+    """
+    Refresh the suggestions after a variation of a dictionary entry was edited.
+
+    Further edits of the entry until the refresh starts are covered without looking up
+    its dictionary again.
+
+    Args:
+        entry_id: ID of the dictionary entry of the edited variation
+        user_id: ID of the user who edited it (the project owner if None)
+    """
+    if not caches[REFRESH_CACHE].add(
+        f"tag_suggestions_refresh_entry_{entry_id}", True, REFRESH_DELAY
+    ):
+        return
+
+    dictionary_id = (
+        DictionaryEntry.objects.filter(pk=entry_id).values_list("dictionary_id", flat=True).first()
+    )
+    # A deleted entry schedules the refresh of its dictionary itself
+    if dictionary_id is not None:
+        schedule_tag_suggestions_refresh(dictionary_id, user_id)
+
+
+def drop_tag_suggestions(**filters):
+    """
+    Delete the suggestion sets with a suggestion matching the filters.
+
+    Used before a variation or a dictionary entry is deleted: the sets lose the suggestion
+    with it, and the next refresh computes them again as missing sets.
+    """
+    TagSuggestionSet.objects.filter(
+        id__in=TagSuggestion.objects.filter(**filters).values("suggestion_set_id")
+    ).delete()
@@ -0,0 +1,145 @@
+"""This module contains the compiled tag type configuration of a project.
+
+The tag type settings are stored in Project.conf_tasks["tag_types"], partly as embedded JSON
+strings. TagTypeConfig decodes them once; get_tag_type_config caches the compiled object per
+process, keyed by the project and its modification time, so a saved configuration is picked
+up by every process. Project.save drops the entries of the saved project as well.
+"""
+
+import json
+import logging
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of compiled configurations kept per process
+MAX_CACHED_CONFIGS = 256
+
+_config_cache = {}
+
+
+def load_json_value(value):
+    """Decode an embedded JSON string. Already decoded values are returned as they are.
+
+    Returns:
+        The decoded value, or None if it cannot be decoded.
+    """
+    if isinstance(value, (dict, list)):
+        return value
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+class TagTypeConfig:
+    """
+    Immutable, decoded tag type configuration of a project.
+
+    Attributes:
+        translator: Mapping of tag type -> dictionary type
+        excluded_types: Tuple of the ignored tag types
+        date_types: Tuple of the date tag types
+        configured_enrichment_types: Mapping of tag type -> enrichment config, as
+            configured in enrichment_types_config
+        enrichment_types: Like configured_enrichment_types, with the date types as
+            fallback if no enrichment types are configured
+    """
+
+    __slots__ = (
+        "translator",
+        "excluded_types",
+        "date_types",
+        "configured_enrichment_types",
+        "enrichment_types",
+    )
+
+    def __init__(self, tag_types_configuration):
+        """
+        Decode the tag type configuration.
+
+        Args:
+            tag_types_configuration: The "tag_types" task configuration of the project
+        """
+        tag_types_configuration = tag_types_configuration or {}
+
+        translator = {}
+        if "tag_type_translator" in tag_types_configuration:
+            decoded = load_json_value(tag_types_configuration["tag_type_translator"])
+            if isinstance(decoded, dict):
+                translator = decoded
+
+        excluded_types = []
+        date_types = []
+        if "ignored_tag_types" in tag_types_configuration:
+            decoded = load_json_value(tag_types_configuration["ignored_tag_types"])
+            if isinstance(decoded, dict):
+                excluded_types = decoded.get("ignored", [])
+                date_types = decoded.get("dates", [])
+
+        configured_enrichment_types = None
+        if "enrichment_types_config" in tag_types_configuration:
+            configured_enrichment_types = load_json_value(
+                tag_types_configuration["enrichment_types_config"]
+            )
+            if not isinstance(configured_enrichment_types, dict):
+                logger.warning("Failed to parse enrichment_types_config JSON")
+                configured_enrichment_types = None
+
+        if configured_enrichment_types is not None:
+            enrichment_types = configured_enrichment_types
+        else:
+            # Backward compatibility: dates from ignored_tag_types
+            enrichment_types = {
+                dt: {"workflow_title": "Normalize Dates", "form_type": "date"}
+                for dt in date_types
+            }
+
+        set_attribute = object.__setattr__
+        set_attribute(self, "translator", MappingProxyType(translator))
+        set_attribute(self, "excluded_types", tuple(excluded_types))
+        set_attribute(self, "date_types", tuple(date_types))
+        set_attribute(
+            self,
+            "configured_enrichment_types",
+            MappingProxyType(configured_enrichment_types or {}),
+        )
+        set_attribute(self, "enrichment_types", MappingProxyType(enrichment_types))
+
+    def __setattr__(self, name, value):
+        """Prevent changes, the object is shared between callers."""
+        raise AttributeError("TagTypeConfig is immutable")
+
+    def translate(self, tag_type):
+        """Return the dictionary type of a tag type."""
+        return self.translator.get(tag_type, tag_type)
+
+
+def get_tag_type_config(project):
+    """
+    Return the compiled tag type configuration of a project.
+
+    Args:
+        project: Project object
+
+    Returns:
+        TagTypeConfig: The shared, immutable configuration
+    """
+    if project.pk is None:
+        return TagTypeConfig(project.get_task_configuration("tag_types"))
+
+    key = (project.pk, project.modified_at)
+    config = _config_cache.get(key)
+    if config is None:
+        config = TagTypeConfig(project.get_task_configuration("tag_types"))
+        if len(_config_cache) >= MAX_CACHED_CONFIGS:
+            _config_cache.clear()
+        _config_cache[key] = config
+    return config
+
+
+def invalidate_tag_type_config(project):
+    """Drop the cached configurations of a project, after its conf_tasks changed."""
+    for key in list(_config_cache):
+        if key[0] == project.pk:
+            _config_cache.pop(key, None)
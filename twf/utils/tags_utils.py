@@ -1,31 +1,25 @@
 """Utility functions for tags."""
 
-import json
 import re
 import logging
-from django.db.models import Count
-from fuzzywuzzy import process, fuzz
+from collections import defaultdict
+from heapq import merge
+
+from django.db import transaction
+from django.db.models import Count, Func, JSONField, Q, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from fuzzywuzzy import fuzz
 from twf.models import PageTag, Variation
+from twf.utils.tag_type_config import get_tag_type_config
+from twf.utils.variation_index import get_variation_index
 
 logger = logging.getLogger(__name__)
 
 
 def get_translated_tag_type(project, tag_type):
     """Translate the tag type based on the project configuration."""
-    task_configurations = project.get_task_configuration("tag_types")
-    if "tag_type_translator" not in task_configurations:
-        return tag_type
-
-    try:
-        tag_type_translator = json.loads(task_configurations["tag_type_translator"])
-    except json.JSONDecodeError:
-        # Handle JSON decoding error
-        return tag_type
-
-    if tag_type in tag_type_translator:
-        return tag_type_translator[tag_type]
-
-    return tag_type
+    return get_tag_type_config(project).translate(tag_type)
 
 
 def get_all_tag_types(project):
@@ -40,7 +34,7 @@ def get_all_tag_types(project):
     """
     enrichment_types = get_enrichment_types(project)
     distinct_variation_types = (
-        PageTag.objects.filter(page__document__project=project)
+        PageTag.objects.filter(project=project)
         .exclude(variation_type__in=get_excluded_types(project))
         .exclude(variation_type__in=enrichment_types.keys())
         .values("variation_type")
@@ -55,31 +49,62 @@ def get_all_tag_types(project):
     return distinct_variation_types_list
 
 
+def get_tag_type_counts(project):
+    """
+    Count the tags of a project per variation type, with all counters in one query.
+
+    Returns:
+        List of dicts, most frequent type first, with the keys variation_type, count,
+        parked, grouped (with dictionary entry), unassigned (without dictionary entry),
+        unassigned_unparked, resolved (with dictionary entry or date variation), open
+        (neither, not parked), enriched (with enrichment entry or enrichment data) and
+        unenriched_unparked.
+    """
+    enriched = Q(tag_enrichment_entry__isnull=False) | (
+        Q(enrichment__isnull=False) & ~Q(enrichment={})
+    )
+    unenriched = Q(tag_enrichment_entry__isnull=True) & (
+        Q(enrichment__isnull=True) | Q(enrichment={})
+    )
+    return list(
+        PageTag.objects.filter(project=project)
+        .values("variation_type")
+        .annotate(
+            count=Count("id"),
+            parked=Count("id", filter=Q(is_parked=True)),
+            grouped=Count("id", filter=Q(dictionary_entry__isnull=False)),
+            unassigned=Count("id", filter=Q(dictionary_entry__isnull=True)),
+            unassigned_unparked=Count(
+                "id", filter=Q(dictionary_entry__isnull=True, is_parked=False)
+            ),
+            resolved=Count(
+                "id",
+                filter=Q(dictionary_entry__isnull=False)
+                | Q(date_variation_entry__isnull=False),
+            ),
+            open=Count(
+                "id",
+                filter=Q(
+                    dictionary_entry__isnull=True,
+                    date_variation_entry__isnull=True,
+                    is_parked=False,
+                ),
+            ),
+            enriched=Count("id", filter=enriched),
+            unenriched_unparked=Count("id", filter=unenriched & Q(is_parked=False)),
+        )
+        .order_by("-count")
+    )
+
+
 def get_excluded_types(project):
     """Get the excluded tag types."""
-    task_configurations = project.get_task_configuration("tag_types")
-    if "ignored_tag_types" in task_configurations:
-        try:
-            conf = json.loads(task_configurations["ignored_tag_types"])
-            if "ignored" in conf:
-                return conf["ignored"]
-        except json.JSONDecodeError:
-            return []
-    return []
+    return list(get_tag_type_config(project).excluded_types)
 
 
 def get_date_types(project):
     """Get the date tag types."""
-    task_configurations = project.get_task_configuration("tag_types")
-    if "ignored_tag_types" in task_configurations:
-        try:
-            conf = json.loads(task_configurations["ignored_tag_types"])
-            if "dates" in conf:
-                return conf["dates"]
-        except json.JSONDecodeError:
-            return []
-        return []
-    return []
+    return list(get_tag_type_config(project).date_types)
 
 
 def get_enrichment_types(project):
@@ -91,25 +116,11 @@ def get_enrichment_types(project):
         'date': {'workflow_title': '...', 'form_type': 'date'},
         'bible_verse': {'workflow_title': '...', 'form_type': 'verse'}
     }
-    """
-    task_config = project.get_task_configuration("tag_types")
-
-    # Try new enrichment_types_config field first
-    if "enrichment_types_config" in task_config:
-        try:
-            return json.loads(task_config["enrichment_types_config"])
-        except json.JSONDecodeError:
-            logger.warning("Failed to parse enrichment_types_config JSON")
-
-    # Backward compatibility: dates from ignored_tag_types
-    date_types = get_date_types(project)
-    if date_types:
-        return {
-            dt: {"workflow_title": "Normalize Dates", "form_type": "date"}
-            for dt in date_types
-        }
 
-    return {}
+    Without enrichment_types_config, the date types of ignored_tag_types are returned
+    (backward compatibility).
+    """
+    return dict(get_tag_type_config(project).enrichment_types)
 
 
 def get_enrichment_type_for_tag_type(project, tag_type):
@@ -118,8 +129,7 @@ def get_enrichment_type_for_tag_type(project, tag_type):
 
     Returns None if the tag type uses grouping instead of enrichment.
     """
-    enrichment_types = get_enrichment_types(project)
-    return enrichment_types.get(tag_type)
+    return get_tag_type_config(project).enrichment_types.get(tag_type)
 
 
 def get_closest_variations(page_tag):
@@ -136,51 +146,67 @@ def get_closest_variations(page_tag):
         - match_count: Number of variations with score >= 80 for this entry
     """
 
-    dict_type = page_tag.variation_type
-    dict_type = get_translated_tag_type(page_tag.page.document.project, dict_type)
+    project = page_tag.page.document.project
+    entry_results = rank_closest_entries(
+        project, page_tag.variation, page_tag.variation_type
+    )
 
-    variations = Variation.objects.filter(
-        entry__dictionary__in=page_tag.page.document.project.selected_dictionaries.all(),
-        entry__dictionary__type=dict_type,
+    variations = (
+        Variation.objects.select_related("entry")
+        .prefetch_related("entry__variations")
+        .in_bulk([variation_id for variation_id, _, _, _ in entry_results])
     )
-    variations_list = [variation.variation for variation in variations]
+    return [
+        (variations[variation_id], score, strong_match_count)
+        for variation_id, _, score, strong_match_count in entry_results
+        if variation_id in variations
+    ]
+
+
+def rank_closest_entries(project, variation, variation_type, limit=5):
+    """
+    Return the dictionary entries closest to a tag text, without loading them.
+
+    Args:
+        project: Project object (its selected dictionaries are searched)
+        variation: The text of the tag
+        variation_type: The type of the tag
+        limit: Maximum number of entries
+
+    Returns:
+        List of tuples: (variation_id, entry_id, score, match_count), best first
+    """
+    dict_type = get_translated_tag_type(project, variation_type)
 
     # Get many more matches to ensure we capture all good matches per entry
-    # Use limit=None to get all matches, or a high number like 50
-    all_matches = process.extract(page_tag.variation, variations_list, limit=50)
+    all_matches = get_variation_index(project, dict_type).search(variation, limit=50)
 
     # Group matches by dictionary entry
-    entry_matches = {}  # {entry_id: [(variation, score), ...]}
-
-    for match in all_matches:
-        variation_text, score = match
-        matched_variation = variations.filter(variation=variation_text).first()
-        if matched_variation:
-            entry_id = matched_variation.entry.id
-            if entry_id not in entry_matches:
-                entry_matches[entry_id] = []
-            entry_matches[entry_id].append((matched_variation, score))
+    entry_matches = {}  # {entry_id: [(variation_id, score), ...]}
+    for variation_id, entry_id, score in all_matches:
+        entry_matches.setdefault(entry_id, []).append((variation_id, score))
 
     # For each entry, determine the best variation and count strong matches
     entry_results = []
     for entry_id, matches in entry_matches.items():
-        # Sort matches by score (highest first)
-        matches.sort(key=lambda x: x[1], reverse=True)
-        best_variation, best_score = matches[0]
+        # Matches are sorted by score (highest first)
+        best_variation_id, best_score = matches[0]
 
         # Count how many variations have a strong match (score >= 80)
         strong_match_count = sum(1 for _, score in matches if score >= 80)
 
-        entry_results.append((best_variation, best_score, strong_match_count))
+        entry_results.append((best_variation_id, entry_id, best_score, strong_match_count))
 
-    # Sort entries by best score and return top 5
-    entry_results.sort(key=lambda x: x[1], reverse=True)
-
-    return entry_results[:5]
+    # Sort entries by best score and return the top entries
+    entry_results.sort(key=lambda x: x[2], reverse=True)
+    return entry_results[:limit]
 
 
 def assign_tag(page_tag, user):
-    """Assign the tag to a dictionary entry."""
+    """Assign the tag to a dictionary entry.
+
+    Bulk operations use a TagAssignmentResolver instead.
+    """
 
     try:
         dictionary_type = page_tag.variation_type
@@ -194,12 +220,16 @@ def assign_tag(page_tag, user):
                 entry__dictionary__type=dictionary_type,
             )
         except Variation.MultipleObjectsReturned:
-            # TODO: Handle multiple objects returned
-            entry = Variation.objects.filter(
-                variation=page_tag.variation,
-                entry__dictionary__in=page_tag.page.document.project.selected_dictionaries.all(),
-                entry__dictionary__type=dictionary_type,
-            ).first()
+            # The oldest variation wins, as in TagAssignmentResolver
+            entry = (
+                Variation.objects.filter(
+                    variation=page_tag.variation,
+                    entry__dictionary__in=page_tag.page.document.project.selected_dictionaries.all(),
+                    entry__dictionary__type=dictionary_type,
+                )
+                .order_by("id")
+                .first()
+            )
 
         page_tag.dictionary_entry = entry.entry
         page_tag.save(current_user=user)
@@ -208,6 +238,150 @@ def assign_tag(page_tag, user):
         return False
 
 
+class TagAssignmentResolver:
+    """
+    In-memory lookup of dictionary entries for tags, for bulk operations.
+
+    Does what assign_tag does, without a query per tag: the variations of the project's
+    selected dictionaries are loaded once into a (dictionary_type, variation) -> entry_id
+    map, and the compiled tag type configuration is used for the translation. If several entries have the same
+    variation, the oldest variation (lowest id) wins. Changes to the dictionaries after
+    the resolver is created are not seen.
+    """
+
+    def __init__(self, project):
+        """
+        Load the tag type translator and the variations of the selected dictionaries.
+
+        Args:
+            project: Project object
+        """
+        self.project = project
+        self.tag_type_config = get_tag_type_config(project)
+        self.entries = {}
+
+        variations = (
+            Variation.objects.filter(
+                entry__dictionary__in=project.selected_dictionaries.all()
+            )
+            .order_by("-id")
+            .values_list("entry__dictionary__type", "variation", "entry_id")
+        )
+        for dictionary_type, variation, entry_id in variations.iterator():
+            # Descending ids: the oldest variation is written last
+            self.entries[(dictionary_type, variation)] = entry_id
+
+    def resolve(self, variation, variation_type):
+        """Return the id of the dictionary entry for a tag, or None."""
+        dictionary_type = self.tag_type_config.translate(variation_type)
+        return self.entries.get((dictionary_type, variation))
+
+    def assign(self, page_tag, user=None, save=False):
+        """
+        Assign the tag to a dictionary entry, like assign_tag.
+
+        Args:
+            page_tag: PageTag object
+            user: User performing the operation (used if save is True)
+            save: If True, save the tag if it was assigned
+
+        Returns:
+            bool: True if the tag was assigned
+        """
+        entry_id = self.resolve(page_tag.variation, page_tag.variation_type)
+        if entry_id is None:
+            return False
+        page_tag.dictionary_entry_id = entry_id
+        if save:
+            page_tag.save(current_user=user)
+        return True
+
+
+def get_identical_tags(tag, workflow=None):
+    """
+    Return the tags identical to a tag: same project, variation type and variation.
+
+    Tags on ignored pages are left out, except the tag itself.
+
+    Args:
+        tag: PageTag object
+        workflow: If given, only the tags of this workflow
+
+    Returns:
+        QuerySet: The identical tags, including the tag itself
+    """
+    identical_tags = PageTag.objects.filter(
+        project_id=tag.project_id,
+        variation_type=tag.variation_type,
+        variation=tag.variation,
+    ).filter(Q(pk=tag.pk) | Q(page__is_ignored=False))
+    if workflow is not None:
+        identical_tags = identical_tags.filter(workflows=workflow)
+    return identical_tags
+
+
+def assign_identical_tags(tag, entry, user):
+    """
+    Assign a tag and its identical unassigned tags to a dictionary entry.
+
+    The tag text is added as a variation of the entry if it is not one yet. The tag itself
+    is assigned even if it has an entry already, as the reviewer chose the new one. The
+    tags are assigned with a single UPDATE, which sets the audit fields as well.
+
+    Args:
+        tag: PageTag object the reviewer assigned
+        entry: DictionaryEntry object
+        user: User performing the assignment
+
+    Returns:
+        int: The number of assigned tags, including the tag itself
+    """
+    with transaction.atomic():
+        if not entry.variations.filter(variation=tag.variation).exists():
+            Variation(entry=entry, variation=tag.variation).save(current_user=user)
+        return (
+            get_identical_tags(tag)
+            .filter(Q(pk=tag.pk) | Q(dictionary_entry__isnull=True))
+            .update(dictionary_entry=entry, modified_at=timezone.now(), modified_by=user)
+        )
+
+
+def enrich_identical_tags(tag, enrichment_type, user, workflow=None):
+    """
+    Copy the enrichment of a tag to its identical tags without this enrichment type.
+
+    The enrichment is merged into the tags' enrichment data with a single UPDATE, which
+    keeps their other enrichment types and sets the audit fields as well.
+
+    Args:
+        tag: PageTag object the reviewer enriched
+        enrichment_type: The enrichment type to copy
+        user: User performing the enrichment
+        workflow: If given, only the tags of this workflow are enriched
+
+    Returns:
+        int: The number of enriched tags, without the tag itself
+    """
+    enrichment = (tag.enrichment or {}).get(enrichment_type)
+    if enrichment is None:
+        return 0
+
+    merged_enrichment = Func(
+        Coalesce("enrichment", Value({}, output_field=JSONField())),
+        Value({enrichment_type: enrichment}, output_field=JSONField()),
+        template="%(expressions)s",
+        arg_joiner=" || ",
+        output_field=JSONField(),
+    )
+    return (
+        get_identical_tags(tag, workflow)
+        .exclude(pk=tag.pk)
+        .filter(tag_enrichment_entry__isnull=True)
+        .filter(Q(enrichment__isnull=True) | ~Q(enrichment__has_key=enrichment_type))
+        .update(enrichment=merged_enrichment, modified_at=timezone.now(), modified_by=user)
+    )
+
+
 def extract_tags_from_parsed_data(parsed_data):
     """
     Extract tags from PAGE XML parsed data.
@@ -408,6 +582,12 @@ class SmartTagMatcher:
     - Text similarity (exact or fuzzy)
     - Offset proximity
     - Length similarity
+
+    As the line ID and the tag type are required, the old tags are bucketed by
+    (line_id, variation_type) and only the candidates of a new tag's bucket are scored,
+    together with the legacy tags of the same type which have no line ID. The candidates
+    are scored in the original order of the old tags, so the result is the same as when
+    scoring all pairs (indexed=False).
     """
 
     # Matching thresholds and weights
@@ -418,8 +598,13 @@ class SmartTagMatcher:
     MAX_OFFSET_SCORE = 30
     MAX_LENGTH_SCORE = 10
 
-    def __init__(self):
-        """Initialize the matcher."""
+    def __init__(self, indexed=True):
+        """Initialize the matcher.
+
+        Args:
+            indexed: If False, score all pairs of old and new tags (for comparison)
+        """
+        self.indexed = indexed
         self.ambiguous_matches = []
 
     def match_tags(self, old_tags, new_tags_data, page):
@@ -438,10 +623,14 @@ class SmartTagMatcher:
             - unmatched_new: List[new_tag_data] to create
         """
         potential_matches = []
+        index = self.build_index(old_tags) if self.indexed else None
 
-        # Phase 1: Calculate scores for all combinations
+        # Phase 1: Calculate scores for all candidate combinations
         for new_tag_data in new_tags_data:
-            for old_tag in old_tags:
+            candidates = (
+                self.get_candidates(index, new_tag_data) if self.indexed else old_tags
+            )
+            for old_tag in candidates:
                 score = self.calculate_match_score(old_tag, new_tag_data)
                 if score >= self.MATCH_THRESHOLD:
                     potential_matches.append((old_tag, new_tag_data, score))
@@ -489,6 +678,74 @@ class SmartTagMatcher:
 
         return final_matches, unmatched_old, unmatched_new
 
+    @staticmethod
+    def get_line_id(old_tag):
+        """Return the line ID of an old PageTag, empty for legacy tags."""
+        return (
+            old_tag.additional_information.get("line_id", "")
+            if old_tag.additional_information
+            else ""
+        )
+
+    def build_index(self, old_tags):
+        """
+        Bucket old tags by (line_id, variation_type).
+
+        Every bucket holds (position, tag) pairs in the original order of the old tags.
+
+        Args:
+            old_tags: List of existing PageTag objects
+
+        Returns:
+            dict: The buckets 'line' ((line_id, type) -> pairs), 'legacy' (type -> pairs
+            of tags without line ID), 'type' (type -> all pairs) and 'merged' (a cache of
+            the candidates per (line_id, type))
+        """
+        index = {
+            "line": defaultdict(list),
+            "legacy": defaultdict(list),
+            "type": defaultdict(list),
+            "merged": {},
+        }
+        for position, old_tag in enumerate(old_tags):
+            entry = (position, old_tag)
+            line_id = self.get_line_id(old_tag)
+            index["type"][old_tag.variation_type].append(entry)
+            if line_id:
+                index["line"][(line_id, old_tag.variation_type)].append(entry)
+            else:
+                index["legacy"][old_tag.variation_type].append(entry)
+        return index
+
+    def get_candidates(self, index, new_tag_data):
+        """
+        Return the old tags which can score above 0 for a new tag, in their original order.
+
+        Args:
+            index: The buckets from build_index()
+            new_tag_data: Dict from extract_tags_from_parsed_data()
+
+        Returns:
+            list: PageTag objects
+        """
+        tag_type = new_tag_data["type"]
+        line_id = new_tag_data["line_id"]
+        if not line_id:
+            # Without line ID, every old tag of the same type is a candidate
+            return [tag for _, tag in index["type"].get(tag_type, [])]
+
+        key = (line_id, tag_type)
+        if key not in index["merged"]:
+            index["merged"][key] = [
+                tag
+                for _, tag in merge(
+                    index["line"].get(key, []),
+                    index["legacy"].get(tag_type, []),
+                    key=lambda entry: entry[0],
+                )
+            ]
+        return index["merged"][key]
+
     def calculate_match_score(self, old_tag, new_tag_data):
         """
         Calculate similarity score between old PageTag and new tag data from XML.
@@ -504,11 +761,7 @@ class SmartTagMatcher:
 
         # REQUIRED: Same line ID (for backward compatibility)
         # Try new explicit fields first, fall back to additional_information
-        old_line_id = (
-            old_tag.additional_information.get("line_id", "")
-            if old_tag.additional_information
-            else ""
-        )
+        old_line_id = self.get_line_id(old_tag)
         new_line_id = new_tag_data["line_id"]
 
         # Special case: If old_line_id is empty (legacy data without proper line IDs),
@@ -0,0 +1,175 @@
+"""This module contains the fuzzy search index over the variations of dictionaries.
+
+get_closest_variations used to score the tag against every variation of the dictionaries
+with fuzzywuzzy. The VariationIndex narrows the search down first: the variations are split
+into character trigrams, an inverted index maps each trigram to the variations containing
+it, and the trigram overlap with the query is computed for all variations at once with
+numpy. Only the best candidates are scored with fuzzywuzzy's WRatio, the scorer
+process.extract uses.
+
+The indexes are built once per process and set of dictionaries. They are rebuilt when a
+variation is saved in the same process (see twf.signals), and otherwise when a periodic
+check finds the number or the latest modification of the variations changed.
+"""
+
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+from django.db.models import Count, Max
+from fuzzywuzzy import fuzz, utils
+
+from twf.models import Variation
+
+# Number of candidates from the trigram prefilter which are scored with WRatio
+MAX_CANDIDATES = 300
+
+# Seconds between checks whether the variations changed in another process
+INDEX_CHECK_INTERVAL = 60
+
+_index_cache = {}
+_index_lock = threading.Lock()
+
+
+def get_trigrams(text):
+    """Return the set of character trigrams of a text, processed like fuzzywuzzy does."""
+    processed = utils.full_process(text, force_ascii=True)
+    if not processed:
+        return set()
+    padded = f"  {processed} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class VariationIndex:
+    """
+    Trigram index over variations, mapping search results to variation and entry ids.
+    """
+
+    def __init__(self, rows):
+        """
+        Build the index.
+
+        Args:
+            rows: Iterable of (variation_id, variation, entry_id) tuples
+        """
+        variation_ids = []
+        entry_ids = []
+        sizes = []
+        self.texts = []
+        postings = defaultdict(list)
+
+        for position, (variation_id, text, entry_id) in enumerate(rows):
+            trigrams = get_trigrams(text)
+            for trigram in trigrams:
+                postings[trigram].append(position)
+            variation_ids.append(variation_id)
+            entry_ids.append(entry_id)
+            sizes.append(len(trigrams))
+            self.texts.append(text)
+
+        self.postings = {
+            trigram: np.array(positions, dtype=np.int32)
+            for trigram, positions in postings.items()
+        }
+        self.variation_ids = np.array(variation_ids, dtype=np.int64)
+        self.entry_ids = np.array(entry_ids, dtype=np.int64)
+        self.sizes = np.array(sizes, dtype=np.int32)
+
+    def __len__(self):
+        """Return the number of indexed variations."""
+        return len(self.texts)
+
+    def search(self, query, limit=50, max_candidates=MAX_CANDIDATES):
+        """
+        Return the variations closest to the query.
+
+        Args:
+            query: The text to search for
+            limit: Maximum number of results
+            max_candidates: Number of prefiltered candidates to score
+
+        Returns:
+            list: (variation_id, entry_id, score) tuples, best first
+        """
+        trigrams = get_trigrams(query)
+        arrays = [self.postings[t] for t in trigrams if t in self.postings]
+        if not arrays:
+            return []
+
+        # Shared trigrams of the query and every variation
+        shared = np.bincount(np.concatenate(arrays), minlength=len(self.texts))
+        candidates = np.flatnonzero(shared)
+
+        if len(candidates) > max_candidates:
+            shared_candidates = shared[candidates]
+            # Dice coefficient for similar strings, containment for partial matches
+            dice = 2 * shared_candidates / (len(trigrams) + self.sizes[candidates])
+            containment = shared_candidates / len(trigrams)
+            prefilter = np.maximum(dice, containment)
+            best = np.argpartition(prefilter, -max_candidates)[-max_candidates:]
+            candidates = np.sort(candidates[best])
+
+        scored = [(fuzz.WRatio(query, self.texts[i]), i) for i in candidates.tolist()]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [
+            (int(self.variation_ids[i]), int(self.entry_ids[i]), score)
+            for score, i in scored[:limit]
+            if score > 0
+        ]
+
+
+def get_variations_stamp(dictionary_ids):
+    """Return a value which changes when variations of the dictionaries change."""
+    stamp = Variation.objects.filter(entry__dictionary_id__in=dictionary_ids).aggregate(
+        count=Count("id"), last_modified=Max("modified_at")
+    )
+    return stamp["count"], stamp["last_modified"]
+
+
+def get_variation_index(project, dictionary_type):
+    """
+    Return the search index over the variations of the project's selected dictionaries
+    of a type.
+
+    Args:
+        project: Project object
+        dictionary_type: The dictionary type (a translated tag type)
+
+    Returns:
+        VariationIndex: The index, shared by all callers in the process
+    """
+    dictionary_ids = tuple(
+        sorted(
+            project.selected_dictionaries.filter(type=dictionary_type).values_list(
+                "id", flat=True
+            )
+        )
+    )
+    now = time.monotonic()
+    with _index_lock:
+        cached = _index_cache.get(dictionary_ids)
+        if cached and now - cached["checked_at"] < INDEX_CHECK_INTERVAL:
+            return cached["index"]
+
+    stamp = get_variations_stamp(dictionary_ids)
+    if cached and cached["stamp"] == stamp:
+        index = cached["index"]
+    else:
+        index = VariationIndex(
+            Variation.objects.filter(entry__dictionary_id__in=dictionary_ids)
+            .order_by("id")
+            .values_list("id", "variation", "entry_id")
+            .iterator()
+        )
+
+    with _index_lock:
+        _index_cache[dictionary_ids] = {"index": index, "stamp": stamp, "checked_at": now}
+    return index
+
+
+def mark_variation_indexes_stale():
+    """Make the next search check whether the indexes are up to date."""
+    with _index_lock:
+        for cached in _index_cache.values():
+            cached["checked_at"] = float("-inf")
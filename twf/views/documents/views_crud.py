@@ -15,6 +15,7 @@ from twf.tasks.instant_tasks import (
     save_instant_task_update_document,
 )
 from twf.utils.metadata_utils import delete_nested_key, set_nested_value
+from twf.utils.page_xml_store import release_page_xml_files
 from twf.views.views_base import get_referrer_or_default, TWFView
 
 
@@ -37,9 +38,8 @@ def delete_document(request, pk, doc_pk):
         project, request.user, document_title, document.id
     )
 
-    for page in document.pages.all():
-        page.xml_file.delete()
-        page.delete()
+    release_page_xml_files(document.pages.values_list("xml_file", flat=True))
+    document.pages.all().delete()
     document.delete()
     messages.success(request, f"Document {doc_pk} has been deleted.")
 
@@ -131,7 +131,7 @@ class TWFDocumentsOverviewView(TWFDocumentView):
         # Tag statistics
         from twf.models import PageTag
 
-        project_tags = PageTag.objects.filter(page__document__project=project)
+        project_tags = PageTag.objects.filter(project=project)
         total_tags = project_tags.count()
         open_tags = project_tags.filter(is_parked=False).count()
         resolved_tags = project_tags.filter(is_parked=True).count()
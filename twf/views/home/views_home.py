@@ -702,7 +702,7 @@ class TWFProjectViewDetailView(LoginRequiredMixin, TWFHomeView):
         # Total activity counts
         total_docs = Document.objects.filter(project=project).count()
         total_pages = doc_stats.get("total_pages", 0)
-        total_tags = PageTag.objects.filter(page__document__project=project).count()
+        total_tags = PageTag.objects.filter(project=project).count()
 
         # Add all data to context
         context.update(
@@ -187,6 +187,7 @@ class TWFMetadataExtractTagsView(ProjectPermissionMixin, FormView, TWFMetadataVi
 
                         tag = PageTag(
                             page=page,
+                            project=project,
                             variation=metadata[json_data_key],
                             variation_type=dictionary.type,
                             dictionary_entry=None,
@@ -212,6 +213,7 @@ class TWFMetadataExtractTagsView(ProjectPermissionMixin, FormView, TWFMetadataVi
                     if json_data_key in metadata:
                         tag = PageTag(
                             page=page,
+                            project=project,
                             variation=metadata[json_data_key],
                             variation_type=dictionary.type,
                             dictionary_entry=None,
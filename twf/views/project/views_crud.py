@@ -9,7 +9,7 @@ from django.contrib import messages
 from django.shortcuts import redirect, get_object_or_404
 from django.utils import timezone
 
-from twf.models import Project, PageTag, Task, Export, UserProfile
+from twf.models import Project, Page, PageTag, Task, Export, UserProfile
 from twf.permissions import check_permission
 from twf.tasks.instant_tasks import (
     save_instant_task_delete_all_documents,
@@ -23,6 +23,7 @@ from twf.tasks.instant_tasks import (
     save_instant_task_remove_all_dictionaries,
     save_instant_task_delete_note,
 )
+from twf.utils.page_xml_store import release_page_xml_files
 from twf.views.views_base import TWFView, get_referrer_or_default
 
 
@@ -52,7 +53,7 @@ def delete_all_tags(request):
         messages.error(request, "You do not have permission to delete all tags.")
         return redirect("twf:tags_manage")
 
-    PageTag.objects.filter(page__document__project=project).select_related(
+    PageTag.objects.filter(project=project).select_related(
         "page", "page__document"
     ).delete()
 
@@ -108,15 +109,16 @@ def delete_project(request, pk):
                 if export.export_file:
                     files_to_delete.append(export.export_file.path)
 
-            # 3. Find all pages' XML files
-            page_files = []
-            for document in project.documents.all():
-                for page in document.pages.all():
-                    if page.xml_file:
-                        page_files.append(page.xml_file.path)
+            # 3. Release all pages' XML files (files in the page XML store may be
+            # shared with other projects, the gc_page_xml command removes them)
+            release_page_xml_files(
+                Page.objects.filter(document__project=project).values_list(
+                    "xml_file", flat=True
+                )
+            )
 
             # Delete all related media files
-            for file_path in files_to_delete + page_files:
+            for file_path in files_to_delete:
                 try:
                     if os.path.exists(file_path):
                         os.remove(file_path)
@@ -293,7 +295,7 @@ def unpark_all_tags(request):
         return redirect("twf:tags_manage")
 
     # Get all parked tags in the project and unpark them
-    tags = PageTag.objects.filter(page__document__project=project, is_parked=True)
+    tags = PageTag.objects.filter(project=project, is_parked=True)
     count = tags.count()
     tags.update(is_parked=False)
 
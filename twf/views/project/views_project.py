@@ -308,8 +308,9 @@ class TWFProjectTaskDetailView(ProjectPermissionMixin, TWFProjectView):
             context["meta_items"] = [
                 {"key": key, "value": value}
                 for key, value in task.meta.items()
-                if key not in ["current", "total", "text"]  # Skip progress-related keys
+                if key not in ["current", "total", "text", "phases"]  # Skip progress-related keys
             ]
+            context["phases"] = task.meta.get("phases", [])
 
         return context
 
@@ -653,7 +654,7 @@ class TWFProjectOverviewView(TWFProjectView):
             and bool(project.downloaded_zip_file.name.strip()),
             "transkribus_export_extracted": project.documents.all().count() > 0,
             "transkribus_tags_extracted": PageTag.objects.filter(
-                page__document__project=project
+                project=project
             ).count()
             > 0,
             "dictionaries_connected": project.selected_dictionaries.all().count() > 0,
@@ -833,7 +834,7 @@ class TWFProjectResetView(ProjectPermissionMixin, TWFProjectView):
 
         if action == "unpark_all_tags":
             parked_tags = PageTag.objects.filter(
-                page__document__project=self.get_project(), is_parked=True
+                project=self.get_project(), is_parked=True
             )
             num_tags = parked_tags.count()
             parked_tags.update(is_parked=False)
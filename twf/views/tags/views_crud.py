@@ -2,6 +2,7 @@
 
 from django.contrib import messages
 from django.shortcuts import get_object_or_404, redirect
+from django.utils import timezone
 
 from twf.models import PageTag
 from twf.permissions import check_permission
@@ -11,7 +12,7 @@ from twf.tasks.instant_tasks import (
     save_instant_task_unpark_tag,
 )
 from twf.views.views_base import get_referrer_or_default, TWFView
-from twf.utils.tags_utils import assign_tag, get_excluded_types
+from twf.utils.tags_utils import TagAssignmentResolver, get_excluded_types
 
 
 def park_tag(request, pk):
@@ -50,15 +51,13 @@ def park_all_identical_tags(request, pk):
 
     # Find all unparked tags with the same variation in the same project
     identical_tags = PageTag.objects.filter(
-        page__document__project=project, variation=tag.variation, is_parked=False
+        project=project, variation=tag.variation, is_parked=False
     )
 
-    count = identical_tags.count()
-
     # Park all identical tags
-    for identical_tag in identical_tags:
-        identical_tag.is_parked = True
-        identical_tag.save(current_user=request.user)
+    count = identical_tags.update(
+        is_parked=True, modified_at=timezone.now(), modified_by=request.user
+    )
 
     messages.success(
         request, f'Parked {count} tag(s) with variation "{tag.variation}".'
@@ -145,7 +144,7 @@ def unpark_tags_by_type(request):
 
     # Unpark all tags of this type
     tags = PageTag.objects.filter(
-        page__document__project=project, variation_type=tag_type, is_parked=True
+        project=project, variation_type=tag_type, is_parked=True
     )
     count = tags.count()
     tags.update(is_parked=False)
@@ -169,7 +168,7 @@ def remove_dict_assignments_by_type(request):
 
     # Remove dictionary assignments for this type
     tags = PageTag.objects.filter(
-        page__document__project=project,
+        project=project,
         variation_type=tag_type,
         dictionary_entry__isnull=False,
     )
@@ -199,7 +198,7 @@ def remove_enrichment_by_type(request):
     # Remove enrichment data for this type (both old and new formats)
     from django.db.models import Q
     tags = PageTag.objects.filter(
-        page__document__project=project,
+        project=project,
         variation_type=tag_type,
     ).filter(
         Q(tag_enrichment_entry__isnull=False)
@@ -224,7 +223,7 @@ def remove_all_dict_assignments(request):
 
     # Remove all dictionary assignments
     tags = PageTag.objects.filter(
-        page__document__project=project, dictionary_entry__isnull=False
+        project=project, dictionary_entry__isnull=False
     )
     count = tags.count()
     tags.update(dictionary_entry=None)
@@ -246,7 +245,7 @@ def remove_all_enrichment(request):
     # Remove all enrichment data (both old and new formats)
     from django.db.models import Q
     tags = PageTag.objects.filter(
-        page__document__project=project
+        project=project
     ).filter(
         Q(tag_enrichment_entry__isnull=False)
         | (Q(enrichment__isnull=False) & ~Q(enrichment={}))
@@ -271,15 +270,16 @@ def auto_group_all_tags(request):
     # Get all unassigned tags (excluding ignored types)
     excluded_types = get_excluded_types(project)
     unassigned_tags = PageTag.objects.filter(
-        page__document__project=project, dictionary_entry__isnull=True
+        project=project, dictionary_entry__isnull=True
     ).exclude(variation_type__in=excluded_types)
 
     total = unassigned_tags.count()
     assigned_count = 0
 
     # Try to assign each tag
+    resolver = TagAssignmentResolver(project)
     for tag in unassigned_tags:
-        if assign_tag(tag, request.user):
+        if resolver.assign(tag, request.user, save=True):
             assigned_count += 1
 
     messages.success(
@@ -305,7 +305,7 @@ def auto_group_tags_by_type(request):
 
     # Get unassigned tags of this type
     unassigned_tags = PageTag.objects.filter(
-        page__document__project=project,
+        project=project,
         variation_type=tag_type,
         dictionary_entry__isnull=True,
     )
@@ -314,8 +314,9 @@ def auto_group_tags_by_type(request):
     assigned_count = 0
 
     # Try to assign each tag
+    resolver = TagAssignmentResolver(project)
     for tag in unassigned_tags:
-        if assign_tag(tag, request.user):
+        if resolver.assign(tag, request.user, save=True):
             assigned_count += 1
 
     messages.success(
@@ -31,17 +31,20 @@ from twf.models import (
     PageTag,
     Dictionary,
     DictionaryEntry,
-    Variation,
     Workflow,
 )
 from twf.tables.tables_tags import TagTable, IgnoredTagTable, TagsWithCommentsTable
 from twf.utils.tags_utils import (
+    assign_identical_tags,
+    enrich_identical_tags,
     get_date_types,
     get_translated_tag_type,
     get_excluded_types,
-    get_closest_variations,
     get_enrichment_types,
+    get_identical_tags,
+    get_tag_type_counts,
 )
+from twf.utils.tag_suggestions import get_tag_suggestions
 from twf.views.views_base import TWFView, ProjectPermissionMixin
 from twf.workflows.tag_workflows import (
     create_tag_grouping_workflow,
@@ -153,13 +156,15 @@ class TWFTagsOverviewView(ProjectPermissionMixin, TWFTagsView):
         context = super().get_context_data(**kwargs)
 
         project = self.get_project()
-        total_pagetags = PageTag.objects.filter(page__document__project=project).count()
+        # All per-type counters in one query
+        variation_type_edit_counts_all = get_tag_type_counts(project)
+        total_pagetags = sum(v["count"] for v in variation_type_edit_counts_all)
         excluded_types = get_excluded_types(project)
         enrichment_types = get_enrichment_types(project)
 
         # Organize by dictionary type to find the most used entry per type
         entry_counts = (
-            PageTag.objects.filter(page__document__project=project)
+            PageTag.objects.filter(project=project)
             .values(
                 "dictionary_entry__id",
                 "dictionary_entry__label",
@@ -177,15 +182,6 @@ class TWFTagsOverviewView(ProjectPermissionMixin, TWFTagsView):
             if len(top_entries_per_type[dtype]) < 20:
                 top_entries_per_type[dtype].append(entry)
 
-        # Counting each variation_type in PageTags within a specific project
-        # Split into main (non-ignored) and ignored
-        variation_type_edit_counts_all = (
-            PageTag.objects.filter(page__document__project=project)
-            .values("variation_type")
-            .annotate(count=Count("variation_type"))
-            .order_by("-count")
-        )
-
         # Separate main and ignored tags
         main_variation_types = []
         ignored_variation_types = []
@@ -213,35 +209,11 @@ class TWFTagsOverviewView(ProjectPermissionMixin, TWFTagsView):
             # Count grouped/unresolved based on workflow type
             if variation["workflow_type"] == "enrich":
                 # For enrichment workflow: count tags with enrichment entries (old or new format)
-                from django.db.models import Q
-                variation["grouped"] = PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=variation["variation_type"],
-                ).filter(
-                    Q(tag_enrichment_entry__isnull=False)
-                    | (Q(enrichment__isnull=False) & ~Q(enrichment={}))
-                ).count()
-
-                variation["unresolved"] = PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=variation["variation_type"],
-                    tag_enrichment_entry__isnull=True,
-                    is_parked=False,
-                ).filter(Q(enrichment__isnull=True) | Q(enrichment={})).count()
+                variation["grouped"] = variation["enriched"]
+                variation["unresolved"] = variation["unenriched_unparked"]
             elif variation["workflow_type"] == "group":
                 # For grouping workflow: count tags with dictionary entries
-                variation["grouped"] = PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=variation["variation_type"],
-                    dictionary_entry__isnull=False,
-                ).count()
-
-                variation["unresolved"] = PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=variation["variation_type"],
-                    dictionary_entry__isnull=True,
-                    is_parked=False,
-                ).count()
+                variation["unresolved"] = variation["unassigned_unparked"]
             else:
                 # For ignored tags: no grouped/unresolved counting
                 variation["grouped"] = 0
@@ -252,11 +224,6 @@ class TWFTagsOverviewView(ProjectPermissionMixin, TWFTagsView):
                 if variation["count"] > 0
                 else 0
             )
-            variation["parked"] = PageTag.objects.filter(
-                page__document__project=project,
-                variation_type=variation["variation_type"],
-                is_parked=True,
-            ).count()
             variation["parked_percentage"] = (
                 (variation["parked"] / variation["count"] * 100)
                 if variation["count"] > 0
@@ -359,20 +326,13 @@ class TWFTagsGroupView(ProjectPermissionMixin, TWFTagsView):
                 )
                 new_entry.save(current_user=self.request.user)
 
-                variation = Variation(
-                    entry=new_entry, variation=tag_to_assign.variation
-                )
-                variation.save(current_user=self.request.user)
-                tag_to_assign.dictionary_entry = new_entry
-                tag_to_assign.save(current_user=self.request.user)
-
                 number_of_tags = self.save_other_tags(
                     tag_to_assign, new_entry, self.request, workflow
                 )
                 messages.success(
                     request,
                     f'Created "{new_entry_label}" and assigned '
-                    f"{number_of_tags+1} tags to it.",
+                    f"{number_of_tags} tags to it.",
                 )
             else:
                 messages.error(request, "Please provide a label for the new entry.")
@@ -419,28 +379,29 @@ class TWFTagsGroupView(ProjectPermissionMixin, TWFTagsView):
         try:
             entry = DictionaryEntry.objects.get(pk=entry_id)
             tag = PageTag.objects.get(pk=tag_id)
-            variation = Variation(entry=entry, variation=tag.variation)
-            variation.save(current_user=request.user)
-            tag.dictionary_entry = entry
-            tag.save(current_user=request.user)
 
             number_of_tags = self.save_other_tags(tag, entry, request, workflow)
 
             messages.success(
                 self.request,
                 f"Variation added to entry {entry.label} "
-                f"(and {number_of_tags} other tags).",
+                f"(and {max(number_of_tags - 1, 0)} other tags).",
             )
         except DictionaryEntry.DoesNotExist:
             messages.error(self.request, "Entry does not exist: " + entry_id)
 
     @staticmethod
     def save_other_tags(tag, entry, request, workflow):
-        """Save all other tags of the same variation to the same dictionary entry."""
+        """Assign the tag and all identical tags to the dictionary entry.
+
+        Identical tags reserved in another workflow than the given one are assigned as
+        well, with a warning. Returns the number of assigned tags, including the tag
+        itself."""
         # Check if any identical tags are reserved by others and warn
         reserved_by_others = (
-            PageTag.objects.filter(variation=tag.variation, is_reserved=True)
-            .exclude(id__in=workflow.assigned_tag_items.values_list("id", flat=True))
+            get_identical_tags(tag)
+            .filter(is_reserved=True)
+            .exclude(workflows=workflow)
             .count()
         )
 
@@ -450,14 +411,8 @@ class TWFTagsGroupView(ProjectPermissionMixin, TWFTagsView):
                 f"Warning: {reserved_by_others} identical tags are currently reserved in another workflow.",
             )
 
-        # Assign all other unassigned tags with same variation
-        other_tags = PageTag.objects.filter(
-            variation=tag.variation, page__is_ignored=False, dictionary_entry=None
-        )
-        for other_tag in other_tags:
-            other_tag.dictionary_entry = entry
-            other_tag.save(current_user=request.user)
-        return other_tags.count()
+        # Assign all unassigned tags with same variation
+        return assign_identical_tags(tag, entry, request.user)
 
     def get_next_unassigned_tag(self, workflow, tag_type):
         """Get the next unassigned tag from workflow."""
@@ -505,7 +460,7 @@ class TWFTagsGroupView(ProjectPermissionMixin, TWFTagsView):
         context["tag"] = unassigned_tag
 
         if unassigned_tag:
-            context["closest"] = get_closest_variations(unassigned_tag)
+            context["closest"] = get_tag_suggestions(unassigned_tag)
             # Count identical unparked tags with same variation within workflow
             identical_count = workflow.assigned_tag_items.filter(
                 variation=unassigned_tag.variation, is_parked=False
@@ -532,6 +487,17 @@ class TWFTagsAssignTagView(ProjectPermissionMixin, TWFTagsView):
     template_name = "twf/tags/assign.html"
     page_title = "Assign Tag"
 
+    def get_context_data(self, **kwargs):
+        """Get the context data."""
+        context = super().get_context_data(**kwargs)
+        tag = PageTag.objects.select_related("page__document").filter(
+            pk=kwargs.get("pk"), project=self.get_project()
+        ).first()
+        context["tag"] = tag
+        if tag:
+            context["closest"] = get_tag_suggestions(tag)
+        return context
+
 
 class TWFProjectTagsView(ProjectPermissionMixin, SingleTableMixin, FilterView, TWFTagsView):
     """Base class for all tag views."""
@@ -604,7 +570,7 @@ class TWFProjectTagsView(ProjectPermissionMixin, SingleTableMixin, FilterView, T
         project = self.get_project()
         excluded_types = get_excluded_types(project)
 
-        return PageTag.objects.filter(page__document__project=project).exclude(
+        return PageTag.objects.filter(project=project).exclude(
             variation_type__in=excluded_types
         )
 
@@ -645,32 +611,18 @@ class TWFProjectTagsView(ProjectPermissionMixin, SingleTableMixin, FilterView, T
 
         # Tag statistics
         project = self.get_project()
-        all_tags = PageTag.objects.filter(page__document__project=project)
         excluded_types = get_excluded_types(project)
 
-        # Tag statistics for the header
-        # Note: Using Q objects for database-level filtering (more efficient than
-        # loading all objects and calling is_resolved() method)
-        stats = {
-            "total": all_tags.exclude(variation_type__in=excluded_types).count(),
-            "resolved": all_tags.exclude(variation_type__in=excluded_types)
-            .filter(
-                Q(dictionary_entry__isnull=False)
-                | Q(date_variation_entry__isnull=False)
-            )
-            .count(),
-            "open": all_tags.exclude(variation_type__in=excluded_types)
-            .filter(
-                dictionary_entry__isnull=True,
-                date_variation_entry__isnull=True,
-                is_parked=False,
-            )
-            .count(),
-            "parked": all_tags.exclude(variation_type__in=excluded_types)
-            .filter(is_parked=True)
-            .count(),
-            "ignored": all_tags.filter(variation_type__in=excluded_types).count(),
-        }
+        # Tag statistics for the header, from the per-type counters (one query)
+        stats = {"total": 0, "resolved": 0, "open": 0, "parked": 0, "ignored": 0}
+        for counts in get_tag_type_counts(project):
+            if counts["variation_type"] in excluded_types:
+                stats["ignored"] += counts["count"]
+                continue
+            stats["total"] += counts["count"]
+            stats["resolved"] += counts["resolved"]
+            stats["open"] += counts["open"]
+            stats["parked"] += counts["parked"]
         context["tag_stats"] = stats
 
         return context
@@ -688,7 +640,7 @@ class TWFProjectTagsOpenView(TWFProjectTagsView):
         project = self.get_project()
         excluded = get_excluded_types(project)
         queryset = self.model.objects.filter(
-            page__document__project=project,
+            project=project,
             dictionary_entry=None,
             date_variation_entry=None,
             is_parked=False,
@@ -711,7 +663,7 @@ class TWFProjectTagsParkedView(TWFProjectTagsView):
         project = self.get_project()
         excluded = get_excluded_types(project)
         queryset = self.model.objects.filter(
-            page__document__project=project, dictionary_entry=None, is_parked=True
+            project=project, dictionary_entry=None, is_parked=True
         ).exclude(variation_type__in=excluded)
         self.filterset = self.filterset_class(
             self.request.GET, queryset=queryset, project=project, excluded=excluded
@@ -731,12 +683,12 @@ class TWFProjectTagsResolvedView(TWFProjectTagsView):
         project = self.get_project()
         excluded = get_excluded_types(project)
         queryset1 = self.model.objects.filter(
-            page__document__project=project,
+            project=project,
             dictionary_entry__isnull=False,
             is_parked=False,
         ).exclude(variation_type__in=excluded)
         queryset2 = self.model.objects.filter(
-            page__document__project=project,
+            project=project,
             date_variation_entry__isnull=False,
             variation_type__in=get_date_types(project),
             is_parked=False,
@@ -762,7 +714,7 @@ class TWFProjectTagsWithCommentsView(TWFProjectTagsView):
         project = self.get_project()
         excluded = get_excluded_types(project)
         queryset = self.model.objects.filter(
-            page__document__project=project,
+            project=project,
             dictionary_entry__isnull=False,
         ).exclude(
             dictionary_entry__notes=""
@@ -788,7 +740,7 @@ class TWFProjectTagsIgnoredView(TWFProjectTagsView):
         project = self.get_project()
         excluded = get_excluded_types(project)
         queryset = self.model.objects.filter(
-            page__document__project=project, variation_type__in=excluded
+            project=project, variation_type__in=excluded
         )
         self.filterset = self.filterset_class(
             self.request.GET, queryset=queryset, project=project, excluded=excluded
@@ -974,8 +926,19 @@ class TWFTagsEnrichmentView(ProjectPermissionMixin, FormView, TWFTagsView):
             return redirect("twf:tags_enrichment")
 
         # Save enrichment using form's save method
-        form.save(user=self.request.user)
-        messages.success(self.request, "Tag enriched successfully.")
+        tag = form.save(user=self.request.user)
+
+        # Enrich the identical tags of the workflow as well
+        number_of_tags = enrich_identical_tags(
+            tag, form.get_enrichment_type(), self.request.user, workflow=workflow
+        )
+        if number_of_tags:
+            messages.success(
+                self.request,
+                f"Tag enriched successfully (and {number_of_tags} identical tags).",
+            )
+        else:
+            messages.success(self.request, "Tag enriched successfully.")
 
         # Check workflow completion
         if not workflow.get_next_item():
@@ -1079,16 +1042,17 @@ class TWFManageTagsView(ProjectPermissionMixin, TWFTagsView):
         total_grouped = 0
         total_enriched = 0
 
-        tag_types = (
-            PageTag.objects.filter(page__document__project=project)
-            .exclude(variation_type__in=excluded_types)
-            .values("variation_type")
-            .distinct()
-            .order_by("variation_type")
+        tag_type_counts = sorted(
+            (
+                counts
+                for counts in get_tag_type_counts(project)
+                if counts["variation_type"] not in excluded_types
+            ),
+            key=lambda counts: counts["variation_type"],
         )
 
-        for tag_type_dict in tag_types:
-            tag_type = tag_type_dict["variation_type"]
+        for counts in tag_type_counts:
+            tag_type = counts["variation_type"]
 
             # Determine workflow type
             if tag_type in enrichment_types:
@@ -1099,31 +1063,11 @@ class TWFManageTagsView(ProjectPermissionMixin, TWFTagsView):
             stats = {
                 "type": tag_type,
                 "workflow_type": workflow_type,
-                "total": PageTag.objects.filter(
-                    page__document__project=project, variation_type=tag_type
-                ).count(),
-                "parked": PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=tag_type,
-                    is_parked=True,
-                ).count(),
-                "with_dict": PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=tag_type,
-                    dictionary_entry__isnull=False,
-                ).count(),
-                "with_enrichment": PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=tag_type,
-                ).filter(
-                    Q(tag_enrichment_entry__isnull=False)
-                    | (Q(enrichment__isnull=False) & ~Q(enrichment={}))
-                ).count(),
-                "unassigned": PageTag.objects.filter(
-                    page__document__project=project,
-                    variation_type=tag_type,
-                    dictionary_entry__isnull=True,
-                ).count(),
+                "total": counts["count"],
+                "parked": counts["parked"],
+                "with_dict": counts["grouped"],
+                "with_enrichment": counts["enriched"],
+                "unassigned": counts["unassigned"],
             }
             tag_stats.append(stats)
 
@@ -1228,7 +1172,7 @@ class TWFTagDetailView(ProjectPermissionMixin, TWFTagsView):
 
         # Get related tags with same variation
         context["identical_tags"] = PageTag.objects.filter(
-            page__document__project=project,
+            project=project,
             variation=tag.variation,
             variation_type=tag.variation_type,
         ).select_related("page__document").order_by("page__document__title", "page__tk_page_number")
@@ -1294,7 +1238,7 @@ class TWFTagDetailView(ProjectPermissionMixin, TWFTagsView):
 
                 # Add identical tags context
                 context["identical_tags"] = PageTag.objects.filter(
-                    page__document__project=project,
+                    project=project,
                     variation=tag.variation,
                     variation_type=tag.variation_type,
                 ).select_related("page__document").order_by("page__document__title", "page__tk_page_number")
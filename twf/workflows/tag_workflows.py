@@ -5,7 +5,8 @@ Tag Workflow Management
 This module provides functions for creating and managing tag-related workflows.
 """
 
-from django.db.models import Count
+from django.db import transaction
+from django.db.models import Min, Q, Subquery
 from django.shortcuts import redirect
 from twf.models import Workflow, PageTag
 from twf.tasks.instant_tasks import start_related_task
@@ -32,7 +33,7 @@ def get_available_tag_count(project, tag_type):
     """
     return (
         PageTag.objects.filter(
-            page__document__project=project,
+            project=project,
             page__is_ignored=False,
             variation_type=tag_type,
             dictionary_entry__isnull=True,
@@ -61,7 +62,7 @@ def get_available_date_count(project):
     """
     date_types = get_date_types(project)
     return PageTag.objects.filter(
-        page__document__project=project,
+        project=project,
         page__is_ignored=False,
         variation_type__in=date_types,
         date_variation_entry__isnull=True,
@@ -70,13 +71,92 @@ def get_available_date_count(project):
     ).count()
 
 
+def reserve_tags(tags, item_count):
+    """
+    Reserve up to item_count tags of a queryset of available tags.
+
+    The tags are selected with FOR UPDATE SKIP LOCKED: tags which a parallel
+    reservation is about to reserve are skipped instead of reserved twice. Must be
+    called inside a transaction.
+
+    Parameters
+    ----------
+    tags : QuerySet
+        The available (unreserved) tags
+    item_count : int
+        Maximum number of tags to reserve
+
+    Returns
+    -------
+    list
+        IDs of the reserved tags
+    """
+    tag_ids = list(
+        tags.select_for_update(skip_locked=True, of=("self",))
+        .order_by("id")
+        .values_list("id", flat=True)[:item_count]
+    )
+    PageTag.objects.filter(id__in=tag_ids).update(is_reserved=True)
+    return tag_ids
+
+
+def reserve_tag_variations(tags, item_count):
+    """
+    Reserve all tags of up to item_count unique variations of a queryset of available tags.
+
+    The first tag of each variation stands for the whole variation: the first tags are
+    selected with FOR UPDATE SKIP LOCKED, so a parallel reservation holding the lock of
+    a variation makes this one take the next variations. Must be called inside a
+    transaction.
+
+    Parameters
+    ----------
+    tags : QuerySet
+        The available (unreserved) tags
+    item_count : int
+        Maximum number of unique variations to reserve
+
+    Returns
+    -------
+    tuple
+        (reserved variations, IDs of the reserved tags)
+    """
+    first_tag_ids = (
+        tags.order_by().values("variation").annotate(first_id=Min("id")).values("first_id")
+    )
+    variations = list(
+        PageTag.objects.filter(id__in=Subquery(first_tag_ids))
+        .select_for_update(skip_locked=True)
+        .order_by("variation")
+        .values_list("variation", flat=True)[:item_count]
+    )
+    if not variations:
+        return [], []
+
+    tag_ids = list(tags.filter(variation__in=variations).values_list("id", flat=True))
+    PageTag.objects.filter(id__in=tag_ids).update(is_reserved=True)
+    return variations, tag_ids
+
+
+def assign_tags_to_workflow(workflow, tag_ids):
+    """Add reserved tags to a new workflow with a single bulk insert."""
+    through = Workflow.assigned_tag_items.through
+    through.objects.bulk_create(
+        [through(workflow_id=workflow.id, pagetag_id=tag_id) for tag_id in tag_ids],
+        batch_size=1000,
+    )
+
+
+@transaction.atomic
 def create_tag_grouping_workflow(project, user, tag_type, item_count=None):
     """
     Create a new workflow for tag grouping and reserve unique tag variations.
 
     This function reserves unique tag strings (all identical tags as one unit).
     When a unique variation is reserved, ALL matching tags with the same text
-    are marked as reserved and added to the workflow.
+    are marked as reserved and added to the workflow. The reservation and the
+    workflow are created in one transaction, so no tags stay reserved without
+    a workflow.
 
     Parameters
     ----------
@@ -99,43 +179,23 @@ def create_tag_grouping_workflow(project, user, tag_type, item_count=None):
         workflow_def = project.get_workflow_definition("review_tags_grouping")
         item_count = workflow_def.get("batch_size", 10)
 
-    # Get distinct unassigned variations for this tag type
+    # Reserve ALL unassigned tags of the next unique variations of this tag type
     # Exclude parked and reserved tags
-    unique_variations = list(
-        PageTag.objects.filter(
-            page__document__project=project,
-            page__is_ignored=False,
-            variation_type=tag_type,
-            dictionary_entry__isnull=True,
-            is_parked=False,
-            is_reserved=False,
-        )
-        .values("variation")
-        .distinct()[:item_count]
+    available_tags = PageTag.objects.filter(
+        project=project,
+        page__is_ignored=False,
+        variation_type=tag_type,
+        dictionary_entry__isnull=True,
+        is_parked=False,
+        is_reserved=False,
     )
+    unique_variations, all_tag_ids = reserve_tag_variations(available_tags, item_count)
 
     if len(unique_variations) == 0:
         return False
 
     actual_item_count = len(unique_variations)
 
-    # For each unique variation, get ALL matching tags
-    all_tag_ids = []
-    for var_dict in unique_variations:
-        variation = var_dict["variation"]
-        matching_tags = PageTag.objects.filter(
-            page__document__project=project,
-            page__is_ignored=False,
-            variation=variation,
-            variation_type=tag_type,
-            is_parked=False,
-            is_reserved=False,
-        ).values_list("id", flat=True)
-        all_tag_ids.extend(matching_tags)
-
-    # Mark all matching tags as reserved
-    PageTag.objects.filter(id__in=all_tag_ids).update(is_reserved=True)
-
     # Create task for activity logging
     task = start_related_task(
         project,
@@ -168,16 +228,18 @@ def create_tag_grouping_workflow(project, user, tag_type, item_count=None):
         task.save(update_fields=["workflow_steps"])
 
     # Assign all reserved tags to the workflow
-    workflow.assigned_tag_items.set(PageTag.objects.filter(id__in=all_tag_ids))
+    assign_tags_to_workflow(workflow, all_tag_ids)
 
     return workflow
 
 
+@transaction.atomic
 def create_date_normalization_workflow(project, user, item_count=None):
     """
     Create a new workflow for date normalization and reserve date tags.
 
     This function reserves individual date tags for normalization to EDTF format.
+    The reservation and the workflow are created in one transaction.
 
     Parameters
     ----------
@@ -201,26 +263,22 @@ def create_date_normalization_workflow(project, user, item_count=None):
     # Get date types for this project
     date_types = get_date_types(project)
 
-    # Get unresolved date tags
-    available_tag_ids = list(
-        PageTag.objects.filter(
-            page__document__project=project,
-            page__is_ignored=False,
-            variation_type__in=date_types,
-            date_variation_entry__isnull=True,
-            is_parked=False,
-            is_reserved=False,
-        ).values_list("id", flat=True)[:item_count]
+    # Reserve unresolved date tags
+    available_tags = PageTag.objects.filter(
+        project=project,
+        page__is_ignored=False,
+        variation_type__in=date_types,
+        date_variation_entry__isnull=True,
+        is_parked=False,
+        is_reserved=False,
     )
+    available_tag_ids = reserve_tags(available_tags, item_count)
 
     if len(available_tag_ids) == 0:
         return False
 
     actual_item_count = len(available_tag_ids)
 
-    # Mark tags as reserved
-    PageTag.objects.filter(id__in=available_tag_ids).update(is_reserved=True)
-
     # Create task for activity logging
     task = start_related_task(
         project,
@@ -251,17 +309,19 @@ def create_date_normalization_workflow(project, user, item_count=None):
         task.save(update_fields=["workflow_steps"])
 
     # Assign date tags to the workflow
-    workflow.assigned_tag_items.set(PageTag.objects.filter(id__in=available_tag_ids))
+    assign_tags_to_workflow(workflow, available_tag_ids)
 
     return workflow
 
 
+@transaction.atomic
 def create_enrichment_workflow(project, user, tag_type, item_count=None):
     """
     Create workflow for direct tag enrichment (dates, verses, etc.).
 
     Generic workflow creator that handles any enrichment type configuration.
     Replaces specific implementations like create_date_normalization_workflow.
+    The reservation and the workflow are created in one transaction.
 
     Parameters
     ----------
@@ -290,28 +350,21 @@ def create_enrichment_workflow(project, user, tag_type, item_count=None):
         workflow_def = project.get_workflow_definition("review_tags_enrichment")
         item_count = workflow_def.get("batch_size", 20)
 
-    # Find unresolved tags of this type
+    # Reserve unresolved tags of this type
     # A tag is unenriched if it has no old tag_enrichment_entry AND no new enrichment data
-    from django.db.models import Q
-    available_tags = list(
-        PageTag.objects.filter(
-            page__document__project=project,
-            page__is_ignored=False,
-            variation_type=tag_type,
-            tag_enrichment_entry__isnull=True,
-            is_parked=False,
-            is_reserved=False,
-        )
-        .filter(Q(enrichment__isnull=True) | Q(enrichment={}))
-        .values_list("id", flat=True)[:item_count]
-    )
+    unenriched_tags = PageTag.objects.filter(
+        project=project,
+        page__is_ignored=False,
+        variation_type=tag_type,
+        tag_enrichment_entry__isnull=True,
+        is_parked=False,
+        is_reserved=False,
+    ).filter(Q(enrichment__isnull=True) | Q(enrichment={}))
+    available_tags = reserve_tags(unenriched_tags, item_count)
 
     if not available_tags:
         return False
 
-    # Mark as reserved
-    PageTag.objects.filter(id__in=available_tags).update(is_reserved=True)
-
     # Create task
     workflow_title = enrichment_config.get(
         "workflow_title", f"Enrich {tag_type.title()} Tags"
@@ -357,7 +410,7 @@ def create_enrichment_workflow(project, user, tag_type, item_count=None):
         task.save(update_fields=["workflow_steps"])
 
     # Assign tags
-    workflow.assigned_tag_items.set(PageTag.objects.filter(id__in=available_tags))
+    assign_tags_to_workflow(workflow, available_tags)
 
     return workflow
 